@@ -0,0 +1,183 @@
+"""Measure analysis latency under mixed small/large concurrent load.
+
+GraphDB is replaced by a synthetic responder so the numbers isolate the API's
+own post-processing. Run from ``api/``:
+
+    python -m benchmarks.analysis_mixed_load --large-events 20000
+"""
+
+import argparse
+import asyncio
+import re
+import statistics
+import time
+from typing import Any
+from unittest.mock import patch
+
+from src.config import settings
+from src.services.analysis import events as analysis_events
+from src.services.analysis import get_analysis_events, get_summary, make_analysis_filters
+
+_LIMIT_RE = re.compile(r"\bLIMIT (\d+)")
+_VALUES_RE = re.compile(r"VALUES \?event \{ ([^}]*) \}")
+
+
+def _binding(**values: str) -> dict[str, dict[str, str]]:
+    return {key: {"value": value} for key, value in values.items()}
+
+
+def _result(bindings: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"results": {"bindings": bindings}}
+
+
+def _event_iri(index: int) -> str:
+    return f"https://sakuna.ph/ndrrmc/event/bench/{index}"
+
+
+class _FakeGraphDB:
+    def __init__(self, *, large_events: int, latency: float) -> None:
+        self.large_events = large_events
+        self.latency = latency
+
+    async def __call__(self, query: str) -> dict[str, Any]:
+        # Build responses off the loop, as a real GraphDB would out of process.
+        await asyncio.sleep(self.latency)
+        return await asyncio.to_thread(self._respond, query)
+
+    def _respond(self, query: str) -> dict[str, Any]:
+        if "COUNT(DISTINCT ?event)" in query:
+            return _result([_binding(count=str(self.large_events))])
+        if "?kind ?resource" in query:
+            return _result(self._metadata(_VALUES_RE.search(query).group(1)))
+        if "?metric ?value ?unit" in query:
+            return _result(self._impacts(_VALUES_RE.search(query).group(1)))
+        limit = _LIMIT_RE.search(query)
+        count = int(limit.group(1)) if limit else self.large_events
+        return _result(
+            [
+                _binding(
+                    event=_event_iri(index),
+                    eventName=f"Benchmark event {index}",
+                    eventClass="https://sakuna.ph/Incident",
+                    startDate=f"{2000 + index % 25}-{1 + index % 12:02d}-01",
+                )
+                for index in range(count)
+            ]
+        )
+
+    @staticmethod
+    def _iris(values: str) -> list[str]:
+        return [value.strip("<>") for value in values.split()]
+
+    def _metadata(self, values: str) -> list[dict[str, Any]]:
+        bindings = []
+        for iri in self._iris(values):
+            bindings.extend(
+                (
+                    _binding(
+                        event=iri,
+                        kind="location",
+                        resource="https://sakuna.ph/1300000000",
+                        id="1300000000",
+                        label="NCR",
+                    ),
+                    _binding(
+                        event=iri,
+                        kind="disasterType",
+                        resource="https://sakuna.ph/Flood",
+                        label="Flood",
+                    ),
+                    _binding(
+                        event=iri,
+                        kind="source",
+                        resource="https://sakuna.ph/org/NDRRMC",
+                        label="NDRRMC",
+                    ),
+                )
+            )
+        return bindings
+
+    def _impacts(self, values: str) -> list[dict[str, Any]]:
+        bindings = []
+        for iri in self._iris(values):
+            bindings.extend(
+                (
+                    _binding(event=iri, metric="dead", value="2"),
+                    _binding(event=iri, metric="affectedPersons", value="120"),
+                    _binding(
+                        event=iri,
+                        metric="damage",
+                        value="1.5",
+                        unit="https://sakuna.ph/PHP_millions",
+                    ),
+                )
+            )
+        return bindings
+
+
+async def _timed(coro: Any) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def _run_mixed_load(*, small_requests: int, large_requests: int, run: str) -> tuple[list[float], list[float]]:
+    large = [
+        _timed(get_summary(make_analysis_filters(q=f"{run}-large-{index}")))
+        for index in range(large_requests)
+    ]
+    small = [
+        _timed(
+            get_analysis_events(
+                filters=make_analysis_filters(q=f"{run}-small-{index}"),
+                page=1,
+                page_size=25,
+                sort_by="startDate",
+                sort_dir="desc",
+            )
+        )
+        for index in range(small_requests)
+    ]
+    durations = await asyncio.gather(*large, *small)
+    return list(durations[large_requests:]), list(durations[:large_requests])
+
+
+def _describe(label: str, durations: list[float]) -> str:
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"  {label:<6} n={len(ordered):<4} "
+        f"p50={statistics.median(ordered) * 1000:8.1f} ms  "
+        f"p95={p95 * 1000:8.1f} ms  "
+        f"max={ordered[-1] * 1000:8.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--large-events", type=int, default=20000)
+    parser.add_argument("--large-requests", type=int, default=2)
+    parser.add_argument("--small-requests", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated GraphDB round trip in seconds.")
+    args = parser.parse_args()
+
+    fake = _FakeGraphDB(large_events=args.large_events, latency=args.latency)
+    modes = {
+        "inline": 10**12,
+        f"offload (threshold={settings.analysis_offload_threshold}, workers={settings.analysis_workers})": settings.analysis_offload_threshold,
+    }
+    with patch.object(analysis_events, "execute_sparql", new=fake):
+        for run, (mode, threshold) in enumerate(modes.items()):
+            with patch.object(settings, "analysis_offload_threshold", threshold):
+                small, large = await _run_mixed_load(
+                    small_requests=args.small_requests,
+                    large_requests=args.large_requests,
+                    run=str(run),
+                )
+            print(mode)
+            print(_describe("small", small))
+            print(_describe("large", large))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
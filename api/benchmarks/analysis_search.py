@@ -0,0 +1,100 @@
+"""Compare ``q`` filter latency with and without the event search index.
+
+By default a synthetic corpus measures index build and lookup cost. With
+``--graphdb`` the filtered count query is also timed against the configured
+GraphDB endpoint, first with the CONTAINS scan and then with the index.
+
+    python -m benchmarks.analysis_search --events 50000
+    python -m benchmarks.analysis_search --graphdb
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from unittest.mock import patch
+
+from src.services.analysis import events as analysis_events
+from src.services.analysis import make_analysis_filters
+from src.services.analysis import search
+from src.services.analysis.search import EventSearchIndex
+
+_QUERIES = ["enteng", "typhoon", "flood marikina", "landslid", "monsoom", "quezon city"]
+_WORDS = [
+    "typhoon", "tropical", "storm", "flood", "flooding", "landslide", "monsoon",
+    "earthquake", "fire", "enteng", "odette", "yolanda", "marikina", "quezon",
+    "city", "cebu", "davao", "leyte", "samar", "province", "barangay", "incident",
+]
+
+
+def _synthetic_documents(count: int) -> dict[str, list[str]]:
+    rng = random.Random(7)
+    return {
+        f"https://sakuna.ph/ndrrmc/event/bench/{index}": [
+            " ".join(rng.choices(_WORDS, k=4)),
+            " ".join(rng.choices(_WORDS, k=12)),
+        ]
+        for index in range(count)
+    }
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:9.3f} ms"
+
+
+def _bench_in_process(count: int, repeats: int) -> None:
+    documents = _synthetic_documents(count)
+    start = time.perf_counter()
+    index = EventSearchIndex(documents)
+    print(f"index build ({count} events): {_ms(time.perf_counter() - start)}")
+
+    for query in _QUERIES:
+        durations = []
+        for _ in range(repeats):
+            index.search.cache_clear()
+            start = time.perf_counter()
+            matches = index.search(query)
+            durations.append(time.perf_counter() - start)
+        print(f"  {query!r:<16} matches={len(matches):<6} median={_ms(statistics.median(durations))}")
+
+
+async def _timed_count(query: str) -> tuple[float, int]:
+    filters = make_analysis_filters(q=query)
+    start = time.perf_counter()
+    result = await analysis_events._execute_or_raise(analysis_events._count_query(filters))
+    return time.perf_counter() - start, analysis_events._count_value(result)
+
+
+async def _bench_graphdb(repeats: int) -> None:
+    index = await search.refresh_event_search_index()
+    if index is None:
+        print("GraphDB is unreachable; skipping the end-to-end comparison.")
+        return
+    print(f"indexed {len(index)} events from GraphDB")
+    for query in _QUERIES:
+        rows = []
+        for mode, loaded in (("scan", None), ("index", index)):
+            with patch.object(search, "_index", loaded):
+                timings = [await _timed_count(query) for _ in range(repeats)]
+            rows.append(
+                f"{mode}={_ms(statistics.median(duration for duration, _ in timings))} "
+                f"(count={timings[0][1]})"
+            )
+        print(f"  {query!r:<16} " + "  ".join(rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--graphdb", action="store_true")
+    args = parser.parse_args()
+
+    _bench_in_process(args.events, args.repeats)
+    if args.graphdb:
+        asyncio.run(_bench_graphdb(args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure /analysis/suggest lookup latency on a PSGC-sized synthetic index.
+
+    python -m benchmarks.analysis_suggest --places 2000
+"""
+
+import argparse
+import random
+import statistics
+import string
+import time
+
+from src.services.analysis.suggest import SuggestionIndex, _Entry
+
+_LEVELS = ["Region", "Province", "City", "Municipality"]
+_QUERIES = ["s", "sa", "san", "san j", "city of", "quezon", "xyz"]
+
+
+def _synthetic_index(count: int) -> SuggestionIndex:
+    rng = random.Random(7)
+    stems = ["San", "Santa", "City of", "Quezon", "Del", "Norte", "Sur", "Real"]
+    entries = []
+    for index in range(count):
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))).title()
+        label = f"{rng.choice(stems)} {word}"
+        entries.append(
+            (
+                _Entry(
+                    id=f"{index:010d}",
+                    label=label,
+                    kind="location",
+                    level=rng.choice(_LEVELS),
+                ),
+                [label, word],
+            )
+        )
+    return SuggestionIndex(entries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--places", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = _synthetic_index(args.places)
+    print(f"index build ({args.places} places): {(time.perf_counter() - start) * 1000:.1f} ms")
+    for query in _QUERIES:
+        durations = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            index.suggest(query, limit=args.limit)
+            durations.append(time.perf_counter() - start)
+        ordered = sorted(durations)
+        print(
+            f"  {query!r:<10} median={statistics.median(ordered) * 1e6:7.1f} us  "
+            f"p99={ordered[int(len(ordered) * 0.99)] * 1e6:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
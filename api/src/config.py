@@ -17,5 +17,12 @@ class Settings(BaseSettings):
 
     graphdb_endpoint: str = "http://localhost:7200/repositories/SakunaGraph"
 
+    analysis_workers: int = 4
+    analysis_offload_threshold: int = 2000
+    analysis_search_refresh_seconds: float = 900.0
+    analysis_search_check_seconds: float = 60.0
+    analysis_search_retry_seconds: float = 15.0
+    analysis_search_values_chunk: int = 1000
+
 
 settings = Settings()
@@ -1,15 +1,23 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from src.config import settings
+from src.services.analysis.offload import shutdown_post_processing
+from src.services.analysis.search import keep_event_search_index_fresh
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    search_index_task = asyncio.create_task(keep_event_search_index_fresh())
     yield
+    search_index_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await search_index_task
+    shutdown_post_processing()
 
 
 app = FastAPI(
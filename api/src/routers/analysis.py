@@ -1,6 +1,9 @@
+import json
+from collections.abc import AsyncIterator
 from datetime import date
 
 from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from src.schemas.analysis import (
     AnalysisCalendarResponse,
@@ -15,6 +18,8 @@ from src.schemas.analysis import (
     AnalysisFilterOptionsResponse,
     AnalysisRegionRankingsResponse,
     AnalysisSortDirection,
+    AnalysisSuggestionKind,
+    AnalysisSuggestResponse,
     AnalysisSummaryResponse,
     AnalysisTimelineBucket,
     AnalysisTimelineCategoryStacksResponse,
@@ -35,9 +40,11 @@ from src.services.analysis import (
     get_analysis_events_export,
     get_filter_options as get_filter_options_service,
     get_region_rankings,
+    get_suggestions,
     get_summary,
     get_victim_trends,
     make_analysis_filters,
+    stream_analysis_events,
 )
 from src.services.common import ServiceError
 
@@ -48,6 +55,14 @@ def _to_http_error(exc: ServiceError) -> HTTPException:
     return HTTPException(status_code=exc.status_code, detail=exc.detail)
 
 
+async def _stream_with_errors(events: AsyncIterator[str]) -> AsyncIterator[str]:
+    try:
+        async for event in events:
+            yield event
+    except ServiceError as exc:
+        yield f"data: {json.dumps({'type': 'error', 'status': exc.status_code, 'detail': exc.detail})}\n\n"
+
+
 def _make_filters(
     *,
     event_type: AnalysisEventType,
@@ -84,6 +99,18 @@ async def get_filter_options() -> AnalysisFilterOptionsResponse:
         raise _to_http_error(exc) from exc
 
 
+@router.get("/suggest", response_model=AnalysisSuggestResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    kind: AnalysisSuggestionKind | None = Query(None),
+    limit: int = Query(10, ge=1, le=50),
+) -> AnalysisSuggestResponse:
+    try:
+        return await get_suggestions(q, kind=kind, limit=limit)
+    except ServiceError as exc:
+        raise _to_http_error(exc) from exc
+
+
 @router.get("/events/export.csv", response_class=Response)
 async def export_events(
     event_type: AnalysisEventType = Query("all"),
@@ -157,6 +184,44 @@ async def events(
         raise _to_http_error(exc) from exc
 
 
+@router.get("/events/stream", response_class=StreamingResponse)
+async def events_stream(
+    event_type: AnalysisEventType = Query("all"),
+    start_date: date | None = Query(None),
+    end_date: date | None = Query(None),
+    location_ids: list[str] = Query(default_factory=list),
+    disaster_types: list[str] = Query(default_factory=list),
+    q: str | None = Query(None, max_length=200),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(25, ge=1, le=5000),
+    sort_by: AnalysisEventSortBy = Query("startDate"),
+    sort_dir: AnalysisSortDirection = Query("desc"),
+) -> StreamingResponse:
+    try:
+        filters = make_analysis_filters(
+            event_type=event_type,
+            start_date=start_date,
+            end_date=end_date,
+            location_ids=location_ids,
+            disaster_types=disaster_types,
+            q=q,
+        )
+    except ServiceError as exc:
+        raise _to_http_error(exc) from exc
+    return StreamingResponse(
+        _stream_with_errors(
+            stream_analysis_events(
+                filters=filters,
+                page=page,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+            )
+        ),
+        media_type="text/event-stream",
+    )
+
+
 @router.get("/summary", response_model=AnalysisSummaryResponse)
 async def summary(
     event_type: AnalysisEventType = Query("all"),
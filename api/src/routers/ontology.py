@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from src.schemas.ontology import (
     OntologyGraphResponse,
+    PsgcBarangaysPageResponse,
     PsgcCitiesMunicipalitiesResponse,
     PsgcGraphResponse,
     PsgcProvincesResponse,
@@ -12,11 +14,12 @@ from src.services.common import ServiceError
 from src.services.ontology import (
     get_disaster_taxonomy as get_disaster_taxonomy_service,
     get_ontology_graph as get_ontology_graph_service,
-    # get_psgc_barangays as get_psgc_barangays_service,
+    get_psgc_barangays as get_psgc_barangays_service,
     get_psgc_cities_municipalities as get_psgc_cities_municipalities_service,
     get_psgc_nodes as get_psgc_nodes_service,
     get_psgc_provinces as get_psgc_provinces_service,
     get_psgc_regions as get_psgc_regions_service,
+    stream_psgc_barangays,
 )
 
 router = APIRouter(prefix="/ontology", tags=["ontology"])
@@ -94,9 +97,32 @@ async def get_psgc_cities_municipalities() -> PsgcCitiesMunicipalitiesResponse:
         raise _to_http_error(exc) from exc
 
 
-# @router.get("/psgc/barangays")
-# async def get_psgc_barangays() -> PsgcBarangaysResponse:
-#     try:
-#         return await get_psgc_barangays_service()
-#     except ServiceError as exc:
-#         raise _to_http_error(exc) from exc
+@router.get(
+    "/psgc/barangays",
+    response_model=PsgcBarangaysPageResponse,
+    response_model_exclude_none=True,
+)
+async def get_psgc_barangays(
+    parent_code: str | None = Query(None, min_length=10, max_length=10),
+    cursor: str | None = Query(None, min_length=10, max_length=10),
+    limit: int = Query(500, ge=1, le=2000),
+) -> PsgcBarangaysPageResponse:
+    try:
+        return await get_psgc_barangays_service(
+            parent_code=parent_code,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ServiceError as exc:
+        raise _to_http_error(exc) from exc
+
+
+@router.get("/psgc/barangays.ndjson", response_class=StreamingResponse)
+async def stream_psgc_barangays_ndjson(
+    parent_code: str | None = Query(None, min_length=10, max_length=10),
+) -> StreamingResponse:
+    try:
+        lines = await stream_psgc_barangays(parent_code)
+    except ServiceError as exc:
+        raise _to_http_error(exc) from exc
+    return StreamingResponse(lines, media_type="application/x-ndjson")
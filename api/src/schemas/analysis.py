@@ -22,6 +22,21 @@ AnalysisEventSortBy = Literal[
 AnalysisSortDirection = Literal["asc", "desc"]
 AnalysisDisasterCountGroupBy = Literal["type", "taxonomy"]
 AnalysisTimelineBucket = Literal["month_year", "month_of_year"]
+AnalysisSuggestionKind = Literal["location", "disasterType"]
+
+
+class AnalysisSuggestion(BaseModel):
+    id: str
+    label: str
+    kind: AnalysisSuggestionKind
+    level: str | None = None
+    parentLabel: str | None = None
+    matchedLabel: str | None = None
+
+
+class AnalysisSuggestResponse(BaseModel):
+    q: str
+    items: list[AnalysisSuggestion] = Field(default_factory=list)
 
 
 class AnalysisEventFacet(BaseModel):
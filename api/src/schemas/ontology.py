@@ -115,3 +115,8 @@ class PsgcCitiesMunicipalitiesResponse(BaseModel):
 
 class PsgcBarangaysResponse(BaseModel):
     barangays: list[PsgcBarangay]
+
+
+class PsgcBarangaysPageResponse(PsgcBarangaysResponse):
+    total: int
+    nextCursor: str | None = None
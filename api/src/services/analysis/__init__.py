@@ -3,6 +3,7 @@ from src.services.analysis.events import (
     get_all_analysis_events,
     get_analysis_events,
     get_analysis_events_export,
+    stream_analysis_events,
 )
 from src.services.analysis.filters import get_filter_options
 from src.services.analysis.metrics import (
@@ -14,6 +15,7 @@ from src.services.analysis.metrics import (
     get_summary,
     get_victim_trends,
 )
+from src.services.analysis.suggest import get_suggestions
 from src.services.analysis.timeline import (
     get_calendar_days,
     get_calendar_months,
@@ -38,7 +40,9 @@ __all__ = [
     "get_date_events",
     "get_filter_options",
     "get_region_rankings",
+    "get_suggestions",
     "get_summary",
     "get_victim_trends",
     "make_analysis_filters",
+    "stream_analysis_events",
 ]
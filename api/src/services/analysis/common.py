@@ -3,7 +3,9 @@ import re
 from dataclasses import dataclass
 from datetime import date
 
+from src.config import settings
 from src.schemas.analysis import AnalysisEventType
+from src.services.analysis.search import search_event_iris
 from src.services.common import ServiceError
 
 SPARQL_PREFIXES = """PREFIX :     <https://sakuna.ph/>
@@ -93,6 +95,23 @@ def source_from_event_iri(event_iri: str) -> str | None:
     return next((labels[part.lower()] for part in parts if part.lower() in labels), None)
 
 
+def event_values(event_iris: tuple[str, ...]) -> str:
+    """
+    ``VALUES ?event`` over the search index's matches. Past
+    ``analysis_search_values_chunk`` IRIs the list is split into UNIONed
+    blocks, so a broad q keeps the index's semantics without one huge
+    VALUES table.
+    """
+    chunk = max(1, settings.analysis_search_values_chunk)
+    blocks = [
+        "VALUES ?event { " + " ".join(f"<{iri}>" for iri in event_iris[start:start + chunk]) + " }"
+        for start in range(0, len(event_iris), chunk)
+    ] or ["VALUES ?event { }"]
+    if len(blocks) == 1:
+        return blocks[0]
+    return "\nUNION\n".join(f"{{ {block} }}" for block in blocks)
+
+
 def event_filter_where(filters: AnalysisFilters) -> str:
     event_classes = {
         "major": ":MajorEvent",
@@ -100,7 +119,14 @@ def event_filter_where(filters: AnalysisFilters) -> str:
         "all": ":MajorEvent :Incident",
     }[filters.event_type]
 
-    fragments = [
+    fragments = []
+    search_matches = search_event_iris(filters.q) if filters.q else None
+    if search_matches is not None:
+        # Resolve q against the in-process index so GraphDB starts from the
+        # matching events instead of scanning every event name.
+        fragments.append(event_values(search_matches))
+
+    fragments += [
         f"VALUES ?eventClass {{ {event_classes} }}",
         "?event a ?eventClass ;\n         :startDate ?startDate .",
         "OPTIONAL { ?event :eventName ?eventNameValue }",
@@ -151,13 +177,21 @@ def event_filter_where(filters: AnalysisFilters) -> str:
 }}"""
         )
 
-    if filters.q:
+    if filters.q and search_matches is None:
+        # No index loaded yet: scan the same text the index covers.
         query_literal = sparql_string(filters.q)
         fragments.append(
-            "FILTER(CONTAINS("
-            "LCASE(CONCAT(COALESCE(STR(?eventName), \"\"), \" \", STR(?event))), "
-            f"LCASE({query_literal})"
-            "))"
+            f"""FILTER EXISTS {{
+  {{
+    VALUES ?searchProperty {{ :eventName :incidentDescription :remarks }}
+    ?event ?searchProperty ?searchText .
+  }}
+  UNION
+  {{
+    ?event :hasLocation/rdfs:label ?searchText .
+  }}
+  FILTER(CONTAINS(LCASE(STR(?searchText)), LCASE({query_literal})))
+}}"""
         )
 
     return "\n".join(fragments)
@@ -1,7 +1,9 @@
 import asyncio
 import csv
 import io
+import json
 import time
+from collections.abc import AsyncIterator
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
@@ -23,6 +25,7 @@ from src.services.analysis.common import (
     local_name,
     source_from_event_iri,
 )
+from src.services.analysis.offload import run_post_processing
 from src.services.common import ServiceError
 from src.services.ontology.utils import binding_value
 from src.services.sparql import execute_sparql
@@ -31,6 +34,7 @@ _CACHE_TTL = 300
 _MAX_CACHE_ENTRIES = 256
 _ENRICHMENT_CHUNK_SIZE = 500
 _ENRICHMENT_CONCURRENCY = 3
+_ENRICHMENT_FIELDS = {"event", "locations", "disasterTypes", "source", "alternates", "impact"}
 
 _SORT_EXPRESSIONS: dict[AnalysisEventSortBy, str] = {
     "startDate": "SUBSTR(STR(?startDate), 1, 10)",
@@ -365,30 +369,71 @@ def _apply_impacts(
             event.impact.damageUnit = None
 
 
-async def _enrich_events(events: list[AnalysisEvent]) -> list[AnalysisEvent]:
-    if not events:
-        return events
+def _apply_enrichment(
+    events_by_iri: dict[str, AnalysisEvent],
+    metadata_result: dict[Any, Any],
+    impacts_result: dict[Any, Any],
+) -> None:
+    _apply_metadata(events_by_iri, metadata_result)
+    _apply_impacts(events_by_iri, impacts_result)
+
+
+async def _load_base_events(result: dict[Any, Any]) -> list[AnalysisEvent]:
+    return await run_post_processing(
+        _base_events,
+        result,
+        size=len(_bindings(result)),
+    )
+
+
+async def _enrich_chunk(
+    chunk_events: dict[str, AnalysisEvent],
+    semaphore: asyncio.Semaphore,
+) -> list[AnalysisEvent]:
+    chunk = list(chunk_events)
+    async with semaphore:
+        metadata_result, impacts_result = await asyncio.gather(
+            _execute_or_raise(_metadata_query(chunk)),
+            _execute_or_raise(_impacts_query(chunk)),
+        )
+    await run_post_processing(
+        _apply_enrichment,
+        chunk_events,
+        metadata_result,
+        impacts_result,
+        size=len(_bindings(metadata_result)) + len(_bindings(impacts_result)),
+    )
+    return list(chunk_events.values())
+
 
+def _enrichment_tasks(events: list[AnalysisEvent]) -> list[asyncio.Task[list[AnalysisEvent]]]:
     events_by_iri = {event.event: event for event in events}
     event_iris = list(events_by_iri)
-
     semaphore = asyncio.Semaphore(_ENRICHMENT_CONCURRENCY)
-
-    async def enrich_chunk(chunk: list[str]) -> None:
-        chunk_events = {event_iri: events_by_iri[event_iri] for event_iri in chunk}
-        async with semaphore:
-            metadata_result, impacts_result = await asyncio.gather(
-                _execute_or_raise(_metadata_query(chunk)),
-                _execute_or_raise(_impacts_query(chunk)),
+    return [
+        asyncio.create_task(
+            _enrich_chunk(
+                {
+                    event_iri: events_by_iri[event_iri]
+                    for event_iri in event_iris[start : start + _ENRICHMENT_CHUNK_SIZE]
+                },
+                semaphore,
             )
-        _apply_metadata(chunk_events, metadata_result)
-        _apply_impacts(chunk_events, impacts_result)
-
-    chunks = [
-        event_iris[start : start + _ENRICHMENT_CHUNK_SIZE]
+        )
         for start in range(0, len(event_iris), _ENRICHMENT_CHUNK_SIZE)
     ]
-    await asyncio.gather(*(enrich_chunk(chunk) for chunk in chunks))
+
+
+async def _enrich_events(events: list[AnalysisEvent]) -> list[AnalysisEvent]:
+    if not events:
+        return events
+
+    tasks = _enrichment_tasks(events)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
     return events
 
 
@@ -417,7 +462,7 @@ async def get_analysis_events(
         ),
         _execute_or_raise(_count_query(filters)),
     )
-    items = await _enrich_events(_base_events(events_result))
+    items = await _enrich_events(await _load_base_events(events_result))
     response = AnalysisEventsResponse(
         items=items,
         page=page,
@@ -430,6 +475,85 @@ async def get_analysis_events(
     return response
 
 
+def _sse(payload: dict[str, Any]) -> str:
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def _enrichment_patch(event: AnalysisEvent) -> dict[str, Any]:
+    return event.model_dump(mode="json", include=_ENRICHMENT_FIELDS)
+
+
+async def stream_analysis_events(
+    *,
+    filters: AnalysisFilters,
+    page: int,
+    page_size: int,
+    sort_by: AnalysisEventSortBy,
+    sort_dir: AnalysisSortDirection,
+) -> AsyncIterator[str]:
+    """Yield SSE frames: base events, the total, then enrichment per chunk.
+
+    Frames are ``events`` (unenriched items), ``total``, one ``patch`` per
+    enrichment chunk as it completes, and finally ``done``.
+    """
+    cache_key = ("events", filters, page, page_size, sort_by, sort_dir)
+    if (cached := _cache.get(cache_key)) is not None:
+        yield _sse({"type": "events", "items": cached.model_dump(mode="json")["items"]})
+        yield _sse({"type": "total", "total": cached.total})
+        yield _sse({"type": "done"})
+        return
+
+    count_task = asyncio.create_task(_execute_or_raise(_count_query(filters)))
+    tasks: list[asyncio.Task[list[AnalysisEvent]]] = []
+    try:
+        events_result = await _execute_or_raise(
+            _events_query(
+                filters,
+                sort_by,
+                sort_dir,
+                limit=page_size,
+                offset=(page - 1) * page_size,
+            )
+        )
+        items = await _load_base_events(events_result)
+        yield _sse(
+            {
+                "type": "events",
+                "items": [item.model_dump(mode="json") for item in items],
+            }
+        )
+
+        tasks = _enrichment_tasks(items)
+        total = _count_value(await count_task)
+        yield _sse({"type": "total", "total": total})
+
+        for next_chunk in asyncio.as_completed(tasks):
+            chunk = await next_chunk
+            yield _sse(
+                {
+                    "type": "patch",
+                    "items": [_enrichment_patch(event) for event in chunk],
+                }
+            )
+    finally:
+        count_task.cancel()
+        for task in tasks:
+            task.cancel()
+
+    _cache.set(
+        cache_key,
+        AnalysisEventsResponse(
+            items=items,
+            page=page,
+            page_size=page_size,
+            total=total,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+        ),
+    )
+    yield _sse({"type": "done"})
+
+
 async def _load_all_analysis_events(
     filters: AnalysisFilters,
     cache_key: tuple[Any, ...],
@@ -442,7 +566,7 @@ async def _load_all_analysis_events(
             limit=None,
         )
     )
-    items = await _enrich_events(_base_events(result))
+    items = await _enrich_events(await _load_base_events(result))
     _cache.set(cache_key, items)
     return items
 
@@ -480,8 +604,8 @@ async def get_analysis_events_export(
     result = await _execute_or_raise(
         _events_query(filters, sort_by, sort_dir, limit=None)
     )
-    items = await _enrich_events(_base_events(result))
-    csv_content = events_to_csv(items)
+    items = await _enrich_events(await _load_base_events(result))
+    csv_content = await run_post_processing(events_to_csv, items, size=len(items))
     _cache.set(cache_key, csv_content)
     return csv_content
 
@@ -22,6 +22,7 @@ from src.schemas.analysis import (
 )
 from src.services.analysis.common import AnalysisFilters, SPARQL_PREFIXES, event_filter_where, local_name
 from src.services.analysis.events import get_all_analysis_events
+from src.services.analysis.offload import run_post_processing
 from src.services.common import ServiceError
 from src.services.ontology import get_disaster_taxonomy
 from src.services.ontology.utils import binding_value
@@ -84,8 +85,7 @@ async def _taxonomy_groups() -> dict[str, tuple[str, str]]:
     return groups
 
 
-async def get_summary(filters: AnalysisFilters) -> AnalysisSummaryResponse:
-    events = await get_all_analysis_events(filters)
+def _summary(events: list[Any]) -> AnalysisSummaryResponse:
     damage_totals: dict[str, float] = defaultdict(float)
     summary = AnalysisSummaryResponse(record_count=len(events))
     for event in events:
@@ -103,12 +103,11 @@ async def get_summary(filters: AnalysisFilters) -> AnalysisSummaryResponse:
     return summary
 
 
-async def get_disaster_counts(
-    filters: AnalysisFilters,
+def _disaster_counts(
+    events: list[Any],
     group_by: AnalysisDisasterCountGroupBy,
+    taxonomy_groups: dict[str, tuple[str, str]],
 ) -> AnalysisDisasterCountsResponse:
-    events = await get_all_analysis_events(filters)
-    taxonomy_groups = await _taxonomy_groups() if group_by == "taxonomy" else {}
     counts: dict[str, AnalysisDisasterCount] = {}
 
     for event in events:
@@ -132,8 +131,7 @@ async def get_disaster_counts(
     )
 
 
-async def get_victim_trends(filters: AnalysisFilters) -> AnalysisVictimTrendsResponse:
-    events = await get_all_analysis_events(filters)
+def _victim_trends(events: list[Any]) -> AnalysisVictimTrendsResponse:
     trends: dict[int, AnalysisVictimTrend] = {}
     for event in events:
         year_text = event.startDate[:4]
@@ -147,6 +145,31 @@ async def get_victim_trends(filters: AnalysisFilters) -> AnalysisVictimTrendsRes
     return AnalysisVictimTrendsResponse(items=[trends[year] for year in sorted(trends)])
 
 
+async def get_summary(filters: AnalysisFilters) -> AnalysisSummaryResponse:
+    events = await get_all_analysis_events(filters)
+    return await run_post_processing(_summary, events, size=len(events))
+
+
+async def get_disaster_counts(
+    filters: AnalysisFilters,
+    group_by: AnalysisDisasterCountGroupBy,
+) -> AnalysisDisasterCountsResponse:
+    events = await get_all_analysis_events(filters)
+    taxonomy_groups = await _taxonomy_groups() if group_by == "taxonomy" else {}
+    return await run_post_processing(
+        _disaster_counts,
+        events,
+        group_by,
+        taxonomy_groups,
+        size=len(events),
+    )
+
+
+async def get_victim_trends(filters: AnalysisFilters) -> AnalysisVictimTrendsResponse:
+    events = await get_all_analysis_events(filters)
+    return await run_post_processing(_victim_trends, events, size=len(events))
+
+
 async def get_region_rankings(filters: AnalysisFilters) -> AnalysisRegionRankingsResponse:
     result = await _execute_or_raise(_region_rankings_query(filters))
     items: list[AnalysisRegionRanking] = []
@@ -169,8 +192,7 @@ async def get_region_rankings(filters: AnalysisFilters) -> AnalysisRegionRanking
     return AnalysisRegionRankingsResponse(items=items)
 
 
-async def get_disaster_rankings(filters: AnalysisFilters) -> AnalysisDisasterRankingsResponse:
-    events = await get_all_analysis_events(filters)
+def _disaster_rankings(events: list[Any]) -> AnalysisDisasterRankingsResponse:
     rankings: dict[str, AnalysisDisasterRanking] = {}
     for event in events:
         for disaster_type in {item.id: item for item in event.disasterTypes}.values():
@@ -187,15 +209,11 @@ async def get_disaster_rankings(filters: AnalysisFilters) -> AnalysisDisasterRan
     )
 
 
-async def get_damage_histogram(
-    filters: AnalysisFilters,
-    *,
+def _damage_histogram(
+    events: list[Any],
     bins: int,
     unit: str | None,
 ) -> AnalysisDamageHistogramResponse:
-    if unit and not _UNIT_RE.fullmatch(unit):
-        raise ServiceError(422, "unit must be a local QUDT unit id")
-    events = await get_all_analysis_events(filters)
     histogram: list[AnalysisDamageHistogramBin] = []
     for current_unit, values in sorted(_damage_amounts(events, unit).items()):
         low, high = min(values), max(values)
@@ -227,8 +245,7 @@ async def get_damage_histogram(
     return AnalysisDamageHistogramResponse(bins=histogram)
 
 
-async def get_damage_vs_affected(filters: AnalysisFilters) -> AnalysisDamageAffectedResponse:
-    events = await get_all_analysis_events(filters)
+def _damage_vs_affected(events: list[Any]) -> AnalysisDamageAffectedResponse:
     points: list[AnalysisDamageAffectedPoint] = []
     for event in events:
         for damage in event.impact.damageByUnit:
@@ -245,3 +262,31 @@ async def get_damage_vs_affected(filters: AnalysisFilters) -> AnalysisDamageAffe
     return AnalysisDamageAffectedResponse(
         items=sorted(points, key=lambda item: (item.unit, item.damage, item.event))
     )
+
+
+async def get_disaster_rankings(filters: AnalysisFilters) -> AnalysisDisasterRankingsResponse:
+    events = await get_all_analysis_events(filters)
+    return await run_post_processing(_disaster_rankings, events, size=len(events))
+
+
+async def get_damage_histogram(
+    filters: AnalysisFilters,
+    *,
+    bins: int,
+    unit: str | None,
+) -> AnalysisDamageHistogramResponse:
+    if unit and not _UNIT_RE.fullmatch(unit):
+        raise ServiceError(422, "unit must be a local QUDT unit id")
+    events = await get_all_analysis_events(filters)
+    return await run_post_processing(
+        _damage_histogram,
+        events,
+        bins,
+        unit,
+        size=len(events),
+    )
+
+
+async def get_damage_vs_affected(filters: AnalysisFilters) -> AnalysisDamageAffectedResponse:
+    events = await get_all_analysis_events(filters)
+    return await run_post_processing(_damage_vs_affected, events, size=len(events))
@@ -0,0 +1,43 @@
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from src.config import settings
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.analysis_workers),
+            thread_name_prefix="analysis",
+        )
+    return _executor
+
+
+async def run_post_processing(
+    func: Callable[..., T],
+    *args: Any,
+    size: int,
+) -> T:
+    """Run CPU-bound post-processing, off the event loop when ``size`` is large.
+
+    Small inputs run inline because the hand-off costs more than the work.
+    """
+    if size < settings.analysis_offload_threshold:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args))
+
+
+def shutdown_post_processing() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,235 @@
+import asyncio
+import bisect
+import logging
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Any
+
+from src.config import settings
+from src.services.analysis.offload import run_post_processing
+from src.services.ontology.utils import binding_value
+from src.services.sparql import execute_sparql
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+_MAX_CACHED_QUERIES = 256
+
+_SEARCH_DOCUMENTS_QUERY = """
+PREFIX :     <https://sakuna.ph/>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+SELECT ?event ?text
+WHERE {
+  VALUES ?eventClass { :MajorEvent :Incident }
+  ?event a ?eventClass .
+  {
+    ?event :eventName ?text .
+  }
+  UNION
+  {
+    ?event :incidentDescription ?text .
+  }
+  UNION
+  {
+    ?event :remarks ?text .
+  }
+  UNION
+  {
+    ?event :hasLocation ?location .
+    ?location rdfs:label ?text .
+  }
+}
+"""
+
+
+_EVENT_COUNT_QUERY = """
+PREFIX : <https://sakuna.ph/>
+
+SELECT (COUNT(?event) AS ?count)
+WHERE {
+  VALUES ?eventClass { :MajorEvent :Incident }
+  ?event a ?eventClass .
+}
+"""
+
+
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(_fold(text))
+
+
+def _trigrams(token: str) -> set[str]:
+    padded = f" {token} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+def _max_edits(term: str) -> int:
+    if len(term) >= 8:
+        return 2
+    if len(term) >= 4:
+        return 1
+    return 0
+
+
+def _within_edits(left: str, right: str, limit: int) -> bool:
+    if abs(len(left) - len(right)) > limit:
+        return False
+    previous = list(range(len(right) + 1))
+    for row, left_char in enumerate(left, start=1):
+        current = [row]
+        for column, right_char in enumerate(right, start=1):
+            current.append(
+                min(
+                    previous[column] + 1,
+                    current[column - 1] + 1,
+                    previous[column - 1] + (left_char != right_char),
+                )
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class EventSearchIndex:
+    """Inverted index over the searchable text of analysis events.
+
+    Every query term must match a document token exactly or as a prefix.
+    Terms with no such match fall back to tokens within one or two edits.
+    """
+
+    def __init__(self, documents: dict[str, list[str]]) -> None:
+        self._event_iris = sorted(documents)
+        postings: dict[str, set[int]] = defaultdict(set)
+        for doc_id, event_iri in enumerate(self._event_iris):
+            for text in documents[event_iri]:
+                for token in tokenize(text):
+                    postings[token].add(doc_id)
+
+        self._vocabulary = sorted(postings)
+        self._postings = [frozenset(postings[token]) for token in self._vocabulary]
+        self._vocabulary_by_trigram: dict[str, list[int]] = defaultdict(list)
+        for token_id, token in enumerate(self._vocabulary):
+            for trigram in _trigrams(token):
+                self._vocabulary_by_trigram[trigram].append(token_id)
+
+        self.search = lru_cache(maxsize=_MAX_CACHED_QUERIES)(self._search)
+
+    def __len__(self) -> int:
+        return len(self._event_iris)
+
+    def _prefix_token_ids(self, term: str) -> range:
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + "\U0010ffff", lo=start)
+        return range(start, end)
+
+    def _fuzzy_token_ids(self, term: str) -> list[int]:
+        limit = _max_edits(term)
+        if limit == 0:
+            return []
+        term_trigrams = _trigrams(term)
+        # Each edit changes at most three padded trigrams.
+        required = max(1, len(term_trigrams) - 3 * limit)
+        shared: Counter[int] = Counter()
+        for trigram in term_trigrams:
+            shared.update(self._vocabulary_by_trigram.get(trigram, ()))
+        return [
+            token_id
+            for token_id, count in shared.items()
+            if count >= required and _within_edits(term, self._vocabulary[token_id], limit)
+        ]
+
+    def _term_documents(self, term: str) -> set[int]:
+        token_ids = self._prefix_token_ids(term) or self._fuzzy_token_ids(term)
+        documents: set[int] = set()
+        for token_id in token_ids:
+            documents.update(self._postings[token_id])
+        return documents
+
+    def _search(self, query: str) -> tuple[str, ...]:
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return ()
+        matches: set[int] | None = None
+        for term in terms:
+            documents = self._term_documents(term)
+            matches = documents if matches is None else matches & documents
+            if not matches:
+                return ()
+        return tuple(self._event_iris[doc_id] for doc_id in sorted(matches or ()))
+
+
+_index: EventSearchIndex | None = None
+
+
+def _build_index(result: dict[Any, Any]) -> EventSearchIndex:
+    documents: dict[str, list[str]] = defaultdict(list)
+    for binding in result.get("results", {}).get("bindings", []):
+        event_iri = binding_value(binding, "event", "")
+        text = binding_value(binding, "text", "")
+        if event_iri and text:
+            documents[event_iri].append(text)
+    return EventSearchIndex(documents)
+
+
+async def _rebuild_index() -> bool:
+    global _index
+    result = await execute_sparql(_SEARCH_DOCUMENTS_QUERY)
+    if isinstance(result, str):
+        logger.warning("Event search index was not refreshed: %s", result)
+        return False
+    _index = await run_post_processing(
+        _build_index,
+        result,
+        size=len(result.get("results", {}).get("bindings", [])),
+    )
+    return True
+
+
+async def refresh_event_search_index() -> EventSearchIndex | None:
+    """Rebuild the event index from GraphDB, keeping the old one on failure."""
+    await _rebuild_index()
+    return _index
+
+
+async def _event_count() -> int | None:
+    result = await execute_sparql(_EVENT_COUNT_QUERY)
+    if isinstance(result, str):
+        return None
+    bindings = result.get("results", {}).get("bindings", [])
+    return int(binding_value(bindings[0], "count", "0")) if bindings else 0
+
+
+async def keep_event_search_index_fresh() -> None:
+    """Rebuild the index when the number of events changes or it is older
+    than the refresh interval; a failed build is retried after a short delay."""
+    loop = asyncio.get_running_loop()
+    built_at: float | None = None
+    built_count: int | None = None
+    while True:
+        count = await _event_count()
+        expired = (
+            built_at is None
+            or loop.time() - built_at >= settings.analysis_search_refresh_seconds
+        )
+        delay = settings.analysis_search_check_seconds
+        if expired or (count is not None and count != built_count):
+            if await _rebuild_index():
+                built_at, built_count = loop.time(), count
+            else:
+                delay = settings.analysis_search_retry_seconds
+        await asyncio.sleep(delay)
+
+
+def search_event_iris(query: str) -> tuple[str, ...] | None:
+    """Return matching event IRIs, or ``None`` when no index is loaded yet."""
+    if _index is None:
+        return None
+    return _index.search(query)
@@ -0,0 +1,226 @@
+import asyncio
+import bisect
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from src.schemas.analysis import (
+    AnalysisSuggestion,
+    AnalysisSuggestionKind,
+    AnalysisSuggestResponse,
+)
+from src.services.analysis.common import SPARQL_PREFIXES, local_name
+from src.services.analysis.search import tokenize
+from src.services.common import ServiceError
+from src.services.ontology import get_disaster_taxonomy
+from src.services.ontology.utils import binding_value
+from src.services.sparql import execute_sparql
+
+_CACHE_TTL = 300
+_LEVEL_ORDER = {"Region": 0, "Province": 1, "City": 2, "Municipality": 3}
+
+_LOCATION_LABELS_QUERY = SPARQL_PREFIXES + """
+SELECT ?code ?levelClass ?label ?altLabel ?parentLabel
+WHERE {
+  VALUES ?levelClass { :Region :Province :City :Municipality }
+  ?place a ?levelClass ;
+         :psgcCode ?code ;
+         rdfs:label ?label .
+  OPTIONAL { ?place skos:altLabel ?altLabel }
+  OPTIONAL {
+    ?place :isPartOf ?parent .
+    ?parent rdfs:label ?parentLabel .
+  }
+}
+"""
+
+
+@dataclass(frozen=True)
+class _Entry:
+    id: str
+    label: str
+    kind: AnalysisSuggestionKind
+    level: str | None = None
+    parentLabel: str | None = None
+
+
+class SuggestionIndex:
+    """Sorted-array prefix index over location and disaster type labels.
+
+    Every word start of every label is a key, so "manila" finds
+    "City of Manila" while whole-label prefixes still rank first.
+    """
+
+    def __init__(self, labelled_entries: list[tuple[_Entry, list[str]]]) -> None:
+        self._entries = [entry for entry, _ in labelled_entries]
+        keyed: list[tuple[str, tuple[Any, ...], int, str]] = []
+        for entry_id, (entry, labels) in enumerate(labelled_entries):
+            for label in dict.fromkeys(labels):
+                words = tokenize(label)
+                for position in range(len(words)):
+                    keyed.append(
+                        (
+                            " ".join(words[position:]),
+                            self._rank(entry, position, label),
+                            entry_id,
+                            label,
+                        )
+                    )
+        keyed.sort()
+        self._keys = [key for key, *_ in keyed]
+        self._matches = [match for _, *match in keyed]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _rank(entry: _Entry, position: int, label: str) -> tuple[Any, ...]:
+        return (
+            position > 0,
+            label != entry.label,
+            _LEVEL_ORDER.get(entry.level or "", len(_LEVEL_ORDER)),
+            len(label),
+            label.casefold(),
+            entry.id,
+        )
+
+    def suggest(
+        self,
+        query: str,
+        *,
+        kind: AnalysisSuggestionKind | None = None,
+        limit: int = 10,
+    ) -> list[AnalysisSuggestion]:
+        prefix = " ".join(tokenize(query))
+        if not prefix:
+            return []
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix + "\U0010ffff", lo=start)
+
+        # Keep each entry's best-ranked label, then take the top ``limit``.
+        best: dict[int, tuple[tuple[Any, ...], str]] = {}
+        for rank, entry_id, label in self._matches[start:end]:
+            if kind and self._entries[entry_id].kind != kind:
+                continue
+            current = best.get(entry_id)
+            if current is None or rank < current[0]:
+                best[entry_id] = (rank, label)
+
+        top = heapq.nsmallest(limit, best.items(), key=lambda item: item[1][0])
+        suggestions = []
+        for entry_id, (_, matched_label) in top:
+            entry = self._entries[entry_id]
+            suggestions.append(
+                AnalysisSuggestion(
+                    id=entry.id,
+                    label=entry.label,
+                    kind=entry.kind,
+                    level=entry.level,
+                    parentLabel=entry.parentLabel,
+                    matchedLabel=None if matched_label == entry.label else matched_label,
+                )
+            )
+        return suggestions
+
+
+def _location_entries(bindings: list[dict[Any, Any]]) -> list[tuple[_Entry, list[str]]]:
+    entries: dict[str, tuple[_Entry, list[str]]] = {}
+    for binding in bindings:
+        code = binding_value(binding, "code", "")
+        label = binding_value(binding, "label", "")
+        if not code or not label:
+            continue
+        if code not in entries:
+            entries[code] = (
+                _Entry(
+                    id=code,
+                    label=label,
+                    kind="location",
+                    level=local_name(binding_value(binding, "levelClass", "")) or None,
+                    parentLabel=binding_value(binding, "parentLabel"),
+                ),
+                [label],
+            )
+        if alt_label := binding_value(binding, "altLabel"):
+            entries[code][1].append(alt_label)
+    return list(entries.values())
+
+
+def _taxonomy_entries(root: Any) -> list[tuple[_Entry, list[str]]]:
+    entries: list[tuple[_Entry, list[str]]] = []
+
+    def visit(node: Any, parent_label: str | None) -> None:
+        if node.id != "root":
+            entries.append(
+                (
+                    _Entry(
+                        id=node.id,
+                        label=node.label,
+                        kind="disasterType",
+                        parentLabel=parent_label,
+                    ),
+                    [node.label],
+                )
+            )
+        for child in node.children or []:
+            visit(child, None if node.id == "root" else node.label)
+
+    visit(root, None)
+    return entries
+
+
+class _TTLCache:
+    def __init__(self) -> None:
+        self._entry: tuple[float, SuggestionIndex] | None = None
+
+    def get(self) -> SuggestionIndex | None:
+        if self._entry is None:
+            return None
+
+        timestamp, value = self._entry
+        if time.monotonic() - timestamp > _CACHE_TTL:
+            self._entry = None
+            return None
+        return value
+
+    def set(self, value: SuggestionIndex) -> None:
+        self._entry = (time.monotonic(), value)
+
+
+_cache = _TTLCache()
+_build_lock = asyncio.Lock()
+
+
+async def _load_index() -> SuggestionIndex:
+    if (cached := _cache.get()) is not None:
+        return cached
+
+    async with _build_lock:
+        if (cached := _cache.get()) is not None:
+            return cached
+        locations, taxonomy = await asyncio.gather(
+            execute_sparql(_LOCATION_LABELS_QUERY),
+            get_disaster_taxonomy(),
+        )
+        if isinstance(locations, str):
+            raise ServiceError(502, locations)
+        index = SuggestionIndex(
+            _location_entries(locations.get("results", {}).get("bindings", []))
+            + _taxonomy_entries(taxonomy)
+        )
+        _cache.set(index)
+        return index
+
+
+async def get_suggestions(
+    q: str,
+    *,
+    kind: AnalysisSuggestionKind | None,
+    limit: int,
+) -> AnalysisSuggestResponse:
+    index = await _load_index()
+    return AnalysisSuggestResponse(
+        q=q,
+        items=index.suggest(q, kind=kind, limit=limit),
+    )
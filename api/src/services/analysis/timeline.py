@@ -14,6 +14,7 @@ from src.schemas.analysis import (
 )
 from src.services.analysis.common import AnalysisFilters
 from src.services.analysis.events import get_all_analysis_events
+from src.services.analysis.offload import run_post_processing
 from src.services.common import ServiceError
 from src.services.ontology import get_disaster_taxonomy
 
@@ -70,6 +71,20 @@ def _calendar_items(
     return [items[period] for period in sorted(items)]
 
 
+def _calendar_response(
+    events: list[Any],
+    period_length: int,
+    include_impacts: bool,
+) -> AnalysisCalendarResponse:
+    return AnalysisCalendarResponse(
+        items=_calendar_items(
+            events,
+            period_length=period_length,
+            include_impacts=include_impacts,
+        )
+    )
+
+
 async def _taxonomy_groups() -> dict[str, tuple[str, str]]:
     taxonomy = await get_disaster_taxonomy()
     groups: dict[str, tuple[str, str]] = {}
@@ -93,12 +108,13 @@ async def get_calendar_years(
     *,
     include_impacts: bool,
 ) -> AnalysisCalendarResponse:
-    return AnalysisCalendarResponse(
-        items=_calendar_items(
-            await get_all_analysis_events(filters),
-            period_length=4,
-            include_impacts=include_impacts,
-        )
+    events = await get_all_analysis_events(filters)
+    return await run_post_processing(
+        _calendar_response,
+        events,
+        4,
+        include_impacts,
+        size=len(events),
     )
 
 
@@ -113,8 +129,12 @@ async def get_calendar_months(
         event for event in await get_all_analysis_events(filters)
         if event.startDate.startswith(prefix)
     ]
-    return AnalysisCalendarResponse(
-        items=_calendar_items(events, period_length=7, include_impacts=include_impacts)
+    return await run_post_processing(
+        _calendar_response,
+        events,
+        7,
+        include_impacts,
+        size=len(events),
     )
 
 
@@ -130,18 +150,20 @@ async def get_calendar_days(
         event for event in await get_all_analysis_events(filters)
         if event.startDate.startswith(prefix)
     ]
-    return AnalysisCalendarResponse(
-        items=_calendar_items(events, period_length=10, include_impacts=include_impacts)
+    return await run_post_processing(
+        _calendar_response,
+        events,
+        10,
+        include_impacts,
+        size=len(events),
     )
 
 
-async def get_category_stacks(
-    filters: AnalysisFilters,
-    *,
+def _category_stacks(
+    events: list[Any],
+    groups: dict[str, tuple[str, str]],
     bucket: AnalysisTimelineBucket,
 ) -> AnalysisTimelineCategoryStacksResponse:
-    events = await get_all_analysis_events(filters)
-    groups = await _taxonomy_groups()
     counts: dict[str, dict[str, AnalysisDisasterCount]] = defaultdict(dict)
 
     for event in events:
@@ -182,6 +204,22 @@ async def get_category_stacks(
     )
 
 
+async def get_category_stacks(
+    filters: AnalysisFilters,
+    *,
+    bucket: AnalysisTimelineBucket,
+) -> AnalysisTimelineCategoryStacksResponse:
+    events = await get_all_analysis_events(filters)
+    groups = await _taxonomy_groups()
+    return await run_post_processing(
+        _category_stacks,
+        events,
+        groups,
+        bucket,
+        size=len(events),
+    )
+
+
 async def get_date_events(
     filters: AnalysisFilters,
     *,
@@ -1,6 +1,6 @@
+from src.services.ontology.barangays import get_psgc_barangays, stream_psgc_barangays
 from src.services.ontology.graph import get_ontology_graph
 from src.services.ontology.psgc import (
-    # get_psgc_barangays,
     get_psgc_cities_municipalities,
     get_psgc_nodes,
     get_psgc_provinces,
@@ -11,9 +11,10 @@ from src.services.ontology.taxonomy import get_disaster_taxonomy
 __all__ = [
     "get_disaster_taxonomy",
     "get_ontology_graph",
-    # "get_psgc_barangays",
+    "get_psgc_barangays",
     "get_psgc_cities_municipalities",
     "get_psgc_nodes",
     "get_psgc_provinces",
     "get_psgc_regions",
+    "stream_psgc_barangays",
 ]
@@ -0,0 +1,207 @@
+import asyncio
+import bisect
+import json
+import re
+import time
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+from src.schemas.ontology import PsgcBarangay, PsgcBarangaysPageResponse
+from src.services.common import ServiceError
+from src.services.ontology.utils import binding_value
+from src.services.sparql import execute_sparql
+
+_CACHE_TTL = 3600
+_NDJSON_BATCH_SIZE = 1000
+_PSGC_RE = re.compile(r"^\d{10}$")
+
+_PSGC_BARANGAYS_QUERY = """
+PREFIX : <https://sakuna.ph/>
+PREFIX rdfs:   <http://www.w3.org/2000/01/rdf-schema#>
+
+SELECT ?code ?label ?population ?parentCode ?parentLabel WHERE {
+    ?b a :Barangay .
+    ?b :psgcCode ?code .
+    ?b rdfs:label ?label .
+    ?b :isPartOf ?parent .
+    ?parent :psgcCode ?parentCode .
+    ?parent rdfs:label ?parentLabel .
+    OPTIONAL { ?b :population2024 ?population }
+}
+"""
+
+
+class BarangayIndex:
+    """Column arrays over every barangay, sorted by PSGC code.
+
+    Labels live in one string addressed by offsets and parents are stored once,
+    so ~42k barangays cost a few MB instead of one object per row.
+    """
+
+    def __init__(self, rows: list[tuple[str, str, int, str, str]]) -> None:
+        rows = sorted(rows)
+        parent_ids: dict[str, int] = {}
+        self.parent_codes: list[str] = []
+        self.parent_labels: list[str] = []
+        self.codes = array("Q")
+        self.parents = array("I")
+        self.populations = array("Q")
+        self.label_offsets = array("I", [0])
+        labels: list[str] = []
+        children: dict[int, array] = {}
+
+        for position, (code, label, population, parent_code, parent_label) in enumerate(rows):
+            parent_id = parent_ids.get(parent_code)
+            if parent_id is None:
+                parent_id = parent_ids[parent_code] = len(self.parent_codes)
+                self.parent_codes.append(parent_code)
+                self.parent_labels.append(parent_label)
+                children[parent_id] = array("I")
+            children[parent_id].append(position)
+            self.codes.append(int(code))
+            self.parents.append(parent_id)
+            self.populations.append(population)
+            labels.append(label)
+            self.label_offsets.append(self.label_offsets[-1] + len(label))
+
+        self.labels = "".join(labels)
+        self._parent_ids = parent_ids
+        self._children = children
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def positions(self, parent_code: str | None) -> array | range:
+        if parent_code is None:
+            return range(len(self.codes))
+        parent_id = self._parent_ids.get(parent_code)
+        if parent_id is None:
+            return range(0)
+        return self._children[parent_id]
+
+    def start_after(self, positions: array | range, cursor: str | None) -> int:
+        if cursor is None:
+            return 0
+        return bisect.bisect_right(positions, int(cursor), key=self.codes.__getitem__)
+
+    def row(self, position: int) -> dict[str, Any]:
+        code = f"{self.codes[position]:010d}"
+        parent_id = self.parents[position]
+        return {
+            "id": code,
+            "label": self.labels[
+                self.label_offsets[position] : self.label_offsets[position + 1]
+            ],
+            "level": "Barangay",
+            "population": self.populations[position],
+            "psgcCode": code,
+            "parentId": self.parent_codes[parent_id],
+            "parentLabel": self.parent_labels[parent_id],
+        }
+
+
+def _int_value(binding: dict[Any, Any], key: str) -> int:
+    value = binding_value(binding, key, "")
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        raise ServiceError(502, f"GraphDB returned a non-integer {key}") from None
+
+
+def _index_rows(bindings: list[dict[Any, Any]]) -> list[tuple[str, str, int, str, str]]:
+    rows: dict[str, tuple[str, str, int, str, str]] = {}
+    for binding in bindings:
+        code = binding_value(binding, "code", "")
+        if not _PSGC_RE.fullmatch(code) or code in rows:
+            continue
+        rows[code] = (
+            code,
+            binding_value(binding, "label", ""),
+            _int_value(binding, "population"),
+            binding_value(binding, "parentCode", ""),
+            binding_value(binding, "parentLabel", ""),
+        )
+    return list(rows.values())
+
+
+class _TTLCache:
+    def __init__(self) -> None:
+        self._entry: tuple[float, BarangayIndex] | None = None
+
+    def get(self) -> BarangayIndex | None:
+        if self._entry is None:
+            return None
+
+        timestamp, value = self._entry
+        if time.monotonic() - timestamp > _CACHE_TTL:
+            self._entry = None
+            return None
+        return value
+
+    def set(self, value: BarangayIndex) -> None:
+        self._entry = (time.monotonic(), value)
+
+
+_cache = _TTLCache()
+_build_lock = asyncio.Lock()
+
+
+async def _load_index() -> BarangayIndex:
+    if (cached := _cache.get()) is not None:
+        return cached
+
+    async with _build_lock:
+        if (cached := _cache.get()) is not None:
+            return cached
+        result = await execute_sparql(_PSGC_BARANGAYS_QUERY)
+        if isinstance(result, str):
+            raise ServiceError(502, result)
+        index = BarangayIndex(
+            _index_rows(result.get("results", {}).get("bindings", []))
+        )
+        _cache.set(index)
+        return index
+
+
+def _validate_code(name: str, value: str | None) -> None:
+    if value is not None and not _PSGC_RE.fullmatch(value):
+        raise ServiceError(422, f"{name} must be exactly 10 digits")
+
+
+async def get_psgc_barangays(
+    *,
+    parent_code: str | None = None,
+    cursor: str | None = None,
+    limit: int = 500,
+) -> PsgcBarangaysPageResponse:
+    _validate_code("parent_code", parent_code)
+    _validate_code("cursor", cursor)
+
+    index = await _load_index()
+    positions = index.positions(parent_code)
+    start = index.start_after(positions, cursor)
+    page = positions[start : start + limit]
+    barangays = [PsgcBarangay(**index.row(position)) for position in page]
+    has_more = start + limit < len(positions)
+    return PsgcBarangaysPageResponse(
+        barangays=barangays,
+        total=len(positions),
+        nextCursor=barangays[-1].psgcCode if has_more and barangays else None,
+    )
+
+
+async def stream_psgc_barangays(parent_code: str | None = None) -> Iterator[str]:
+    """Return an NDJSON line iterator; validation and loading happen up front."""
+    _validate_code("parent_code", parent_code)
+    index = await _load_index()
+    positions = index.positions(parent_code)
+
+    def lines() -> Iterator[str]:
+        for start in range(0, len(positions), _NDJSON_BATCH_SIZE):
+            yield "".join(
+                json.dumps(index.row(position), ensure_ascii=False) + "\n"
+                for position in positions[start : start + _NDJSON_BATCH_SIZE]
+            )
+
+    return lines()
@@ -104,23 +104,6 @@ WHERE {
 ORDER BY ?regionCode ?parentCode ?label
 """
 
-# Barangays are intentionally disabled for now. The shape is kept here so the
-# endpoint can be enabled when the graph can handle the much larger result set.
-# _PSGC_BARANGAYS_QUERY = """
-# PREFIX : <https://sakuna.ph/>
-# PREFIX rdfs:   <http://www.w3.org/2000/01/rdf-schema#>
-#
-# SELECT ?code ?label ?population ?parentCode ?parentLabel WHERE {
-#     ?b a :Barangay .
-#     ?b :psgcCode ?code .
-#     ?b rdfs:label ?label .
-#     ?b :isPartOf ?parent .
-#     ?parent :psgcCode ?parentCode .
-#     ?parent rdfs:label ?parentLabel .
-#     OPTIONAL { ?b :population2024 ?population }
-# }
-# """
-
 _ISLAND_LUZON = {"01", "02", "03", "04", "05", "14", "17"}
 _ISLAND_VISAYAS = {"06", "07", "08", "18"}
 
@@ -202,19 +185,6 @@ def _city_municipality_item(binding: dict[Any, Any]) -> PsgcCityMunicipality:
     )
 
 
-# def _barangay_item(binding: dict[Any, Any]) -> dict[Any, Any]:
-#     code = binding_value(binding, "code", "")
-#     return {
-#         "id": code,
-#         "label": binding_value(binding, "label", ""),
-#         "level": "Barangay",
-#         "population": _int_binding(binding, "population"),
-#         "psgcCode": code,
-#         "parentId": binding_value(binding, "parentCode"),
-#         "parentLabel": binding_value(binding, "parentLabel"),
-#     }
-
-
 def _build_psgc(
     region_bindings: list[dict[Any, Any]],
     province_bindings: list[dict[Any, Any]],
@@ -262,11 +232,6 @@ async def get_psgc_cities_municipalities() -> PsgcCitiesMunicipalitiesResponse:
     )
 
 
-# async def get_psgc_barangays() -> dict[Any, Any]:
-#     bindings = await _fetch_bindings(_PSGC_BARANGAYS_QUERY)
-#     return {"barangays": [_barangay_item(binding) for binding in bindings]}
-
-
 async def get_psgc_nodes() -> PsgcGraphResponse:
     region_res, province_res, city_res = await asyncio.gather(
         execute_sparql(_PSGC_REGIONS_QUERY),
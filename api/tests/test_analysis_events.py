@@ -1,11 +1,14 @@
+import asyncio
 import csv
 import io
+import json
 import unittest
 from datetime import date
 from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
 
+from src.config import settings
 from src.main import app
 from src.schemas.analysis import AnalysisEvent, AnalysisEventsResponse
 from src.services.analysis.common import event_filter_where, make_analysis_filters
@@ -13,7 +16,9 @@ from src.services.analysis.events import (
     _apply_impacts,
     _apply_metadata,
     events_to_csv,
+    stream_analysis_events,
 )
+from src.services.analysis.search import EventSearchIndex, keep_event_search_index_fresh
 from src.services.common import ServiceError
 
 
@@ -56,6 +61,95 @@ class AnalysisFilterTests(unittest.TestCase):
             )
 
 
+class AnalysisSearchIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = EventSearchIndex(
+            {
+                "https://sakuna.ph/ndrrmc/event/1": ["Typhoon Enteng", "Quezon City"],
+                "https://sakuna.ph/ndrrmc/event/2": ["Flooding in Marikina"],
+                "https://sakuna.ph/gda/event/3": ["Southwest Monsoon", "Landslide remarks"],
+            }
+        )
+
+    def test_matches_all_terms_by_prefix_and_ignores_accents(self) -> None:
+        self.assertEqual(
+            self.index.search("typh QUEZÓN"),
+            ("https://sakuna.ph/ndrrmc/event/1",),
+        )
+        self.assertEqual(self.index.search("enteng marikina"), ())
+
+    def test_falls_back_to_fuzzy_terms_but_not_iri_text(self) -> None:
+        self.assertEqual(self.index.search("marikna"), ("https://sakuna.ph/ndrrmc/event/2",))
+        self.assertEqual(self.index.search("ndrrmc"), ())
+
+    def test_filter_uses_index_matches_instead_of_string_scan(self) -> None:
+        filters = make_analysis_filters(q="monsoon")
+        with patch("src.services.analysis.search._index", self.index):
+            fragment = event_filter_where(filters)
+
+        self.assertIn("VALUES ?event { <https://sakuna.ph/gda/event/3> }", fragment)
+        self.assertNotIn("CONTAINS", fragment)
+
+    def test_broad_query_keeps_index_matches_in_chunks(self) -> None:
+        index = EventSearchIndex(
+            {f"https://sakuna.ph/ndrrmc/event/{n}": ["Typhoon"] for n in range(5)}
+        )
+        with (
+            patch("src.services.analysis.search._index", index),
+            patch.object(settings, "analysis_search_values_chunk", 2),
+        ):
+            fragment = event_filter_where(make_analysis_filters(q="typhoon"))
+
+        self.assertEqual(fragment.count("VALUES ?event {"), 3)
+        self.assertEqual(fragment.count("\nUNION\n"), 2)
+        for n in range(5):
+            self.assertIn(f"<https://sakuna.ph/ndrrmc/event/{n}>", fragment)
+        self.assertNotIn("CONTAINS", fragment)
+
+    def test_without_index_scans_indexed_text_not_iris(self) -> None:
+        with patch("src.services.analysis.search._index", None):
+            fragment = event_filter_where(make_analysis_filters(q="monsoon"))
+
+        self.assertIn(":eventName :incidentDescription :remarks", fragment)
+        self.assertIn(":hasLocation/rdfs:label", fragment)
+        self.assertNotIn('" ", STR(?event)', fragment)
+
+
+class AnalysisSearchRefreshTests(unittest.IsolatedAsyncioTestCase):
+    async def _run_loop(self, counts: list[int], builds: list[bool]) -> tuple[AsyncMock, list[float]]:
+        """Run the refresh loop for ``len(counts)`` checks; return the rebuild mock and sleeps."""
+        sleeps: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            sleeps.append(delay)
+            if len(sleeps) == len(counts):
+                raise asyncio.CancelledError
+
+        rebuild = AsyncMock(side_effect=builds)
+        with (
+            patch("src.services.analysis.search._event_count", AsyncMock(side_effect=counts)),
+            patch("src.services.analysis.search._rebuild_index", rebuild),
+            patch("src.services.analysis.search.asyncio.sleep", sleep),
+            self.assertRaises(asyncio.CancelledError),
+        ):
+            await keep_event_search_index_fresh()
+        return rebuild, sleeps
+
+    async def test_retries_failed_build_after_short_delay(self) -> None:
+        rebuild, sleeps = await self._run_loop([10, 10], [False, True])
+
+        self.assertEqual(rebuild.await_count, 2)
+        self.assertEqual(
+            sleeps,
+            [settings.analysis_search_retry_seconds, settings.analysis_search_check_seconds],
+        )
+
+    async def test_rebuilds_only_when_event_count_changes(self) -> None:
+        rebuild, _ = await self._run_loop([10, 10, 12], [True, True])
+
+        self.assertEqual(rebuild.await_count, 2)
+
+
 class AnalysisEventMappingTests(unittest.TestCase):
     def setUp(self) -> None:
         self.event = AnalysisEvent(
@@ -150,6 +244,58 @@ class AnalysisEventMappingTests(unittest.TestCase):
         self.assertEqual(row["dead"], "0")
 
 
+class AnalysisEventStreamTests(unittest.IsolatedAsyncioTestCase):
+    async def test_streams_base_events_before_enrichment_patches(self) -> None:
+        event_iri = "https://sakuna.ph/gda/event/stream"
+
+        async def fake_sparql(query: str) -> dict:
+            if "COUNT(DISTINCT ?event)" in query:
+                return _result(_binding(count="41"))
+            if "?kind ?resource" in query:
+                return _result(
+                    _binding(
+                        event=event_iri,
+                        kind="location",
+                        resource="https://sakuna.ph/1300000000",
+                        id="1300000000",
+                        label="NCR",
+                    )
+                )
+            if "?metric ?value ?unit" in query:
+                return _result(_binding(event=event_iri, metric="dead", value="3"))
+            return _result(
+                _binding(
+                    event=event_iri,
+                    eventName="Streamed flood",
+                    eventClass="https://sakuna.ph/MajorEvent",
+                    startDate="2024-07-01",
+                )
+            )
+
+        with patch("src.services.analysis.events.execute_sparql", new=fake_sparql):
+            frames = [
+                json.loads(frame.removeprefix("data: "))
+                async for frame in stream_analysis_events(
+                    filters=make_analysis_filters(q="stream-test"),
+                    page=1,
+                    page_size=25,
+                    sort_by="startDate",
+                    sort_dir="desc",
+                )
+            ]
+
+        self.assertEqual(
+            [frame["type"] for frame in frames],
+            ["events", "total", "patch", "done"],
+        )
+        self.assertEqual(frames[0]["items"][0]["locations"], [])
+        self.assertEqual(frames[1]["total"], 41)
+        patch_item = frames[2]["items"][0]
+        self.assertEqual(patch_item["locations"][0]["id"], "1300000000")
+        self.assertEqual(patch_item["impact"]["dead"], 3)
+        self.assertNotIn("eventName", patch_item)
+
+
 class AnalysisEventRouterTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -197,6 +343,19 @@ class AnalysisEventRouterTests(unittest.TestCase):
         self.assertEqual(response.headers["content-type"], "text/csv; charset=utf-8")
         self.assertIn("attachment", response.headers["content-disposition"])
 
+    def test_stream_reports_service_errors_as_events(self) -> None:
+        async def failing_stream(**_: object):
+            raise ServiceError(502, "Cannot connect to GraphDB")
+            yield
+
+        with patch("src.routers.analysis.stream_analysis_events", new=failing_stream):
+            response = self.client.get("/api/analysis/events/stream")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "text/event-stream; charset=utf-8")
+        self.assertIn('"type": "error"', response.text)
+        self.assertIn('"status": 502', response.text)
+
     def test_invalid_filter_returns_422_without_querying_graphdb(self) -> None:
         response = self.client.get(
             "/api/analysis/events",
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import AsyncMock, patch
 
@@ -12,6 +13,7 @@ from src.schemas.analysis import (
     AnalysisSummaryResponse,
 )
 from src.services.analysis.common import make_analysis_filters
+from src.services.analysis.offload import run_post_processing
 from src.services.analysis.metrics import (
     _region_rankings_query,
     get_damage_histogram,
@@ -91,6 +93,26 @@ class AnalysisMetricServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(scatter.items), 2)
         self.assertEqual(scatter.items[1].affectedPersons, 50)
 
+    @patch("src.services.analysis.metrics.get_all_analysis_events", new_callable=AsyncMock)
+    async def test_large_aggregations_match_inline_results_when_offloaded(self, mocked) -> None:
+        mocked.return_value = _events()
+
+        inline = await get_summary(self.filters)
+        with patch("src.services.analysis.offload.settings.analysis_offload_threshold", 0):
+            offloaded = await get_summary(self.filters)
+
+        self.assertEqual(offloaded, inline)
+
+    async def test_post_processing_uses_worker_thread_only_above_threshold(self) -> None:
+        caller = threading.get_ident()
+
+        with patch("src.services.analysis.offload.settings.analysis_offload_threshold", 10):
+            small = await run_post_processing(threading.get_ident, size=9)
+            large = await run_post_processing(threading.get_ident, size=10)
+
+        self.assertEqual(small, caller)
+        self.assertNotEqual(large, caller)
+
     def test_region_query_uses_shared_filters_and_region_hierarchy(self) -> None:
         query = _region_rankings_query(self.filters)
 
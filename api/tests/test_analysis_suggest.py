@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.schemas.analysis import AnalysisSuggestResponse
+from src.schemas.ontology import TaxonomyNode
+from src.services.analysis.suggest import (
+    SuggestionIndex,
+    _location_entries,
+    _taxonomy_entries,
+)
+
+
+def _binding(**values: str) -> dict[str, dict[str, str]]:
+    return {key: {"value": value} for key, value in values.items()}
+
+
+def _index() -> SuggestionIndex:
+    locations = _location_entries(
+        [
+            _binding(
+                code="1300000000",
+                levelClass="https://sakuna.ph/Region",
+                label="NCR",
+                altLabel="National Capital Region",
+            ),
+            _binding(
+                code="1380600000",
+                levelClass="https://sakuna.ph/City",
+                label="City of Manila",
+                parentLabel="NCR",
+            ),
+            _binding(
+                code="0402100000",
+                levelClass="https://sakuna.ph/Province",
+                label="Cavite",
+                parentLabel="Region IV-A",
+            ),
+            _binding(
+                code="0402109000",
+                levelClass="https://sakuna.ph/Municipality",
+                label="Carmona",
+                parentLabel="Cavite",
+            ),
+        ]
+    )
+    taxonomy = TaxonomyNode(
+        id="root",
+        label="Disaster Types",
+        group="root",
+        definition="",
+        children=[
+            TaxonomyNode(
+                id="Hydrological",
+                label="Hydrological",
+                group="hydrological",
+                definition="",
+                children=[
+                    TaxonomyNode(id="Flood", label="Flood", group="hydrological", definition=""),
+                    TaxonomyNode(
+                        id="FlashFlood",
+                        label="Flash flood",
+                        group="hydrological",
+                        definition="",
+                    ),
+                ],
+            )
+        ],
+    )
+    return SuggestionIndex(locations + _taxonomy_entries(taxonomy))
+
+
+class SuggestionIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = _index()
+
+    def test_ranks_label_prefixes_before_word_matches(self) -> None:
+        items = self.index.suggest("fl")
+
+        self.assertEqual([item.id for item in items], ["Flood", "FlashFlood"])
+        self.assertEqual(items[0].parentLabel, "Hydrological")
+
+    def test_matches_inner_words_and_alt_labels(self) -> None:
+        self.assertEqual(self.index.suggest("manila")[0].id, "1380600000")
+        capital = self.index.suggest("national cap")[0]
+        self.assertEqual(capital.id, "1300000000")
+        self.assertEqual(capital.matchedLabel, "National Capital Region")
+
+    def test_filters_by_kind_and_limit(self) -> None:
+        items = self.index.suggest("ca", kind="location", limit=1)
+
+        self.assertEqual([(item.id, item.level) for item in items], [("0402100000", "Province")])
+        self.assertEqual(self.index.suggest("ca", kind="disasterType"), [])
+
+
+class SuggestionRouterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = TestClient(app)
+
+    def test_suggest_passes_query_kind_and_limit(self) -> None:
+        payload = AnalysisSuggestResponse(q="cav", items=[])
+        with patch(
+            "src.routers.analysis.get_suggestions",
+            new=AsyncMock(return_value=payload),
+        ) as mocked:
+            response = self.client.get(
+                "/api/analysis/suggest",
+                params={"q": "cav", "kind": "location", "limit": 5},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mocked.await_args.args, ("cav",))
+        self.assertEqual(mocked.await_args.kwargs, {"kind": "location", "limit": 5})
+
+    def test_suggest_requires_a_query(self) -> None:
+        response = self.client.get("/api/analysis/suggest")
+
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.ontology.barangays import BarangayIndex, get_psgc_barangays
+
+
+def _index() -> BarangayIndex:
+    return BarangayIndex(
+        [
+            ("1380600003", "Barangay 3", 300, "1380600000", "City of Manila"),
+            ("0402109001", "Bancal", 1200, "0402109000", "Carmona"),
+            ("1380600001", "Barangay 1", 100, "1380600000", "City of Manila"),
+            ("0402109002", "Cabilang Baybay", 0, "0402109000", "Carmona"),
+            ("1380600002", "Barangay 2", 200, "1380600000", "City of Manila"),
+        ]
+    )
+
+
+@patch("src.services.ontology.barangays._load_index", new_callable=AsyncMock)
+class BarangayServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_pages_by_parent_with_code_cursor(self, mocked) -> None:
+        mocked.return_value = _index()
+
+        first = await get_psgc_barangays(parent_code="1380600000", limit=2)
+        second = await get_psgc_barangays(
+            parent_code="1380600000",
+            cursor=first.nextCursor,
+            limit=2,
+        )
+
+        self.assertEqual([item.id for item in first.barangays], ["1380600001", "1380600002"])
+        self.assertEqual(first.total, 3)
+        self.assertEqual(first.nextCursor, "1380600002")
+        self.assertEqual([item.label for item in second.barangays], ["Barangay 3"])
+        self.assertIsNone(second.nextCursor)
+
+    async def test_lists_whole_country_in_code_order(self, mocked) -> None:
+        mocked.return_value = _index()
+
+        page = await get_psgc_barangays(limit=10)
+
+        self.assertEqual(page.total, 5)
+        self.assertEqual(page.barangays[0].parentLabel, "Carmona")
+        self.assertEqual(page.barangays[1].label, "Cabilang Baybay")
+        self.assertEqual(page.barangays[-1].population, 300)
+
+    async def test_unknown_parent_is_an_empty_page(self, mocked) -> None:
+        mocked.return_value = _index()
+
+        page = await get_psgc_barangays(parent_code="0000000000")
+
+        self.assertEqual((page.total, page.barangays, page.nextCursor), (0, [], None))
+
+
+class BarangayRouterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = TestClient(app)
+
+    def test_ndjson_streams_one_barangay_per_line(self) -> None:
+        with patch(
+            "src.services.ontology.barangays._load_index",
+            new=AsyncMock(return_value=_index()),
+        ):
+            response = self.client.get(
+                "/api/ontology/psgc/barangays.ndjson",
+                params={"parent_code": "0402109000"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([row["label"] for row in rows], ["Bancal", "Cabilang Baybay"])
+        self.assertEqual(rows[0]["parentId"], "0402109000")
+
+    def test_rejects_malformed_cursor(self) -> None:
+        response = self.client.get(
+            "/api/ontology/psgc/barangays",
+            params={"cursor": "13806000x1"},
+        )
+
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
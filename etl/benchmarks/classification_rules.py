@@ -0,0 +1,144 @@
+"""Throughput of the disaster classifier's rule layer on GDA and EM-DAT event texts.
+
+    python -m benchmarks.classification_rules
+    python -m benchmarks.classification_rules --gda ../data/raw/static/geog-archive-cleaned.xlsx \\
+        --emdat ../data/raw/emdat/public_emdat.xlsx
+    python -m benchmarks.classification_rules --synthetic 50000
+
+Every text goes through both the compiled RuleMatcher and the per-rule
+substring loop it replaced; the run reports texts/s for each and fails if
+any text gets different labels.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import polars as pl
+
+from semantic_processing.classification_rules import (
+    _WET_CONTEXT, CLASSIFICATION_RULES, ClassificationRule, RuleMatcher
+)
+
+GDA_PATH = "../data/raw/static/geog-archive-cleaned.xlsx"
+EMDAT_DIR = "../data/raw/emdat"
+
+GDA_COLUMNS = ["Disaster Name", "Main Event Disaster Type", "Detailed Description of Disaster Event"]
+EMDAT_COLUMNS = ["Event Name", "Disaster Type", "Disaster Subtype", "Origin", "Associated Types"]
+
+
+def loop_candidates(rules: list[ClassificationRule], text: str) -> list[str]:
+    """The rule layer as a loop over every rule and token."""
+    text_lower = text.lower()
+    seen: set[str] = set()
+    candidates: list[str] = []
+    for rule in rules:
+        tokens, label = rule[0], rule[1]
+        context = rule[2] if len(rule) > 2 else None  # type: ignore[misc]
+        if label in seen:
+            continue
+        if not any(t.lower() in text_lower for t in tokens):
+            continue
+        if context is not None and not any(c.lower() in text_lower for c in context):
+            continue
+        seen.add(label)
+        candidates.append(label)
+    return candidates
+
+
+def _join_columns(rows: list[dict], columns: list[str]) -> list[str]:
+    return [
+        " — ".join(str(row[c]) for c in columns if row.get(c) not in (None, ""))
+        for row in rows
+    ]
+
+
+def gda_texts(path: str) -> list[str]:
+    from transform.gda import load_with_tiered_headers
+
+    df = load_with_tiered_headers(path)
+    columns = [c for c in GDA_COLUMNS if c in df.columns]
+    return _join_columns(df[columns].fillna("").astype(str).to_dict("records"), columns)
+
+
+def emdat_texts(path: str) -> list[str]:
+    df = pl.read_excel(path, sheet_name="EM-DAT Data", infer_schema_length=0)
+    columns = [c for c in EMDAT_COLUMNS if c in df.columns]
+    return _join_columns(df.select(columns).to_dicts(), columns)
+
+
+def synthetic_texts(n: int, seed: int = 11) -> list[str]:
+    """Event-description-shaped texts mixing rule tokens with filler words."""
+    rng = random.Random(seed)
+    tokens = sorted({t for rule in CLASSIFICATION_RULES for t in rule[0]} | set(_WET_CONTEXT))
+    filler = ["the", "municipality", "of", "province", "affected", "families", "due", "to",
+              "reported", "incident", "barangay", "Typhoon", "Odette", "heavy", "damage", "at"]
+    texts = []
+    for _ in range(n):
+        words = rng.choices(filler, k=rng.randint(4, 40))
+        for _ in range(rng.randint(0, 3)):
+            token = rng.choice(tokens)
+            words.insert(rng.randrange(len(words) + 1), token.upper() if rng.random() < 0.2 else token)
+        texts.append(" ".join(words))
+    return texts
+
+
+def _rate(fn, texts: list[str]) -> tuple[list[list[str]], float]:
+    start = time.perf_counter()
+    out = [fn(text) for text in texts]
+    return out, len(texts) / (time.perf_counter() - start)
+
+
+def bench(name: str, texts: list[str]) -> int:
+    """Print throughput for one corpus; return the number of mismatching texts."""
+    start = time.perf_counter()
+    matcher = RuleMatcher(CLASSIFICATION_RULES)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    looped, loop_rate = _rate(lambda t: loop_candidates(CLASSIFICATION_RULES, t), texts)
+    compiled, compiled_rate = _rate(matcher.labels, texts)
+    mismatches = sum(a != b for a, b in zip(looped, compiled))
+    chars = sum(map(len, texts)) / max(len(texts), 1)
+
+    print(f"{name:<10} {len(texts):>8} {chars:>8.0f} {loop_rate:>12.0f} {compiled_rate:>12.0f} "
+          f"{compiled_rate / loop_rate:>7.1f}x {compile_ms:>9.1f} {mismatches:>10}")
+    return mismatches
+
+
+def _latest(directory: str) -> str | None:
+    if not os.path.isdir(directory):
+        return None
+    files = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".xlsx")]
+    return max(files, key=os.path.getmtime) if files else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gda", default=GDA_PATH)
+    parser.add_argument("--emdat", default=None, help="default: latest .xlsx in " + EMDAT_DIR)
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="also time this many synthetic texts")
+    args = parser.parse_args()
+
+    corpora: list[tuple[str, list[str]]] = []
+    if os.path.exists(args.gda):
+        corpora.append(("gda", gda_texts(args.gda)))
+    emdat = args.emdat or _latest(EMDAT_DIR)
+    if emdat and os.path.exists(emdat):
+        corpora.append(("emdat", emdat_texts(emdat)))
+    if args.synthetic:
+        corpora.append(("synthetic", synthetic_texts(args.synthetic)))
+    if not corpora:
+        parser.error("no GDA or EM-DAT file found; pass --gda/--emdat or --synthetic N")
+
+    print(f"{'corpus':<10} {'texts':>8} {'chars':>8} {'loop/s':>12} {'compiled/s':>12} "
+          f"{'speedup':>8} {'compile ms':>9} {'mismatches':>10}")
+    mismatches = sum(bench(name, texts) for name, texts in corpora)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
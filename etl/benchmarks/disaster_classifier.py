@@ -0,0 +1,150 @@
+"""Accuracy and throughput of disaster classifier encoders on a labelled set.
+
+    python -m benchmarks.disaster_classifier --golden ../data/golden/disaster_types.csv
+    python -m benchmarks.disaster_classifier --synthetic 20
+    python -m benchmarks.disaster_classifier \\
+        --encoders all-mpnet-base-v2:torch,all-mpnet-base-v2:onnx-int8,all-MiniLM-L6-v2:onnx-int8 \\
+        --max-drop 0.02
+
+The golden CSV has one row per event or incident text, as the transforms
+build it (NDRRMC event name + report name, DROMIC event name + remarks, GDA
+event name), and the DisasterType label it should get:
+
+    source,text,expected
+    ndrrmc,Tropical Cyclone Odette (Rai) SitRep No. 12,TropicalCyclone
+    dromic,Flashflood Incident in Brgy. Poblacion due to heavy rains,FlashFlood
+
+benchmarks/golden/disaster_types.csv is a small hand-labelled seed of real
+events and is the default; --synthetic labels generated texts instead, one
+per leaf class and source, named after the class's own definition term.
+
+Each encoder ("model:backend", see semantic_processing/encoders.py) runs the
+whole set cold, with the embedding cache off; the first one is the baseline
+the others are compared against. With --max-drop the run exits non-zero when
+an encoder's accuracy falls more than that below the baseline's.
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+
+import polars as pl
+from rdflib import Graph
+
+from semantic_processing.disaster_classifier import ONTOLOGY_PATH, DisasterClassifier, _load_classes
+from semantic_processing.encoders import DEFAULT_MODEL, SMALL_MODEL
+
+DEFAULT_ENCODERS = ",".join([
+    f"{DEFAULT_MODEL}:torch",
+    f"{DEFAULT_MODEL}:onnx-int8",
+    f"{SMALL_MODEL}:torch",
+    f"{SMALL_MODEL}:onnx-int8",
+])
+
+
+SEED_GOLDEN = "benchmarks/golden/disaster_types.csv"
+
+SYNTHETIC_TEMPLATES = {
+    "ndrrmc": "Effects of {term} SitRep No. {n}",
+    "dromic": "{term} Incident in Brgy. {brgy}",
+    "gda": "{year} {term}",
+}
+_BARANGAYS = ["Poblacion", "San Isidro", "San Jose", "Bagong Silang", "Santo Nino", "Malanday"]
+
+
+def synthetic_golden(ontology: str, per_class: int, seed: int = 13) -> list[tuple[str, str, str]]:
+    """Labelled rows shaped like each source's event names, one term per leaf class.
+
+    The term is what the class definition names itself ("Flash flood: ..."),
+    or the split class name when the definition has no such prefix.
+    """
+    rng = random.Random(seed)
+    classes = _load_classes(Graph().parse(ontology))
+    rows = []
+    for definition, label in sorted(classes.items(), key=lambda item: item[1]):
+        head, sep, _ = definition.partition(":")
+        term = head.strip() if sep and len(head) < 40 else " ".join(re.findall(r"[A-Z][a-z]*", label))
+        for _ in range(per_class):
+            for source, template in SYNTHETIC_TEMPLATES.items():
+                text = template.format(term=term, n=rng.randint(1, 40),
+                                       brgy=rng.choice(_BARANGAYS), year=rng.randint(1990, 2024))
+                rows.append((source, text, label))
+    return rows
+
+
+def read_golden(path: str) -> list[tuple[str, str, str]]:
+    df = pl.read_csv(path, infer_schema=False).fill_null("")
+    return list(zip(df["source"], df["text"], df["expected"]))
+
+
+def run_encoder(spec: str, ontology: str, rows: list[tuple[str, str, str]],
+                batch_size: int) -> tuple[list[str], float]:
+    """Predicted labels for every row and the texts/s of the classify call."""
+    model_name, _, backend = spec.partition(":")
+    clf = DisasterClassifier(model_name, ontology, batch_size=batch_size,
+                             cache_path=None, backend=backend or "torch")
+    clf.encoder  # load outside the timed run
+
+    texts = [text for _, text, _ in rows]
+    start = time.perf_counter()
+    predictions = clf.classify(texts)
+    elapsed = time.perf_counter() - start
+    return [label for label, _ in predictions], len(texts) / elapsed
+
+
+def evaluate(specs: list[str], ontology: str, rows: list[tuple[str, str, str]],
+             batch_size: int) -> dict[str, float]:
+    """Print per-source accuracy for every encoder; return overall accuracy per encoder."""
+    sources = sorted({source for source, _, _ in rows})
+    baseline: list[str] | None = None
+    overall: dict[str, float] = {}
+
+    header = f"{'encoder':<40} " + " ".join(f"{s:>8}" for s in sources)
+    print(f"{header} {'all':>8} {'agree':>7} {'texts/s':>9}")
+    for spec in specs:
+        labels, rate = run_encoder(spec, ontology, rows, batch_size)
+        baseline = baseline or labels
+
+        hits: dict[str, list[bool]] = defaultdict(list)
+        for (source, _, expected), label in zip(rows, labels):
+            hits[source].append(label == expected)
+        per_source = " ".join(f"{sum(hits[s]) / len(hits[s]):>8.1%}" for s in sources)
+        overall[spec] = sum(sum(h) for h in hits.values()) / len(rows)
+        agree = sum(a == b for a, b in zip(labels, baseline)) / len(rows)
+        print(f"{spec:<40} {per_source} {overall[spec]:>8.1%} {agree:>7.1%} {rate:>9.0f}")
+    return overall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--golden", default=SEED_GOLDEN)
+    parser.add_argument("--ontology", default=str(ONTOLOGY_PATH))
+    parser.add_argument("--encoders", default=DEFAULT_ENCODERS,
+                        help="comma-separated model:backend list; the first is the baseline")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--max-drop", type=float, default=None,
+                        help="fail if an encoder's accuracy is this far below the baseline's")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="label this many generated texts per class and source instead of --golden")
+    args = parser.parse_args()
+
+    specs = [spec.strip() for spec in args.encoders.split(",") if spec.strip()]
+    if args.synthetic:
+        rows = synthetic_golden(args.ontology, args.synthetic)
+    else:
+        rows = read_golden(args.golden)
+    overall = evaluate(specs, args.ontology, rows, args.batch_size)
+
+    if args.max_drop is not None:
+        floor = overall[specs[0]] - args.max_drop
+        regressed = [spec for spec, acc in overall.items() if acc < floor]
+        if regressed:
+            print(f"accuracy below {floor:.1%}: {', '.join(regressed)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
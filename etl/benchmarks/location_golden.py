@@ -0,0 +1,104 @@
+"""Accuracy and throughput of every location strategy on a labelled golden set.
+
+    python -m benchmarks.location_golden --golden ../data/golden/locations.csv
+    python -m benchmarks.location_golden --synthetic 2000
+
+The golden CSV has one row per location value:
+
+    source,value,expected
+    ndrrmc,"Naujan,Oriental Mindoro,MIMAROPA",https://sakuna.ph/1705210000
+    gda,"Cebu City, VII | Tacloban, VIII",https://sakuna.ph/...|https://sakuna.ph/...
+    emdat,Quezon Cty | mnla,https://sakuna.ph/...|https://sakuna.ph/...
+
+`expected` lists the IRIs the value should resolve to, "|"-separated, and is
+empty when nothing should match. Each source's values go through the
+strategy its transform uses (location_engine.SOURCE_STRATEGIES), on a fresh
+engine so the timing is a cold run. A row counts as correct when the matched
+IRIs are exactly the expected set; "partial" counts rows sharing at least one.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+
+import polars as pl
+
+from benchmarks.location_matcher import _noisy, synthetic_graph
+from semantic_processing.location_engine import SOURCE_STRATEGIES, LocationEngine
+
+
+def synthetic_golden(places: list[tuple[str, str, str, str]], per_source: int,
+                     seed: int = 13) -> list[tuple[str, str, str]]:
+    """Labelled rows shaped like each source's location values."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(per_source):
+        for source in ("ndrrmc", "dromic"):
+            muni, prov, region, iri = rng.choice(places)
+            levels = [_noisy(rng, muni), prov, region]
+            rows.append((source, ",".join(level for level in levels if level), iri))
+
+        picked = rng.sample(places, rng.randint(1, 3))
+        cell = " | ".join(", ".join(x for x in (muni, prov, region) if x) for muni, prov, region, _ in picked)
+        rows.append(("gda", cell, "|".join(dict.fromkeys(iri for *_, iri in picked))))
+
+        picked = rng.sample(places, rng.randint(1, 2))
+        cell = " | ".join(_noisy(rng, muni) for muni, *_ in picked)
+        rows.append(("emdat", cell, "|".join(dict.fromkeys(iri for *_, iri in picked))))
+    return rows
+
+
+def read_golden(path: str) -> list[tuple[str, str, str]]:
+    df = pl.read_csv(path, infer_schema=False).fill_null("")
+    return list(zip(df["source"], df["value"], df["expected"]))
+
+
+def evaluate(graph_path: str, rows: list[tuple[str, str, str]]) -> None:
+    by_source: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    for source, value, expected in rows:
+        by_source[source].append((value, expected))
+
+    print(f"{'source':<8} {'strategy':<13} {'rows':>7} {'accuracy':>9} {'partial':>8} {'rows/s':>10}")
+    for source, labelled in sorted(by_source.items()):
+        strategy = SOURCE_STRATEGIES.get(source, "hierarchical")
+        values = [value for value, _ in labelled]
+
+        engine = LocationEngine(graph_path)
+        engine.strategy(strategy)  # build outside the timed run
+        start = time.perf_counter()
+        matched = engine.match(values, strategy)
+        elapsed = time.perf_counter() - start
+
+        exact = partial = 0
+        for iris, (_, expected) in zip(matched, labelled):
+            want = {iri for iri in expected.split("|") if iri}
+            got = {iri for iri in iris if iri}
+            exact += got == want
+            partial += bool(got & want) or got == want
+        n = len(labelled)
+        print(f"{source:<8} {strategy:<13} {n:>7} {exact / n:>9.1%} {partial / n:>8.1%} "
+              f"{n / elapsed:>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--golden", default="../data/golden/locations.csv")
+    parser.add_argument("--graph", default="../data/rdf/psgc/psgc.ttl")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="label this many rows per source against a synthetic PSGC graph")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        with tempfile.TemporaryDirectory() as tmp:
+            graph_path = os.path.join(tmp, "psgc.ttl")
+            rows = synthetic_golden(synthetic_graph(graph_path), args.synthetic)
+            evaluate(graph_path, rows)
+    else:
+        evaluate(args.graph, read_golden(args.golden))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Throughput of LocationMatcher.match over the location columns of parsed tables.
+
+    python -m benchmarks.location_matcher ../data/parsed/ndrrmc --graph ../data/rdf/psgc/psgc.ttl
+    python -m benchmarks.location_matcher --synthetic 20000
+
+Location strings are built exactly as transform.helpers.load_csv_df does
+("municipality,province,region"), one table at a time, and every table goes
+through one shared matcher, as in a transform run. Cold is the first pass
+over the strings; warm repeats the run with the memo filled.
+"""
+
+import argparse
+import glob
+import os
+import random
+import tempfile
+import time
+
+import polars as pl
+from rdflib import OWL, RDF, RDFS, SKOS, Graph, Literal, Namespace
+
+from parse.table_store import is_table_file, read_table
+from semantic_processing.location_matcher_v2 import LocationMatcher
+
+SKG = Namespace("https://sakuna.ph/")
+
+_REGIONS = ["0100000000", "0200000000", "0300000000", "0400000000", "1700000000",
+            "0500000000", "0600000000", "0700000000", "0800000000", "0900000000",
+            "1000000000", "1100000000", "1200000000", "1600000000", "1300000000",
+            "1400000000", "1900000000"]
+_REGION_LABELS = ["I", "II", "III", "CALABARZON", "MIMAROPA", "V", "VI", "VII", "VIII",
+                  "IX", "X", "XI", "XII", "CARAGA", "NCR", "CAR", "BARMM"]
+_SYLLABLES = ["ba", "ca", "da", "ga", "la", "ma", "na", "pa", "sa", "ta", "san", "sta",
+              "bu", "lo", "ri", "ngo", "wan", "ti", "ya", "hon", "ag", "il"]
+
+
+def _name(rng: random.Random) -> str:
+    word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return word.capitalize()
+
+
+def _add_place(g: Graph, iri, cls: str, level: str, label: str) -> None:
+    g.add((iri, RDF.type, SKG[cls]))
+    g.add((iri, RDF.type, OWL.NamedIndividual))
+    g.add((iri, RDFS.label, Literal(label, lang="en")))
+    g.add((iri, SKG["geographicLevel"], Literal(level)))
+
+
+def synthetic_graph(path: str, seed: int = 7) -> list[tuple[str, str, str, str]]:
+    """
+    Write a PSGC-shaped graph (regions, ~80 provinces, ~1,600 cities and
+    municipalities, repeated names, altLabels, cities under regions) and
+    return its (municipality, province, region, municipality IRI) tuples.
+    """
+    rng = random.Random(seed)
+    g = Graph()
+    places: list[tuple[str, str, str, str]] = []
+    shared_names = [_name(rng) for _ in range(120)]
+
+    for r_idx, (region, region_label) in enumerate(zip(_REGIONS, _REGION_LABELS)):
+        region_iri = SKG[region]
+        _add_place(g, region_iri, "Region", "Reg", region_label)
+        g.add((region_iri, SKG["isPartOf"], SKG["Luzon"]))
+
+        for p_idx in range(5):
+            province = _name(rng)
+            province_iri = SKG[f"{region[:2]}{p_idx + 1:02d}00000000"[:10]]
+            _add_place(g, province_iri, "Province", "Prov", province)
+            g.add((province_iri, SKG["isPartOf"], region_iri))
+            if rng.random() < 0.2:
+                g.add((province_iri, SKOS.altLabel, Literal(province + " del Norte", lang="fil")))
+
+            for m_idx in range(20):
+                is_city = rng.random() < 0.1
+                base = rng.choice(shared_names) if rng.random() < 0.3 else _name(rng)
+                label = f"City of {base}" if is_city else base
+                muni_iri = SKG[f"{region[:2]}{p_idx + 1:02d}{m_idx + 1:02d}000{r_idx % 10}"]
+                if is_city:
+                    _add_place(g, muni_iri, "City", "City", label)
+                else:
+                    _add_place(g, muni_iri, "Municipality", "Mun", label)
+                g.add((muni_iri, SKG["isPartOf"], province_iri))
+                if rng.random() < 0.05:
+                    g.add((muni_iri, SKOS.altLabel, Literal(_name(rng), lang="fil")))
+                places.append((base if is_city else label, province, region_label, str(muni_iri)))
+
+        for h_idx in range(3):  # highly urbanised cities parented to the region
+            base = _name(rng)
+            huc_iri = SKG[f"{region[:2]}99{h_idx + 1:02d}0000"]
+            _add_place(g, huc_iri, "City", "City", f"{base} City")
+            g.add((huc_iri, SKG["isPartOf"], region_iri))
+            places.append((f"{base} City", "", region_label, str(huc_iri)))
+
+    g.serialize(path, format="turtle")
+    return places
+
+
+def _noisy(rng: random.Random, text: str) -> str:
+    roll = rng.random()
+    if not text or roll < 0.7:
+        return text
+    if roll < 0.8:
+        return text.upper()
+    if roll < 0.9 and len(text) > 4:
+        i = rng.randrange(1, len(text) - 1)
+        return text[:i] + text[i + 1:]  # dropped letter
+    return text + " (Capital)"
+
+
+def synthetic_tables(places: list[tuple[str, str, str, str]], rows: int, seed: int = 11) -> list[list[str]]:
+    """Location strings in tables of ~200 rows, with the skew of real reports:
+    a few places repeat often, some labels are misspelt or upper-cased."""
+    rng = random.Random(seed)
+    hot = rng.sample(places, 150)
+    tables, table = [], []
+    for _ in range(rows):
+        muni, prov, region, _ = rng.choice(hot) if rng.random() < 0.6 else rng.choice(places)
+        levels = [_noisy(rng, muni), prov, region] if rng.random() < 0.8 else [prov, region]
+        table.append(",".join(level for level in levels if level))
+        if len(table) >= 200:
+            tables.append(table)
+            table = []
+    return tables + ([table] if table else [])
+
+
+def parsed_tables(folder: str) -> list[list[str]]:
+    tables = []
+    for path in sorted(glob.glob(os.path.join(folder, "**", "*"), recursive=True)):
+        if not is_table_file(path) or os.path.basename(path).startswith("cleaned_"):
+            continue
+        df = read_table(path)
+        df = df.rename({col: col.lower() for col in df.columns})
+        df = df.rename({"city_muni": "municipality"}, strict=False)
+        cols = [c for c in ("municipality", "province", "region") if c in df.columns]
+        if not cols:
+            continue
+        tables.append(
+            df.select(pl.concat_str([pl.col(c).cast(pl.Utf8) for c in cols],
+                                    separator=",", ignore_nulls=True))
+            .to_series().drop_nulls().to_list()
+        )
+    return tables
+
+
+def _run(matcher, tables: list[list[str]]) -> float:
+    start = time.perf_counter()
+    for locations in tables:
+        matcher.match(locations)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", nargs="?", help="parsed output folder (e.g. ../data/parsed/ndrrmc)")
+    parser.add_argument("--graph", default="../data/rdf/psgc/psgc.ttl")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="match this many synthetic rows against a synthetic PSGC graph")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.synthetic:
+            graph_path = os.path.join(tmp, "psgc.ttl")
+            tables = synthetic_tables(synthetic_graph(graph_path), args.synthetic)
+        else:
+            graph_path = args.graph
+            tables = parsed_tables(args.folder or parser.error("folder or --synthetic is required"))
+
+        start = time.perf_counter()
+        matcher = LocationMatcher(graph_path)
+        print(f"matcher built in {time.perf_counter() - start:.2f}s")
+
+    rows = sum(len(t) for t in tables)
+    distinct = len({loc for t in tables for loc in t})
+    print(f"tables: {len(tables)}  rows: {rows}  distinct locations: {distinct}")
+
+    cold = _run(matcher, tables)
+    warm = _run(matcher, tables)
+    print(f"cold  {cold:8.3f} s  {rows / cold:10.0f} rows/s")
+    print(f"warm  {warm:8.3f} s  {rows / warm:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare per-report NDRRMC page extraction: crop-per-lookup vs single pass.
+
+    python -m benchmarks.ndrrmc_pages --limit 10
+    python -m benchmarks.ndrrmc_pages ../data/raw/ndrrmc_new/SomeReport.pdf
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import pdfplumber
+
+from parse.ndrrmc import (
+    HEADER_SEARCH_DISTANCE,
+    INPUT_FOLDER,
+    NARRATIVE_MAX_PAGES,
+    TABLE_SETTINGS,
+    extract_page_records,
+    narrative_dates_from_page_texts,
+)
+
+
+def _crop_per_lookup(pdf_path: str) -> None:
+    """The pre-index access pattern: every lookup crops and re-extracts."""
+    with pdfplumber.open(pdf_path) as pdf:
+        page_texts = [p.extract_text() or "" for p in pdf.pages[:NARRATIVE_MAX_PAGES]]
+    narrative_dates_from_page_texts(page_texts, os.path.basename(pdf_path))
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page.crop((0, page.height - 150, page.width, page.height)).extract_text()
+            page.find_tables(TABLE_SETTINGS)
+            page.extract_text()
+            for table in page.find_tables(TABLE_SETTINGS):
+                top = table.bbox[1]
+                page.crop((0, max(0, top - HEADER_SEARCH_DISTANCE), page.width, top)).extract_text()
+                table.extract()
+                for row in table.rows:
+                    if row.cells and row.cells[0]:
+                        try:
+                            page.crop(row.cells[0]).extract_words()
+                        except ValueError:
+                            pass
+
+
+def _single_pass(pdf_path: str) -> None:
+    records = extract_page_records(pdf_path)
+    narrative_dates_from_page_texts(
+        [r.text for r in records if r.text is not None], os.path.basename(pdf_path))
+
+
+def _time(func, pdf_path: str, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(pdf_path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", help=f"PDFs to time (default: {INPUT_FOLDER})")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(glob.glob(os.path.join(INPUT_FOLDER, "*.pdf")))[: args.limit]
+    total_old = total_new = 0.0
+    for pdf_path in pdfs:
+        old = _time(_crop_per_lookup, pdf_path, args.repeats)
+        new = _time(_single_pass, pdf_path, args.repeats)
+        total_old += old
+        total_new += new
+        print(f"{os.path.basename(pdf_path)[:60]:<60} "
+              f"crop={old:7.2f}s  single-pass={new:7.2f}s  x{old / new:5.2f}")
+    if pdfs:
+        print(f"{'total':<60} crop={total_old:7.2f}s  single-pass={total_new:7.2f}s  "
+              f"x{total_old / total_new:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compare parsed-table CSV against typed Parquet: bytes on disk and load time.
+
+    python -m benchmarks.table_formats ../data/parsed/ndrrmc --kind ndrrmc
+    python -m benchmarks.table_formats --synthetic 200
+
+Each CSV is re-emitted through parse.table_store into a temporary folder, so
+the Parquet side is exactly what `--format parquet` would write.
+"""
+
+import argparse
+import glob
+import os
+import random
+import tempfile
+import time
+
+import polars as pl
+
+from parse.table_store import read_table, text_frame, write_tables
+
+
+def _csv_tables(folder: str) -> list[str]:
+    return sorted(
+        path for path in glob.glob(os.path.join(folder, "**", "*.csv"), recursive=True)
+        if not os.path.basename(path).startswith(("cleaned_", "hakdog"))
+    )
+
+
+def _synthetic_tables(folder: str, count: int) -> list[str]:
+    rng = random.Random(3)
+    columns = ["Page", "Region", "Province", "City_Muni", "Barangay", "Summary_Type",
+               "FAMILIES", "PERSONS", "INSIDE_ECs_FAMILIES", "INSIDE_ECs_PERSONS"]
+    paths = []
+    for index in range(count):
+        rows = [
+            [page, f"REGION {rng.randint(1, 13)}", f"PROVINCE {rng.randint(1, 80)}",
+             f"Municipality {rng.randint(1, 1500)}", None, None,
+             f"{rng.randint(0, 99999):,}", str(rng.randint(0, 500000)),
+             str(rng.randint(0, 999)), str(rng.randint(0, 9999))]
+            for page in range(1, rng.randint(50, 600))
+        ]
+        path = os.path.join(folder, f"event_{index}", "affected_population.csv")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        text_frame(columns, rows).write_csv(path)
+        paths.append(path)
+    return paths
+
+
+def _to_parquet(csv_paths: list[str], root: str, out_root: str, kind: str) -> list[str]:
+    # One write per event folder: write_tables replaces the folder's previous tables.
+    folders: dict[str, dict[str, tuple[list[str], list[list]]]] = {}
+    paths = []
+    for path in csv_paths:
+        df = pl.read_csv(path, infer_schema=False)
+        out_dir = os.path.join(out_root, os.path.relpath(os.path.dirname(path), root))
+        stem = os.path.splitext(os.path.basename(path))[0]
+        folders.setdefault(out_dir, {})[stem] = (df.columns, df.rows())
+        paths.append(os.path.join(out_dir, f"{stem}.parquet"))
+    for out_dir, tables in folders.items():
+        write_tables(out_dir, tables, kind, "parquet")
+    return paths
+
+
+def _load_all(paths: list[str], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for path in paths:
+            read_table(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", nargs="?", help="parsed output folder holding CSV tables")
+    parser.add_argument("--kind", choices=["ndrrmc", "dromic"], default="ndrrmc")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="generate this many synthetic event tables instead")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.synthetic:
+            root = os.path.join(tmp, "csv")
+            csv_paths = _synthetic_tables(root, args.synthetic)
+        else:
+            root = args.folder or parser.error("folder or --synthetic is required")
+            csv_paths = _csv_tables(root)
+
+        start = time.perf_counter()
+        parquet_paths = _to_parquet(csv_paths, root, os.path.join(tmp, "parquet"), args.kind)
+        print(f"tables: {len(csv_paths)}  (parquet write {time.perf_counter() - start:.2f}s)")
+
+        csv_bytes = sum(os.path.getsize(p) for p in csv_paths)
+        parquet_bytes = sum(os.path.getsize(p) for p in parquet_paths)
+        print(f"disk   csv={csv_bytes / 1e6:8.2f} MB  parquet={parquet_bytes / 1e6:8.2f} MB  "
+              f"x{csv_bytes / max(parquet_bytes, 1):.2f}")
+
+        csv_time = _load_all(csv_paths, args.repeats)
+        parquet_time = _load_all(parquet_paths, args.repeats)
+        print(f"load   csv={csv_time:8.3f} s   parquet={parquet_time:8.3f} s   "
+              f"x{csv_time / max(parquet_time, 1e-9):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+# downloader.py — pooled, resumable file downloads for the fetch stage
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+from urllib.parse import unquote
+
+import requests
+
+from http_session import make_session
+
+log = logging.getLogger(__name__)
+
+DOWNLOAD_WORKERS = 4
+CHUNK_SIZE = 1 << 16
+PARTIAL_DIR = ".partial"
+
+
+# =============================================================================
+# FILENAMES
+# =============================================================================
+
+def sanitize_filename(name: str) -> str:
+    return re.sub(r'[<>:"/\\|?*]+', "", name).strip()
+
+
+def resolve_filename(
+    response: requests.Response, url: str, fallback: Optional[str]
+) -> str:
+    """Derive a clean filename from response headers, URL, or fallback hint."""
+    content_disp = response.headers.get("content-disposition", "")
+    if content_disp:
+        match = re.search(r"filename\*\s*=\s*UTF-8''([^;]+)", content_disp)
+        if not match:
+            match = re.search(r'filename="?([^";]+)"?', content_disp)
+        if match:
+            return sanitize_filename(unquote(match.group(1)))
+
+    name = os.path.basename(url.split("?")[0])
+    if name and name.lower() not in ("", "download", "viewer"):
+        return sanitize_filename(name)
+
+    name = fallback or f"downloaded_{int(time.time())}"
+
+    # Append an extension if missing
+    if not os.path.splitext(name)[1]:
+        ctype = response.headers.get("content-type", "")
+        if "pdf" in ctype:
+            name += ".pdf"
+        elif "word" in ctype or ".doc" in url:
+            name += ".docx"
+        else:
+            name += ".bin"
+
+    return sanitize_filename(name)
+
+
+# =============================================================================
+# JOBS
+# =============================================================================
+
+@dataclass
+class DownloadJob:
+    """One file to fetch. ``filename``/``etag``/``last_modified`` come from a
+    previous download and turn the request into a conditional one."""
+    url: str
+    post_url: str = ""
+    page: int = 0
+    filename_hint: Optional[str] = None
+    filename: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class DownloadResult:
+    job: DownloadJob
+    status: str  # "downloaded" | "not_modified" | "failed"
+    filename: Optional[str] = None
+    size: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+class DownloadError(Exception):
+    pass
+
+
+class TransferInterrupted(Exception):
+    """The response started but its body did not arrive in full."""
+
+
+# =============================================================================
+# DOWNLOADER
+# =============================================================================
+
+class Downloader:
+    """
+    Stream files to disk over one pooled session with at most ``workers``
+    requests in flight.
+
+    Bytes go to ``<download_dir>/.partial/<url hash>.part`` and are moved to
+    their final name only when complete. An interrupted transfer is resumed
+    with a Range request (guarded by If-Range on the stored ETag or
+    Last-Modified), and a job carrying validators from an earlier download
+    is sent as a conditional request, so unchanged files cost one 304.
+    """
+
+    def __init__(
+        self,
+        download_dir: Path,
+        workers: int = DOWNLOAD_WORKERS,
+        timeout: float = 30,
+        retries: int = 3,
+        backoff: float = 1.0,
+        chunk_size: int = CHUNK_SIZE,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self.download_dir = Path(download_dir)
+        self.partial_dir = self.download_dir / PARTIAL_DIR
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.chunk_size = chunk_size
+        self.session = session or make_session(self.workers, retries, backoff)
+
+    def _partial_paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        return self.partial_dir / f"{key}.part", self.partial_dir / f"{key}.json"
+
+    def _request_headers(self, job: DownloadJob, part: Path, meta_path: Path) -> tuple[dict[str, str], int]:
+        headers: dict[str, str] = {}
+        if part.exists() and meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            validator = meta.get("etag") or meta.get("last_modified")
+            offset = part.stat().st_size
+            if validator and offset:
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = validator
+                return headers, offset
+
+        if job.filename and (self.download_dir / job.filename).exists():
+            if job.etag:
+                headers["If-None-Match"] = job.etag
+            if job.last_modified:
+                headers["If-Modified-Since"] = job.last_modified
+        return headers, 0
+
+    def _fetch_once(self, job: DownloadJob) -> DownloadResult:
+        part, meta_path = self._partial_paths(job.url)
+        headers, offset = self._request_headers(job, part, meta_path)
+
+        with self.session.get(
+            job.url, headers=headers, stream=True, timeout=self.timeout, allow_redirects=True
+        ) as r:
+            if r.status_code == 304:
+                existing = self.download_dir / job.filename
+                return DownloadResult(
+                    job, "not_modified", filename=job.filename,
+                    size=existing.stat().st_size,
+                    etag=job.etag, last_modified=job.last_modified,
+                )
+
+            if r.status_code == 416:
+                # Stale partial file: drop it and let the retry start over.
+                part.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                raise TransferInterrupted("HTTP 416 on resume")
+
+            content_range = r.headers.get("content-range", "")
+            if r.status_code == 206 and content_range.startswith(f"bytes {offset}-"):
+                mode = "ab"
+            elif r.status_code == 200:
+                mode, offset = "wb", 0
+            else:
+                raise DownloadError(f"HTTP {r.status_code}")
+
+            etag = r.headers.get("etag")
+            last_modified = r.headers.get("last-modified")
+            self.partial_dir.mkdir(parents=True, exist_ok=True)
+            meta_path.write_text(
+                json.dumps({"url": job.url, "etag": etag, "last_modified": last_modified}),
+                encoding="utf-8",
+            )
+            with part.open(mode) as f:
+                try:
+                    for chunk in r.iter_content(self.chunk_size):
+                        f.write(chunk)
+                except requests.RequestException as e:
+                    raise TransferInterrupted(f"{type(e).__name__}: {e}") from e
+
+            filename = resolve_filename(r, job.url, job.filename_hint)
+
+        dest = self.download_dir / filename
+        os.replace(part, dest)
+        meta_path.unlink(missing_ok=True)
+        if offset:
+            log.info("Resumed %s from byte %d", filename, offset)
+        return DownloadResult(
+            job, "downloaded", filename=filename, size=dest.stat().st_size,
+            etag=etag, last_modified=last_modified,
+        )
+
+    def fetch(self, job: DownloadJob) -> DownloadResult:
+        """
+        Download one job, resuming from the partial file after a dropped
+        transfer. Connection errors, 429 and 5xx are retried by the session's
+        adapter; this loop only retries transfers that broke off mid-body.
+        """
+        error = ""
+        for attempt in range(self.retries + 1):
+            try:
+                return self._fetch_once(job)
+            except TransferInterrupted as e:
+                error = str(e)
+                if attempt < self.retries:
+                    log.warning("Download attempt %d broke off for %s (%s) — resuming",
+                                attempt + 1, job.url, error)
+                    time.sleep(self.backoff * 2 ** attempt)
+            except DownloadError as e:
+                error = str(e)
+                break  # a definite answer from the server; retrying won't help
+            except (requests.RequestException, OSError) as e:
+                error = f"{type(e).__name__}: {e}"
+                break  # the adapter has already retried this request
+        log.warning("Download failed (%s): %s", error, job.url)
+        return DownloadResult(job, "failed", error=error)
+
+    def download_all(self, jobs: Iterable[DownloadJob]) -> Iterator[DownloadResult]:
+        """Fetch ``jobs`` concurrently, yielding results as they finish."""
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.fetch, job) for job in jobs]
+            for future in as_completed(futures):
+                yield future.result()
@@ -6,21 +6,14 @@ import argparse
 import json
 import logging
 import os
-import re
 import sys
-import time
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
-from urllib.parse import parse_qs, unquote, urlparse
 
-import requests
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from fetch.downloader import DOWNLOAD_WORKERS, DownloadJob, Downloader
+from fetch.dromic_http import CrawlError, HttpCrawler
 
 log = logging.getLogger(__name__)
 
@@ -44,6 +37,23 @@ def parse_args() -> argparse.Namespace:
         default=100,
         help="Maximum number of listing pages to scrape.",
     )
+    parser.add_argument(
+        "--crawler",
+        choices=("http", "selenium"),
+        default="http",
+        help="List posts over plain HTTP (falls back to Selenium if that fails) or drive Chrome.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DOWNLOAD_WORKERS,
+        help="Concurrent downloads (and post fetches in HTTP mode).",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-check every file in the manifest; unchanged files are skipped via ETag/Last-Modified.",
+    )
     return parser.parse_args()
 
 
@@ -58,12 +68,16 @@ class ManifestEntry:
     downloaded_at: str  # ISO-8601
     post_url: str
     page: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 @dataclass
 class Manifest:
     last_scrape_date: Optional[str] = None
     entries: list[ManifestEntry] = field(default_factory=list)
+    # Crawled posts whose download has not succeeded yet; retried next run.
+    pending: list[DownloadJob] = field(default_factory=list)
 
 
 def load_manifest(path: Path) -> Manifest:
@@ -79,6 +93,7 @@ def load_manifest(path: Path) -> Manifest:
     return Manifest(
         last_scrape_date=data.get("last_scrape_date"),
         entries=[ManifestEntry(**entry) for entry in data.get("entries", [])],
+        pending=[DownloadJob(**job) for job in data.get("pending", [])],
     )
 
 
@@ -89,6 +104,7 @@ def save_manifest(path: Path, manifest: Manifest) -> None:
             {
                 "last_scrape_date": manifest.last_scrape_date,
                 "entries": [asdict(entry) for entry in manifest.entries],
+                "pending": [asdict(job) for job in manifest.pending],
             },
             f,
             indent=2,
@@ -100,258 +116,73 @@ def save_manifest(path: Path, manifest: Manifest) -> None:
 # HELPERS
 # =============================================================================
 
-def get_post_date(driver: WebDriver) -> datetime:
-    """Return the publication datetime of the currently loaded post."""
-    date_el = driver.find_element(By.CSS_SELECTOR, "span.published.updated")
-    return datetime.strptime(date_el.text.strip(), "%B %d, %Y")
-
-
-def make_direct_download_link(url: str) -> str:
-    """Rewrite viewer/embed URLs to direct download links where possible."""
-    if "/document/d/" in url:
-        file_id = url.split("/document/d/")[1].split("/")[0]
-        return f"https://docs.google.com/document/d/{file_id}/export?format=docx"
-
-    if "docs.google.com/viewer" in url:
-        qs = parse_qs(urlparse(url).query)
-        if "url" in qs:
-            actual_url = unquote(qs["url"][0])
-            log.info("Extracted direct file URL: %s", actual_url)
-            return actual_url
-
-    return url
-
-
-def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]+', "", name).strip()
-
-
-def resolve_filename(
-    response: requests.Response, url: str, fallback: Optional[str]
-) -> str:
-    """Derive a clean filename from response headers, URL, or fallback hint."""
-    content_disp = response.headers.get("content-disposition", "")
-    if content_disp:
-        match = re.search(r"filename\*\s*=\s*UTF-8''([^;]+)", content_disp)
-        if not match:
-            match = re.search(r'filename="?([^";]+)"?', content_disp)
-        if match:
-            return sanitize_filename(unquote(match.group(1)))
-
-    name = os.path.basename(url.split("?")[0])
-    if name and name.lower() not in ("", "download", "viewer"):
-        return sanitize_filename(name)
-
-    name = fallback or f"downloaded_{int(time.time())}"
-
-    # Append an extension if missing
-    if not os.path.splitext(name)[1]:
-        ctype = response.headers.get("content-type", "")
-        if "pdf" in ctype:
-            name += ".pdf"
-        elif "word" in ctype or ".doc" in url:
-            name += ".docx"
-        else:
-            name += ".bin"
-
-    return sanitize_filename(name)
-
-
-def download_file(
-    url: str,
+def download_jobs(
+    jobs: list[DownloadJob],
     download_dir: Path,
     manifest: Manifest,
-    post_url: str,
-    page: int,
-    filename_hint: Optional[str] = None,
-) -> bool:
-    """Download a file, record it in the manifest, and return success."""
-    try:
-        r = requests.get(url, timeout=30, allow_redirects=True)
-        if r.status_code != 200:
-            log.warning("Skipped (HTTP %d): %s", r.status_code, url)
-            return False
-
-        filename = resolve_filename(r, url, filename_hint)
-        dest = download_dir / filename
-
-        log.info("Downloading → %s", filename)
-        dest.write_bytes(r.content)
-        log.info("Saved: %s", filename)
-
-        manifest.entries.append(
-            ManifestEntry(
-                filename=filename,
-                download_url=url,
-                downloaded_at=datetime.now(timezone.utc).isoformat(timespec="seconds") + "Z",
-                post_url=post_url,
-                page=page
-            )
-        )
-        return True
-
-    except Exception:
-        log.exception("Download error: %s", url)
-        return False
-
-
-def extract_first_download_link(driver: WebDriver) -> tuple[Optional[str], Optional[str]]:
-    """Return (download_url, link_text) for the first attachable file in the post."""
-    selectors = [
-        "div.post-content a[href*='.pdf']",
-        "div.post-content a[href*='.docx']",
-        "div.post-content a[href*='.doc']",
-        "div.post-content a[href*='docs.google.com']",
-        ".wp-block-file a[href]",
-        "p.embed_download a[href]",
-    ]
-
-    title = driver.find_element(By.CSS_SELECTOR, "h1.post-title")
-    log.info("Post title: %s", title.text.strip())
-
-    for sel in selectors:
-        elems = driver.find_elements(By.CSS_SELECTOR, sel)
-        if elems:
-            href = elems[0].get_attribute("href")
-            text = elems[0].text.strip() or "downloaded_file"
-            if href:
-                return make_direct_download_link(href), text
-
-    return None, None
-
-
-# =============================================================================
-# PAGE HANDLING
-# =============================================================================
-
-def handle_page(
-    driver: WebDriver,
-    wait: WebDriverWait[WebDriver],
-    scraped_urls: set[str],
-    manifest: Manifest,
     manifest_path: Path,
-    last_scrape_date: datetime,
-    download_dir: Path,
-    page: int
-) -> bool:
+    workers: int = DOWNLOAD_WORKERS,
+) -> int:
     """
-    Process all posts on the current listing page.
-
-    Returns True if the scraper should stop (post published date is older then last scraped date meaning we've gone past new content).
+    Download ``jobs`` concurrently and record each success in the manifest
+    as it lands. Failed jobs stay in ``manifest.pending`` for the next run.
+    Returns the number of files written.
     """
-    read_mores = driver.find_elements(
-        By.XPATH, "//a[contains(.,'Read More')] | //button[contains(.,'Read More')]"
-    )
-    log.info("Found %d posts on page", len(read_mores))
-
-
-    for i in range(len(read_mores)):
-        # Re-query after each navigation to avoid stale element refs
-        read_mores = driver.find_elements(
-            By.XPATH, "//a[contains(.,'Read More')] | //button[contains(.,'Read More')]"
-        )
-        if i >= len(read_mores):
-            break
-
-        btn = read_mores[i]
-        post_url = btn.get_attribute("href")
-        
-        if not post_url: 
-            log.info("Skipping a post. No read more found")
+    by_url = {entry.download_url: entry for entry in manifest.entries}
+    pending = {job.url: job for job in manifest.pending}
+    pending.update((job.url, job) for job in jobs if job.url not in by_url or job.filename)
+    manifest.pending = list(pending.values())
+    save_manifest(manifest_path, manifest)
+
+    written = 0
+    downloader = Downloader(download_dir, workers=workers)
+    for result in downloader.download_all(list(pending.values())):
+        job = result.job
+        if not result.ok:
             continue
 
-        driver.execute_script("arguments[0].scrollIntoView(true);", btn)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", btn)
-
-        navigated_away = False
-        try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.post-content")))
-            navigated_away = True  # driver is now on the post page
-
-            post_date = get_post_date(driver)
-            log.info("Post date: %s", post_date.date())
-
-            if post_date <= last_scrape_date:
-                log.info("Post is older than last scrape date — stopping")
-
-                driver.back()
-                wait.until(EC.presence_of_all_elements_located(
-                    (By.XPATH, "//a[contains(.,'Read More')]")
-                ))
-                return True
-            
-            elif post_url in scraped_urls:
-                log.info("Skipping. Post already scraped.")
-                navigated_away = False
-                driver.back()
-                wait.until(EC.presence_of_all_elements_located(
-                    (By.XPATH, "//a[contains(.,'Read More')]")
-                ))
-
-            else:
-
-                file_url, file_name = extract_first_download_link(driver)
-
-                if file_url:
-                    success = download_file(file_url, download_dir, manifest, post_url, page,  file_name)
-                    if success:
-                        scraped_urls.add(post_url)
-                        save_manifest(manifest_path, manifest)
-                else:
-                    log.warning("No downloadable link found for: %s", post_url)
-
-        except Exception:
-            log.exception("Error processing post: %s", post_url)
-
-        finally:
-            # Always return to the listing page if we navigated away
-            if navigated_away:
-                try:
-                    driver.back()
-                    wait.until(EC.presence_of_all_elements_located(
-                        (By.XPATH, "//a[contains(.,'Read More')]")
-                    ))
-                    time.sleep(1)
-                except Exception:
-                    log.exception("Failed to navigate back to listing page")
-
-    return False
-
-
-def goto_page(
-    driver: WebDriver, wait: WebDriverWait[WebDriver], page_num: int, retries: int = 2
-) -> bool:
-    """
-    Click the pagination link for page_num. Returns False only when the link
-    genuinely doesn't exist (i.e. no more pages). Retries on transient errors.
-    """
-    for attempt in range(1, retries + 1):
-        try:
-            el = wait.until(
-                EC.element_to_be_clickable((
-                    By.XPATH,
-                    f"//ul[contains(@class,'pagination')]//li//*[normalize-space()='{page_num}']",
-                ))
-            )
-            driver.execute_script("arguments[0].scrollIntoView();", el)
-            el.click()
-            wait.until(
-                EC.presence_of_all_elements_located(
-                    (By.XPATH, "//a[contains(.,'Read More')]")
+        pending.pop(job.url, None)
+        if result.status == "downloaded":
+            written += 1
+            log.info("Saved: %s", result.filename)
+            entry = by_url.get(job.url)
+            if entry is None:
+                entry = by_url[job.url] = ManifestEntry(
+                    filename=result.filename or "",
+                    download_url=job.url,
+                    downloaded_at="",
+                    post_url=job.post_url,
+                    page=job.page,
                 )
-            )
-            return True
-        except Exception as e:
-            if attempt < retries:
-                log.warning(
-                    "goto_page(%d) attempt %d failed (%s) — retrying",
-                    page_num, attempt, e,
-                )
-                time.sleep(2)
-            else:
-                log.info("Pagination link for page %d not found — assuming last page", page_num)
-    return False
+                manifest.entries.append(entry)
+            entry.filename = result.filename or entry.filename
+            entry.downloaded_at = datetime.now(timezone.utc).isoformat(timespec="seconds") + "Z"
+            entry.etag = result.etag
+            entry.last_modified = result.last_modified
+        else:
+            log.info("Unchanged: %s", result.filename)
+
+        manifest.pending = list(pending.values())
+        save_manifest(manifest_path, manifest)
+
+    if manifest.pending:
+        log.warning("%d downloads failed; they will be retried next run", len(manifest.pending))
+    return written
+
+
+def refresh_jobs(manifest: Manifest) -> list[DownloadJob]:
+    """Conditional re-download jobs for every file already in the manifest."""
+    return [
+        DownloadJob(
+            url=entry.download_url,
+            post_url=entry.post_url,
+            page=entry.page,
+            filename=entry.filename,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+        )
+        for entry in manifest.entries
+    ]
 
 
 # =============================================================================
@@ -393,54 +224,32 @@ def main() -> None:
 
     scraped_urls: set[str] = {
         entry.post_url for entry in manifest.entries if entry.post_url
-    }
-
-    opts = Options()
-    opts.add_experimental_option(
-        "prefs",
-        {
-            "download.default_directory": str(download_dir.resolve()),
-            "download.prompt_for_download": False,
-            "safebrowsing.enabled": True,
-        },
-    )
-
-    driver = WebDriver(options=opts)
-    wait = WebDriverWait(driver, 10)
+    } | {job.post_url for job in manifest.pending if job.post_url}
+    jobs: list[DownloadJob] = refresh_jobs(manifest) if args.refresh else []
 
-    base_url = f"https://dromic.dswd.gov.ph/category/situation-reports/{args.year}/"
-
-    if args.page:
-        base_url += f"page/{args.page}"
-
-    driver.get(base_url)
-
-    page = args.page if args.page else 1
+    start_page = args.page if args.page else 1
     try:
-        while page <= args.max_pages:
-            log.info("Processing page %d", page)
-
-            should_stop = handle_page(
-                driver=driver,
-                wait=wait,
-                scraped_urls=scraped_urls,
-                manifest=manifest,
-                manifest_path=manifest_path,
-                last_scrape_date=last_scrape_date,
-                download_dir=download_dir,
-                page=page
-            )
-
-            if should_stop:
-                break
-
-            page += 1
-
-            if not goto_page(driver, wait, page):
-                log.info("No more pages")
-                break
+        if args.crawler == "http":
+            crawler = HttpCrawler(args.year, workers=args.workers)
+            try:
+                crawler.crawl(jobs, scraped_urls, last_scrape_date, start_page, args.max_pages)
+            except CrawlError as e:
+                log.warning("HTTP crawl failed (%s) — falling back to Selenium from page %d",
+                            e, crawler.page)
+                from fetch.dromic_selenium import crawl_with_selenium
+
+                crawl_with_selenium(args.year, download_dir, jobs, scraped_urls,
+                                    last_scrape_date, crawler.page, args.max_pages)
+        else:
+            from fetch.dromic_selenium import crawl_with_selenium
+
+            crawl_with_selenium(args.year, download_dir, jobs, scraped_urls,
+                                last_scrape_date, start_page, args.max_pages)
     finally:
-        driver.quit()
+        # Crawling only collected links; fetch everything it found, plus
+        # anything a previous run failed to download.
+        written = download_jobs(jobs, download_dir, manifest, manifest_path, args.workers)
+        log.info("Downloaded %d files", written)
         manifest.last_scrape_date = datetime.now(timezone.utc).strftime("%Y-%m-%d, %H:%M:%S")
         save_manifest(manifest_path, manifest)
         log.info("Done. Manifest written to: %s", manifest_path)
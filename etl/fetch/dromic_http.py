@@ -0,0 +1,205 @@
+# dromic_http.py — browser-free crawler for the DROMIC situation-report archive
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urljoin, urlparse
+
+import requests
+from lxml import html as lxml_html
+
+from fetch.downloader import DOWNLOAD_WORKERS, DownloadJob
+from http_session import make_session
+
+log = logging.getLogger(__name__)
+
+LISTING_URL = "https://dromic.dswd.gov.ph/category/situation-reports/{year}/"
+POST_DATE_FORMAT = "%B %d, %Y"
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath equivalents of the CSS selectors the Selenium crawler uses, in the
+# same priority order.
+READ_MORE_XPATH = "//a[contains(., 'Read More')][@href]"
+POST_TITLE_XPATH = f"//h1[{_has_class('post-title')}]"
+POST_DATE_XPATH = f"//span[{_has_class('published')} and {_has_class('updated')}]"
+ATTACHMENT_XPATHS = [
+    f"//div[{_has_class('post-content')}]//a[contains(@href, '.pdf')]",
+    f"//div[{_has_class('post-content')}]//a[contains(@href, '.docx')]",
+    f"//div[{_has_class('post-content')}]//a[contains(@href, '.doc')]",
+    f"//div[{_has_class('post-content')}]//a[contains(@href, 'docs.google.com')]",
+    f"//*[{_has_class('wp-block-file')}]//a[@href]",
+    f"//p[{_has_class('embed_download')}]//a[@href]",
+]
+
+
+class CrawlError(Exception):
+    """The archive could not be read over plain HTTP (blocked, changed
+    markup, network failure); callers fall back to the browser crawler."""
+
+
+def make_direct_download_link(url: str) -> str:
+    """Rewrite viewer/embed URLs to direct download links where possible."""
+    if "/document/d/" in url:
+        file_id = url.split("/document/d/")[1].split("/")[0]
+        return f"https://docs.google.com/document/d/{file_id}/export?format=docx"
+
+    if "docs.google.com/viewer" in url:
+        qs = parse_qs(urlparse(url).query)
+        if "url" in qs:
+            actual_url = unquote(qs["url"][0])
+            log.info("Extracted direct file URL: %s", actual_url)
+            return actual_url
+
+    return url
+
+
+def listing_page_url(year: int, page: int = 1) -> str:
+    base_url = LISTING_URL.format(year=year)
+    return base_url if page <= 1 else f"{base_url}page/{page}/"
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+@dataclass
+class Post:
+    url: str
+    title: str
+    date: Optional[datetime]
+    file_url: Optional[str]
+    file_name: Optional[str]
+
+
+def parse_listing(page_html: str, base_url: str) -> list[str]:
+    """Post URLs behind the listing page's 'Read More' links, in page order."""
+    tree = lxml_html.fromstring(page_html)
+    urls = [urljoin(base_url, a.get("href")) for a in tree.xpath(READ_MORE_XPATH)]
+    return list(dict.fromkeys(urls))
+
+
+def parse_post(page_html: str, url: str) -> Post:
+    """Title, publication date and first attachable file of a post page."""
+    tree = lxml_html.fromstring(page_html)
+
+    title_els = tree.xpath(POST_TITLE_XPATH)
+    title = title_els[0].text_content().strip() if title_els else ""
+
+    date = None
+    date_els = tree.xpath(POST_DATE_XPATH)
+    if date_els:
+        date = datetime.strptime(date_els[0].text_content().strip(), POST_DATE_FORMAT)
+
+    for xpath in ATTACHMENT_XPATHS:
+        links = tree.xpath(xpath)
+        if links:
+            href = links[0].get("href")
+            text = links[0].text_content().strip() or "downloaded_file"
+            if href:
+                return Post(url, title, date, make_direct_download_link(urljoin(url, href)), text)
+
+    return Post(url, title, date, None, None)
+
+
+# =============================================================================
+# CRAWLER
+# =============================================================================
+
+class HttpCrawler:
+    """
+    Walks the archive listing pages with plain GET requests and parses the
+    HTML, fetching the posts of each listing page concurrently. Stop and
+    skip rules match the Selenium crawler: posts are visited in page
+    order, the crawl stops at the first post not newer than
+    ``last_scrape_date``, and already-scraped posts are skipped.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        session: Optional[requests.Session] = None,
+        workers: int = DOWNLOAD_WORKERS,
+        timeout: float = 30,
+    ) -> None:
+        self.year = year
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.session = session or make_session(self.workers)
+        self.page = 1  # listing page being crawled, for resuming elsewhere
+
+    def _get(self, url: str) -> requests.Response:
+        r = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+        r.encoding = r.encoding or "utf-8"
+        return r
+
+    def _post(self, url: str) -> Optional[Post]:
+        try:
+            r = self._get(url)
+            r.raise_for_status()
+            return parse_post(r.text, url)
+        except Exception:
+            log.exception("Error processing post: %s", url)
+            return None
+
+    def crawl(
+        self,
+        jobs: list[DownloadJob],
+        scraped_urls: set[str],
+        last_scrape_date: datetime,
+        start_page: int = 1,
+        max_pages: int = 100,
+    ) -> None:
+        """Append a DownloadJob for every new post to ``jobs``."""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for page in range(start_page, max_pages + 1):
+                self.page = page
+                url = listing_page_url(self.year, page)
+                log.info("Processing page %d", page)
+                try:
+                    r = self._get(url)
+                except requests.RequestException as e:
+                    raise CrawlError(f"listing page {page}: {e}") from e
+
+                if r.status_code == 404 and page > start_page:
+                    log.info("No more pages")
+                    return
+                if r.status_code != 200:
+                    raise CrawlError(f"listing page {page}: HTTP {r.status_code}")
+
+                post_urls = parse_listing(r.text, r.url)
+                log.info("Found %d posts on page", len(post_urls))
+                if not post_urls:
+                    if page == start_page:
+                        raise CrawlError(f"no posts found on listing page {page}")
+                    log.info("No more pages")
+                    return
+
+                for post in executor.map(self._post, post_urls):
+                    if post is None:
+                        continue
+                    if post.date is None:
+                        log.warning("No publication date on post: %s", post.url)
+                        continue
+
+                    log.info("Post date: %s", post.date.date())
+                    if post.date <= last_scrape_date:
+                        log.info("Post is older than last scrape date — stopping")
+                        return
+                    if post.url in scraped_urls:
+                        log.info("Skipping. Post already scraped.")
+                        continue
+                    if not post.file_url:
+                        log.warning("No downloadable link found for: %s", post.url)
+                        continue
+
+                    log.info("Post title: %s", post.title)
+                    jobs.append(DownloadJob(post.file_url, post.url, page, post.file_name))
+                    scraped_urls.add(post.url)
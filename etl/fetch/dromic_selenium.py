@@ -0,0 +1,239 @@
+# dromic_selenium.py — Chrome-driven crawler, the fallback for fetch.dromic
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from fetch.downloader import DownloadJob
+from fetch.dromic_http import listing_page_url, make_direct_download_link
+
+log = logging.getLogger(__name__)
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def get_post_date(driver: WebDriver) -> datetime:
+    """Return the publication datetime of the currently loaded post."""
+    date_el = driver.find_element(By.CSS_SELECTOR, "span.published.updated")
+    return datetime.strptime(date_el.text.strip(), "%B %d, %Y")
+
+
+def extract_first_download_link(driver: WebDriver) -> tuple[Optional[str], Optional[str]]:
+    """Return (download_url, link_text) for the first attachable file in the post."""
+    selectors = [
+        "div.post-content a[href*='.pdf']",
+        "div.post-content a[href*='.docx']",
+        "div.post-content a[href*='.doc']",
+        "div.post-content a[href*='docs.google.com']",
+        ".wp-block-file a[href]",
+        "p.embed_download a[href]",
+    ]
+
+    title = driver.find_element(By.CSS_SELECTOR, "h1.post-title")
+    log.info("Post title: %s", title.text.strip())
+
+    for sel in selectors:
+        elems = driver.find_elements(By.CSS_SELECTOR, sel)
+        if elems:
+            href = elems[0].get_attribute("href")
+            text = elems[0].text.strip() or "downloaded_file"
+            if href:
+                return make_direct_download_link(href), text
+
+    return None, None
+
+
+# =============================================================================
+# PAGE HANDLING
+# =============================================================================
+
+def handle_page(
+    driver: WebDriver,
+    wait: WebDriverWait[WebDriver],
+    scraped_urls: set[str],
+    jobs: list[DownloadJob],
+    last_scrape_date: datetime,
+    page: int
+) -> bool:
+    """
+    Collect a download job for every new post on the current listing page.
+
+    Returns True if the scraper should stop (post published date is older then last scraped date meaning we've gone past new content).
+    """
+    read_mores = driver.find_elements(
+        By.XPATH, "//a[contains(.,'Read More')] | //button[contains(.,'Read More')]"
+    )
+    log.info("Found %d posts on page", len(read_mores))
+
+
+    for i in range(len(read_mores)):
+        # Re-query after each navigation to avoid stale element refs
+        read_mores = driver.find_elements(
+            By.XPATH, "//a[contains(.,'Read More')] | //button[contains(.,'Read More')]"
+        )
+        if i >= len(read_mores):
+            break
+
+        btn = read_mores[i]
+        post_url = btn.get_attribute("href")
+        
+        if not post_url: 
+            log.info("Skipping a post. No read more found")
+            continue
+
+        driver.execute_script("arguments[0].scrollIntoView(true);", btn)
+        time.sleep(0.5)
+        driver.execute_script("arguments[0].click();", btn)
+
+        navigated_away = False
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.post-content")))
+            navigated_away = True  # driver is now on the post page
+
+            post_date = get_post_date(driver)
+            log.info("Post date: %s", post_date.date())
+
+            if post_date <= last_scrape_date:
+                log.info("Post is older than last scrape date — stopping")
+
+                driver.back()
+                wait.until(EC.presence_of_all_elements_located(
+                    (By.XPATH, "//a[contains(.,'Read More')]")
+                ))
+                return True
+            
+            elif post_url in scraped_urls:
+                log.info("Skipping. Post already scraped.")
+                navigated_away = False
+                driver.back()
+                wait.until(EC.presence_of_all_elements_located(
+                    (By.XPATH, "//a[contains(.,'Read More')]")
+                ))
+
+            else:
+
+                file_url, file_name = extract_first_download_link(driver)
+
+                if file_url:
+                    jobs.append(DownloadJob(file_url, post_url, page, file_name))
+                    scraped_urls.add(post_url)
+                else:
+                    log.warning("No downloadable link found for: %s", post_url)
+
+        except Exception:
+            log.exception("Error processing post: %s", post_url)
+
+        finally:
+            # Always return to the listing page if we navigated away
+            if navigated_away:
+                try:
+                    driver.back()
+                    wait.until(EC.presence_of_all_elements_located(
+                        (By.XPATH, "//a[contains(.,'Read More')]")
+                    ))
+                    time.sleep(1)
+                except Exception:
+                    log.exception("Failed to navigate back to listing page")
+
+    return False
+
+
+def goto_page(
+    driver: WebDriver, wait: WebDriverWait[WebDriver], page_num: int, retries: int = 2
+) -> bool:
+    """
+    Click the pagination link for page_num. Returns False only when the link
+    genuinely doesn't exist (i.e. no more pages). Retries on transient errors.
+    """
+    for attempt in range(1, retries + 1):
+        try:
+            el = wait.until(
+                EC.element_to_be_clickable((
+                    By.XPATH,
+                    f"//ul[contains(@class,'pagination')]//li//*[normalize-space()='{page_num}']",
+                ))
+            )
+            driver.execute_script("arguments[0].scrollIntoView();", el)
+            el.click()
+            wait.until(
+                EC.presence_of_all_elements_located(
+                    (By.XPATH, "//a[contains(.,'Read More')]")
+                )
+            )
+            return True
+        except Exception as e:
+            if attempt < retries:
+                log.warning(
+                    "goto_page(%d) attempt %d failed (%s) — retrying",
+                    page_num, attempt, e,
+                )
+                time.sleep(2)
+            else:
+                log.info("Pagination link for page %d not found — assuming last page", page_num)
+    return False
+
+
+# =============================================================================
+# CRAWL
+# =============================================================================
+
+def crawl_with_selenium(
+    year: int,
+    download_dir: Path,
+    jobs: list[DownloadJob],
+    scraped_urls: set[str],
+    last_scrape_date: datetime,
+    start_page: int = 1,
+    max_pages: int = 100,
+) -> None:
+    """Walk the listing pages in Chrome, appending a DownloadJob per new post."""
+    opts = Options()
+    opts.add_experimental_option(
+        "prefs",
+        {
+            "download.default_directory": str(download_dir.resolve()),
+            "download.prompt_for_download": False,
+            "safebrowsing.enabled": True,
+        },
+    )
+
+    driver = WebDriver(options=opts)
+    wait = WebDriverWait(driver, 10)
+
+    driver.get(listing_page_url(year, start_page))
+
+    page = start_page
+    try:
+        while page <= max_pages:
+            log.info("Processing page %d", page)
+
+            should_stop = handle_page(
+                driver=driver,
+                wait=wait,
+                scraped_urls=scraped_urls,
+                jobs=jobs,
+                last_scrape_date=last_scrape_date,
+                page=page
+            )
+
+            if should_stop:
+                break
+
+            page += 1
+
+            if not goto_page(driver, wait, page):
+                log.info("No more pages")
+                break
+    finally:
+        driver.quit()
@@ -0,0 +1,28 @@
+# http_session.py — pooled requests sessions with retries, shared by every stage
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "SakunaGraPH-etl/1.0"
+
+
+def make_session(workers: int = 4, retries: int = 3, backoff: float = 1.0,
+                 allowed_methods: tuple[str, ...] = ("GET",)) -> requests.Session:
+    """Session with a connection pool sized for ``workers`` threads and
+    backoff retries on connection errors, 429 and 5xx for ``allowed_methods``
+    (only list a method like POST when repeating the request is safe)."""
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=allowed_methods,
+    )
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
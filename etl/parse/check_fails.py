@@ -1,9 +1,15 @@
 """
 check_parsed.py — Quality check for parsed DROMIC event folders.
-Lists subfolders that contain a CSV with a number in its filename
-(e.g. table_1.csv, number_of_affected_1.csv) which indicates a
+Lists subfolders that contain a table (CSV or Parquet) with a number in its
+filename (e.g. table_1.csv, number_of_affected_1.parquet) which indicates a
 duplicate/split table that needs reprocessing.
 
+When the multi-year driver (parse.dromic_driver) has run, its queue is read
+as well: failed files are listed with their last error, and files the queue
+marks done are added to `_parsed.txt`. Only the checked year's queue rows
+are read; with --dir the year is the folder name (e.g. .../dromic/2018), or
+--year when the folder is named otherwise.
+
 Usage:
     python check_parsed.py --year 2018
     python check_parsed.py --dir ../data/parsed/dromic/2018
@@ -12,13 +18,32 @@ Usage:
 import argparse
 import json
 import re
+import sqlite3
 from pathlib import Path
 
+QUEUE_PATH = Path("../data/parsed/dromic/_queue.sqlite")
+
+
+def queue_rows(queue_path: Path, year: str, status: str) -> list[tuple]:
+    """(name, attempts, duration_s, error) of ``year``'s queued files with ``status``."""
+    if not queue_path.exists():
+        return []
+    conn = sqlite3.connect(f"file:{queue_path}?mode=ro", uri=True)
+    try:
+        return conn.execute(
+            "SELECT name, attempts, duration_s, error FROM files "
+            "WHERE status = ? AND year = ? ORDER BY name",
+            (status, year),
+        ).fetchall()
+    finally:
+        conn.close()
+
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--year", default=None)
     parser.add_argument("--dir",  default=None)
+    parser.add_argument("--queue", type=Path, default=QUEUE_PATH)
     args = parser.parse_args()
 
     base = (
@@ -30,6 +55,10 @@ def main() -> None:
         print(f"[ERROR] Directory not found: {base}")
         return
 
+    year = args.year or (base.name if re.fullmatch(r"\d{4}", base.name) else None)
+    if year is None:
+        print(f"[WARN] No year for {base}; pass --year to read the queue")
+
     subfolders = sorted(p for p in base.iterdir() if p.is_dir())
     print(f"Checking {len(subfolders)} folders in {base}\n")
 
@@ -39,8 +68,8 @@ def main() -> None:
 
     for folder in subfolders:
         numbered = [
-            c.name for c in folder.glob("*.csv")
-            if re.search(r'_\d+\.csv$', c.name)
+            c.name for c in folder.iterdir()
+            if re.search(r'_\d+\.(csv|parquet)$', c.name)
         ]
         if numbered:
             flagged.append((folder.name, numbered))
@@ -84,12 +113,30 @@ def main() -> None:
     else:
         print("All folders look clean - no numbered duplicate CSVs found.")
 
+    failed = queue_rows(args.queue, year, "failed") if year else []
+    if failed:
+        print(f"\n{'='*60}")
+        print(f"FAILED IN QUEUE ({len(failed)} files):")
+        print(f"{'='*60}")
+        for name, attempts, duration, error in failed:
+            last_line = (error or "").strip().splitlines()[-1:] or [""]
+            print(f"  {name}  (attempts={attempts}, {duration or 0:.1f}s)")
+            print(f"      {last_line[0]}")
+
+    done = queue_rows(args.queue, year, "done") if year else []
+    for name, *_ in done:
+        if ".docx" in name:
+            name = name.replace(".docx", "").replace(".doc", "")
+        if name not in already_parsed:
+            already_parsed.append(name)
+
     if already_parsed:
         src_out = base / "_parsed.txt"
         src_out.write_text("\n".join(already_parsed), encoding="utf-8")
         print(f"Source filenames written to: {src_out}")
 
-    print(f"\nSummary: {len(flagged)} folders flagged / {len(subfolders)} total")
+    print(f"\nSummary: {len(flagged)} folders flagged / {len(subfolders)} total"
+          f", {len(failed)} failed in queue")
 
 
 if __name__ == "__main__":
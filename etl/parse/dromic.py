@@ -1,9 +1,16 @@
 import argparse
+import hashlib
 import os
-from typing import Any
+import time
+from importlib.metadata import version as package_version
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Iterator
 from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode, TableStructureOptions
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.pipeline_options import (
+    AcceleratorDevice, AcceleratorOptions, PdfPipelineOptions, TableFormerMode, TableStructureOptions,
+)
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.settings import settings as docling_settings
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 import pandas as pd
 from pandas import DataFrame
@@ -18,6 +25,8 @@ import json
 import torch
 from docling_core.types.doc.document import DoclingDocument
 
+from parse.table_store import TABLE_FORMATS, frame_rows, write_tables
+
 
 os.environ["PYTHONUTF8"] = "1"
 SIMILARITY_THRESHOLD = 0.95
@@ -810,36 +819,152 @@ def split_merged_rows(df: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame(new_rows, columns=df.columns)
 
 
-# Main loop ──────────────────────────────────────────────────────────────
+# Converter ──────────────────────────────────────────────────────────────
 
-device = "cuda" if torch.cuda.is_available() else "cpu"
-print(f"Using device: {device}")  # should print 'cuda'
+DOC_BATCH_SIZE = 4       # documents handed to Docling per convert_all batch
+CONVERT_THREADS = os.cpu_count() or 1   # torch intra-op threads for one converter
 
-pipeline_options = PdfPipelineOptions()
-pipeline_options.do_ocr = False
-pipeline_options.do_table_structure = True
+DOCLING_CACHE_FOLDER = Path("../data/cache/docling")   # DoclingDocument JSON per PDF hash
 
-pipeline_options.table_structure_options = TableStructureOptions(
-    do_cell_matching=True,
-    mode=TableFormerMode.ACCURATE  # can afford ACCURATE on GPU
-)
+_converter: DocumentConverter | None = None
+# (threads, batch size) get_converter builds with; worker initializers set it.
+_converter_options: tuple[int, int] = (CONVERT_THREADS, DOC_BATCH_SIZE)
 
-pipeline_options.generate_page_images = False
-pipeline_options.generate_picture_images = False
-pipeline_options.images_scale = 1.0
 
-converter = DocumentConverter(
-    format_options={
-        InputFormat.PDF: PdfFormatOption(
-            pipeline_options=pipeline_options,
-            backend=PyPdfiumDocumentBackend)
-    }
-)
+def build_converter(num_threads: int = CONVERT_THREADS,
+                    batch_size: int = DOC_BATCH_SIZE) -> DocumentConverter:
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    print(f"Using device: {device} ({num_threads} threads)")
+
+    # TableFormer runs through torch; on CPU, oversubscribed intra-op
+    # threads are slower than fewer threads per converter process.
+    torch.set_num_threads(num_threads)
+    docling_settings.perf.doc_batch_size = batch_size
+
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = False
+    pipeline_options.do_table_structure = True
+    pipeline_options.accelerator_options = AcceleratorOptions(
+        num_threads=num_threads, device=AcceleratorDevice.AUTO)
+
+    pipeline_options.table_structure_options = TableStructureOptions(
+        do_cell_matching=True,
+        mode=TableFormerMode.ACCURATE  # can afford ACCURATE on GPU
+    )
+
+    pipeline_options.generate_page_images = False
+    pipeline_options.generate_picture_images = False
+    pipeline_options.images_scale = 1.0
+
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_options=pipeline_options,
+                backend=PyPdfiumDocumentBackend)
+        }
+    )
+
+
+def get_converter() -> DocumentConverter:
+    global _converter
+    if _converter is None:
+        _converter = build_converter(*_converter_options)
+    return _converter
+
+
+# Docling output cache ───────────────────────────────────────────────────
+
+def file_sha256(path: Path, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(block_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def docling_cache_path(pdf_path: Path, cache_dir: Path = DOCLING_CACHE_FOLDER,
+                       digest: str | None = None) -> Path:
+    """Cache file for a PDF's DoclingDocument, keyed by content hash and Docling version."""
+    digest = digest or file_sha256(pdf_path)
+    return cache_dir / f"{digest}-docling{package_version('docling')}.json"
+
+
+def load_cached_document(cache_path: Path | None) -> DoclingDocument | None:
+    if cache_path is None or not cache_path.exists():
+        return None
+    try:
+        return DoclingDocument.load_from_json(cache_path)
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable Docling cache {cache_path.name}: {e}")
+        return None
+
+
+def save_cached_document(cache_path: Path | None, doc: DoclingDocument) -> None:
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    doc.save_as_json(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+
+def _cache_path(pdf_path: Path, cache_dir: Path | None) -> Path | None:
+    """The PDF's cache file, hashing it once; None when caching is off."""
+    return docling_cache_path(pdf_path, cache_dir) if cache_dir is not None else None
+
+
+def load_or_convert(pdf_path: Path, cache_dir: Path | None = DOCLING_CACHE_FOLDER) -> DoclingDocument:
+    cache_path = _cache_path(pdf_path, cache_dir)
+    doc = load_cached_document(cache_path)
+    if doc is None:
+        doc = get_converter().convert(pdf_path).document
+        save_cached_document(cache_path, doc)
+    return doc
+
+
+def convert_batches(pdf_paths: list[Path],
+                    batch_size: int = DOC_BATCH_SIZE,
+                    cache_dir: Path | None = DOCLING_CACHE_FOLDER) -> Iterator[tuple[Path, DoclingDocument | None, str | None]]:
+    """
+    Convert PDFs through Docling ``batch_size`` documents at a time.
+    Cached documents are yielded first without starting a converter.
+    Yields (path, document, None) on success and (path, None, error) on failure.
+    """
+    to_convert: list[Path] = []
+    cache_paths: dict[Path, Path | None] = {}
+    for path in pdf_paths:
+        cache_paths[path] = _cache_path(path, cache_dir)
+        doc = load_cached_document(cache_paths[path])
+        if doc is None:
+            to_convert.append(path)
+        else:
+            yield path, doc, None
+    if not to_convert:
+        return
+
+    converter = get_converter()
+    for start in range(0, len(to_convert), batch_size):
+        batch = to_convert[start:start + batch_size]
+        for result in converter.convert_all(batch, raises_on_error=False):
+            path = Path(result.input.file)
+            if result.status in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+                cache_path = cache_paths.get(path)
+                if cache_path is None and cache_dir is not None:
+                    cache_path = _cache_path(path, cache_dir)
+                save_cached_document(cache_path, result.document)
+                yield path, result.document, None
+            else:
+                errors = "; ".join(e.error_message for e in result.errors) or str(result.status)
+                yield path, None, errors
+
 
-def process_file(pdf_path: Path, output_dir: Path):
+# Main loop ──────────────────────────────────────────────────────────────
 
-    result = converter.convert(pdf_path)
-    doc = result.document
+def process_file(pdf_path: Path, output_dir: Path, table_format: str = "csv",
+                 doc: DoclingDocument | None = None):
+
+    if doc is None:
+        doc = load_or_convert(pdf_path)
 
     manifest_path = pdf_path.parent / "manifest.json"  # or per-file json
     event = extract_report_metadata(doc, pdf_path, manifest_path)
@@ -1140,27 +1265,38 @@ def process_file(pdf_path: Path, output_dir: Path):
             final_to_save.append(table_i)
 
     # Final Save
+    to_write: dict[str, tuple[list[str], list[list]]] = {}
     for item in final_to_save:
         df = item["df"]
-        filename = item["filename"]
-        
-        # Final safety check for duplicate filenames in the same folder
+        stem = Path(item["filename"]).stem
+
+        # Final safety check for duplicate filenames within this report; a
+        # rerun overwrites the report's previous tables rather than adding _1 copies.
         counter = 1
-        original_stem = Path(filename).stem
-        while (output_dir / filename).exists():
-            filename = f"{original_stem}_{counter}.csv"
+        original_stem = stem
+        while stem in to_write:
+            stem = f"{original_stem}_{counter}"
             counter += 1
 
-        
-        if not df["municipality"].isna().all():    
-            df.to_csv(output_dir / filename, index=False)
-        print(f"Saved: {filename} ({len(df)} rows)")
+        if not df["municipality"].isna().all():
+            to_write[stem] = frame_rows(df)
+        print(f"Saved: {stem}.{table_format} ({len(df)} rows)")
+
+    write_tables(str(output_dir), to_write, "dromic", table_format)
 
 
 def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument("--single")
     parser.add_argument("--year", required=True)
+    parser.add_argument("--format", choices=TABLE_FORMATS, default="csv", dest="table_format")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="converter processes; each gets cpu_count / workers torch threads")
+    parser.add_argument("--batch-size", type=int, default=DOC_BATCH_SIZE,
+                        help="documents per Docling convert_all batch")
+    parser.add_argument("--reprocess", action="store_true",
+                        help="ignore _parsed.txt, e.g. to rerun table post-processing "
+                             "over cached Docling output")
     return parser.parse_args()
 
 def load_parsed_files(sub_data_dir: str) -> set[str]:
@@ -1171,26 +1307,15 @@ def load_parsed_files(sub_data_dir: str) -> set[str]:
     with open(source_filenames_path, encoding="utf-8") as f:
         return {line.strip() for line in f if line.strip()}
 
-def main() -> None:
-    args = parse_args()
-
-    input_dir = Path(f"../data/raw/dromic-new/{args.year}-pdf")
-    output_dir =  Path(f"../data/parsed/dromic/{args.year}")
-
-    if args.single:
-        process_file(Path(os.path.join(input_dir,args.single)), output_dir)
-        return
-
-
-    files = list(input_dir.glob("*"))
+def pending_files(input_dir: Path, output_dir: Path,
+                  reprocess: bool = False) -> tuple[list[Path], int]:
+    """PDFs in ``input_dir`` not yet listed in ``_parsed.txt``, and the number skipped."""
+    already_parsed = set() if reprocess else load_parsed_files(str(output_dir))
+    pending: list[Path] = []
     skipped = 0
-    parsed = 0
-
-    already_parsed = load_parsed_files(str(output_dir))
-    for file in files:
+    for file in sorted(input_dir.glob("*")):
         if file.suffix != ".pdf":
             continue
-        
 
         sanitized_name = file.name
 
@@ -1201,17 +1326,78 @@ def main() -> None:
         if sanitized_name in already_parsed:
             skipped += 1
             continue
-        
-
+        pending.append(file)
+    return pending, skipped
+
+def convert_and_process(files: list[Path], output_dir: Path, table_format: str,
+                        batch_size: int) -> dict[str, int]:
+    """Run one converter over ``files``; returns parsed / failed / page counts."""
+    stats = {"parsed": 0, "failed": 0, "pages": 0}
+    for file, doc, error in convert_batches(files, batch_size):
         print(file)
-        # parsed += 1
+        if doc is None:
+            stats["failed"] += 1
+            print(f"[ERROR] {file.name}: {error}")
+            continue
+        stats["pages"] += doc.num_pages()
         try:
-            process_file(file, output_dir)
-            parsed += 1
+            process_file(file, output_dir, table_format, doc=doc)
+            stats["parsed"] += 1
         except Exception as e:
+            stats["failed"] += 1
             print(f"[ERROR] {file.name}: {e}")
+    return stats
+
+def _init_converter(num_threads: int, batch_size: int) -> None:
+    """Size the converter a worker builds on its first Docling cache miss."""
+    global _converter_options
+    _converter_options = (num_threads, batch_size)
+
+def run_workers(files: list[Path], output_dir: Path, table_format: str,
+                batch_size: int, workers: int) -> dict[str, int]:
+    """
+    Split ``files`` across ``workers`` converter processes, largest PDFs
+    first and dealt round-robin so each shard gets a similar page load.
+    """
+    files = sorted(files, key=lambda f: f.stat().st_size, reverse=True)
+    shards = [files[i::workers] for i in range(workers) if files[i::workers]]
+    threads = max(1, CONVERT_THREADS // workers)
+    totals = {"parsed": 0, "failed": 0, "pages": 0}
+    with ProcessPoolExecutor(max_workers=len(shards), initializer=_init_converter,
+                             initargs=(threads, batch_size)) as executor:
+        futures = [
+            executor.submit(convert_and_process, shard, output_dir, table_format, batch_size)
+            for shard in shards
+        ]
+        for future in as_completed(futures):
+            for key, value in future.result().items():
+                totals[key] += value
+    return totals
 
-    print(f"Serialized {parsed} events → {output_dir} (skipped {skipped})")
+def main() -> None:
+    args = parse_args()
+
+    input_dir = Path(f"../data/raw/dromic-new/{args.year}-pdf")
+    output_dir =  Path(f"../data/parsed/dromic/{args.year}")
+
+    if args.single:
+        process_file(Path(os.path.join(input_dir,args.single)), output_dir, args.table_format)
+        return
+
+    files, skipped = pending_files(input_dir, output_dir, args.reprocess)
+
+    started = time.perf_counter()
+    if args.workers > 1:
+        stats = run_workers(files, output_dir, args.table_format, args.batch_size, args.workers)
+    else:
+        stats = convert_and_process(files, output_dir, args.table_format, args.batch_size)
+    elapsed = time.perf_counter() - started
+
+    print(f"Serialized {stats['parsed']} events → {output_dir} "
+          f"(skipped {skipped}, failed {stats['failed']})")
+    if elapsed > 0:
+        print(f"Throughput: {stats['pages']} pages in {elapsed:.1f}s "
+              f"= {stats['pages'] / elapsed:.2f} pages/s")
 
 
 if __name__ == "__main__":
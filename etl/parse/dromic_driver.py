@@ -0,0 +1,343 @@
+"""
+dromic_driver.py — Parse several years of DROMIC PDFs from a durable work queue.
+
+Every PDF that still needs parsing is recorded in a SQLite queue with its
+status (pending / running / done / failed), attempt count, page count,
+duration and last error.  Worker processes claim batches from the queue, so
+a crashed or interrupted run resumes where it stopped.  A claimed row records
+its owner (host and pid) and a lease the worker renews as it finishes files;
+at start-up, `running` rows whose owner process is gone or whose lease has
+expired are returned to `pending`, so a second driver on the same queue
+leaves files another one is still parsing alone.  Finished files are also
+appended to the year's `_parsed.txt` for the single-year runner.
+
+Usage:
+    python -m parse.dromic_driver --years 2018-2023 --workers 4
+    python -m parse.dromic_driver --years 2021,2023 --retry-failed
+    python -m parse.dromic_driver --status
+"""
+
+import argparse
+import os
+import socket
+import sqlite3
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+RAW_DIR = "../data/raw/dromic-new"
+PARSED_DIR = "../data/parsed/dromic"
+QUEUE_PATH = Path(PARSED_DIR) / "_queue.sqlite"
+
+# How long a claim stays valid without the worker renewing it.
+LEASE_SECONDS = 2 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path        TEXT PRIMARY KEY,
+    year        TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'pending',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    pages       INTEGER,
+    duration_s  REAL,
+    error       TEXT,
+    started_at  TEXT,
+    finished_at TEXT,
+    owner       TEXT,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS files_status ON files (status, size);
+"""
+
+# Columns added after the first release, for queues created before them.
+MIGRATIONS = {"owner": "TEXT", "lease_until": "REAL"}
+
+
+# Queue ──────────────────────────────────────────────────────────────────
+
+def open_queue(db_path: Path = QUEUE_PATH) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+    for column, kind in MIGRATIONS.items():
+        if column not in columns:
+            conn.execute(f"ALTER TABLE files ADD COLUMN {column} {kind}")
+    return conn
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def parse_years(spec: str) -> list[str]:
+    """'2018-2020,2023' → ['2018', '2019', '2020', '2023']"""
+    years: list[str] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            start, end = part.split("-", 1)
+            years.extend(str(y) for y in range(int(start), int(end) + 1))
+        elif part:
+            years.append(part)
+    return years
+
+
+def enqueue_years(conn: sqlite3.Connection, years: list[str]) -> int:
+    """Add every unparsed PDF of ``years``; files already queued keep their state."""
+    from parse.dromic import pending_files
+
+    added = 0
+    for year in years:
+        input_dir = Path(RAW_DIR) / f"{year}-pdf"
+        if not input_dir.exists():
+            print(f"[WARN] No input folder for {year}: {input_dir}")
+            continue
+        files, _ = pending_files(input_dir, Path(PARSED_DIR) / year)
+        for file in files:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO files (path, year, name, size) VALUES (?, ?, ?, ?)",
+                (str(file.resolve()), year, file.name, file.stat().st_size),
+            )
+            added += cur.rowcount
+    return added
+
+
+def _owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_alive(owner: str | None) -> bool:
+    """
+    Whether the process that claimed a row may still be running. Only a
+    process on this host can be checked; elsewhere, and on Windows where
+    signalling a pid would terminate it, the lease decides.
+    """
+    if not owner:
+        return False
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or os.name == "nt":
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        return True
+    return True
+
+
+def recover(conn: sqlite3.Connection, retry_failed: bool = False) -> int:
+    """
+    Return rows a dead run left ``running`` (and optionally failed ones) to
+    pending. A running row is reclaimed only when its owner is gone or its
+    lease has expired.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        now = time.time()
+        rows = conn.execute(
+            "SELECT path, owner, lease_until FROM files WHERE status = 'running'"
+        ).fetchall()
+        stale = [
+            (path,) for path, owner, lease_until in rows
+            if lease_until is None or lease_until < now or not _owner_alive(owner)
+        ]
+        conn.executemany(
+            "UPDATE files SET status = 'pending', owner = NULL, lease_until = NULL "
+            "WHERE path = ?",
+            stale,
+        )
+        recovered = len(stale)
+        if retry_failed:
+            recovered += conn.execute(
+                "UPDATE files SET status = 'pending' WHERE status = 'failed'"
+            ).rowcount
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return recovered
+
+
+def claim(conn: sqlite3.Connection, limit: int,
+          lease: float = LEASE_SECONDS) -> list[tuple[str, str]]:
+    """Atomically mark up to ``limit`` pending files running, largest first,
+    owned by this process for ``lease`` seconds."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        rows = conn.execute(
+            "SELECT path, year FROM files WHERE status = 'pending' "
+            "ORDER BY size DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        conn.executemany(
+            "UPDATE files SET status = 'running', attempts = attempts + 1, "
+            "started_at = ?, finished_at = NULL, duration_s = NULL, error = NULL, "
+            "owner = ?, lease_until = ? WHERE path = ?",
+            [(_now(), _owner(), time.time() + lease, path) for path, _ in rows],
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return rows
+
+
+def renew(conn: sqlite3.Connection, paths: list[str], lease: float = LEASE_SECONDS) -> None:
+    """Extend this process's lease on the ``paths`` it still holds."""
+    conn.executemany(
+        "UPDATE files SET lease_until = ? WHERE path = ? AND status = 'running' AND owner = ?",
+        [(time.time() + lease, path, _owner()) for path in paths],
+    )
+
+
+def finish(conn: sqlite3.Connection, path: str, *, ok: bool, duration: float,
+           pages: int | None = None, error: str | None = None) -> None:
+    conn.execute(
+        "UPDATE files SET status = ?, duration_s = ?, pages = ?, error = ?, finished_at = ?, "
+        "owner = NULL, lease_until = NULL WHERE path = ?",
+        ("done" if ok else "failed", round(duration, 3), pages, error, _now(), path),
+    )
+
+
+def status_counts(conn: sqlite3.Connection) -> list[tuple[str, str, int, float]]:
+    return conn.execute(
+        "SELECT year, status, COUNT(*), COALESCE(SUM(duration_s), 0) "
+        "FROM files GROUP BY year, status ORDER BY year, status"
+    ).fetchall()
+
+
+def pending_count(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) FROM files WHERE status = 'pending'").fetchone()[0]
+
+
+def _mark_parsed(year: str, name: str) -> None:
+    """Append to the year's ``_parsed.txt`` so ``parse.dromic --year`` skips it too."""
+    out_dir = Path(PARSED_DIR) / year
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Same sanitising as parse.dromic.pending_files.
+    sanitized = name.replace(".docx", "").replace(".doc", "") if ".docx" in name else name
+    with open(out_dir / "_parsed.txt", "a", encoding="utf-8") as f:
+        f.write(sanitized + "\n")
+
+
+# Workers ────────────────────────────────────────────────────────────────
+
+def _init_worker(num_threads: int, batch_size: int) -> None:
+    from parse.dromic import _init_converter
+
+    _init_converter(num_threads, batch_size)
+
+
+def worker_loop(db_path: Path, table_format: str, batch_size: int,
+                lease: float = LEASE_SECONDS) -> dict[str, int]:
+    """Claim and process batches until the queue has no pending files."""
+    from parse.dromic import convert_batches, process_file
+
+    conn = open_queue(db_path)
+    stats = {"done": 0, "failed": 0, "pages": 0}
+    while batch := claim(conn, batch_size, lease):
+        years = dict(batch)
+        started = time.perf_counter()
+        seen: set[str] = set()
+        try:
+            for file, doc, error in convert_batches([Path(p) for p, _ in batch], batch_size):
+                path = str(Path(file).resolve())
+                year = years[path]
+                seen.add(path)
+                pages = doc.num_pages() if doc is not None else None
+                if doc is not None:
+                    try:
+                        process_file(file, Path(PARSED_DIR) / year, table_format, doc=doc)
+                    except Exception:
+                        error = traceback.format_exc(limit=5)
+                now = time.perf_counter()
+                finish(conn, path, ok=error is None, duration=now - started,
+                       pages=pages, error=error)
+                renew(conn, [p for p in years if p not in seen], lease)
+                started = now
+                if error is None:
+                    _mark_parsed(year, file.name)
+                    stats["done"] += 1
+                    stats["pages"] += pages or 0
+                else:
+                    stats["failed"] += 1
+                    print(f"[ERROR] {file.name}: {error.strip().splitlines()[-1]}")
+        except Exception:
+            # The converter itself failed: fail whatever the batch had left.
+            error = traceback.format_exc(limit=5)
+            for path, _ in batch:
+                if path not in seen:
+                    finish(conn, path, ok=False, duration=time.perf_counter() - started,
+                           error=error)
+                    stats["failed"] += 1
+    conn.close()
+    return stats
+
+
+# CLI ────────────────────────────────────────────────────────────────────
+
+def print_status(conn: sqlite3.Connection) -> None:
+    print(f"{'year':<6} {'status':<8} {'files':>6} {'seconds':>9}")
+    for year, status, count, seconds in status_counts(conn):
+        print(f"{year:<6} {status:<8} {count:>6} {seconds:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parse DROMIC PDFs for several years from a resumable queue")
+    parser.add_argument("--years", help="e.g. 2018-2023 or 2019,2021")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv", dest="table_format")
+    parser.add_argument("--queue", type=Path, default=QUEUE_PATH)
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="put failed files back in the queue")
+    parser.add_argument("--lease-hours", type=float, default=LEASE_SECONDS / 3600,
+                        help="how long a claimed file stays with its worker without progress "
+                             "before another run may take it over")
+    parser.add_argument("--status", action="store_true", help="print queue counts and exit")
+    args = parser.parse_args()
+
+    conn = open_queue(args.queue)
+    if args.status:
+        print_status(conn)
+        return
+
+    recovered = recover(conn, args.retry_failed)
+    added = enqueue_years(conn, parse_years(args.years)) if args.years else 0
+    pending = pending_count(conn)
+    print(f"Queue: {added} added, {recovered} returned to pending, {pending} pending")
+    conn.close()
+    if not pending:
+        return
+
+    workers = min(args.workers, pending)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    totals = {"done": 0, "failed": 0, "pages": 0}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(threads, args.batch_size)) as executor:
+        futures = [
+            executor.submit(worker_loop, args.queue, args.table_format, args.batch_size,
+                            args.lease_hours * 3600)
+            for _ in range(workers)
+        ]
+        for future in as_completed(futures):
+            for key, value in future.result().items():
+                totals[key] += value
+    elapsed = time.perf_counter() - started
+
+    print(f"\nParsed {totals['done']} files, {totals['failed']} failed, "
+          f"{totals['pages']} pages in {elapsed:.1f}s "
+          f"({totals['pages'] / elapsed if elapsed else 0:.2f} pages/s)")
+    print_status(open_queue(args.queue))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,19 @@
 import os
+import io
+import csv
 import pdfplumber
 import pandas as pd
 import numpy as np
 import re
 import json
 import argparse
+import fnmatch
+import hashlib
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from parse.table_store import TABLE_FORMATS, dict_rows, write_tables
 
 # --------------------------
 # CONFIGURATION
@@ -23,6 +29,23 @@ OCR_RESOLUTION = 300        # DPI for page rasterisation
 OCR_CONF_THRESHOLD = 30     # ignore Tesseract words with confidence below this
 OCR_Y_CLUSTER_TOLERANCE = 8  # pixels: words within this vertical distance → same line
 OCR_X_COL_TOLERANCE = 15    # pixels: gap larger than this between words → column break
+OCR_TESSERACT_CONFIG = "--oem 3 --psm 11"   # sparse text — good for mixed layout pages
+OCR_CACHE_FOLDER = "../data/cache/ocr"      # Tesseract TSV output, keyed by PDF hash + page + bbox
+OCR_THREADS = os.cpu_count() or 1           # concurrent Tesseract runs when prefetching pages
+PAGE_CHUNK_SIZE = 16        # pages per parallel task; larger PDFs are split into ranges
+NARRATIVE_MAX_PAGES = 5     # leading pages searched for narrative text and dates
+WORD_GRID_CELL = 50         # points: cell size of the per-page word index
+LINE_Y_TOLERANCE = 3        # points: words whose tops differ by less share a line
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 5,
+}
+
+# Bump whenever a change to the parsing logic should invalidate earlier output.
+PARSER_VERSION = "2"
+MANIFEST_FILENAME = "_manifest.json"
+OUTPUT_FORMAT = "csv"       # "csv" or typed "parquet" tables (see parse/table_store.py)
 
 
 # -----------------------------------------------------------------------
@@ -45,7 +68,10 @@ class LayoutOCR:
     def __init__(self, resolution: int = OCR_RESOLUTION,
                  conf_threshold: int = OCR_CONF_THRESHOLD,
                  y_tol: int = OCR_Y_CLUSTER_TOLERANCE,
-                 x_col_tol: int = OCR_X_COL_TOLERANCE):
+                 x_col_tol: int = OCR_X_COL_TOLERANCE,
+                 config: str = OCR_TESSERACT_CONFIG,
+                 cache_folder: str | None = OCR_CACHE_FOLDER,
+                 threads: int = OCR_THREADS):
         try:
             import pytesseract
             pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
@@ -59,22 +85,138 @@ class LayoutOCR:
         self.conf_threshold = conf_threshold
         self.y_tol = y_tol
         self.x_col_tol = x_col_tol
+        self.config = config
+        self.cache_folder = cache_folder
+        self.threads = max(1, threads)
+        self._pdf_digests: dict[str, str] = {}
+        self._last_raster = None   # (pdf path, page number, image) of the last page rasterised
 
     # ------------------------------------------------------------------
     # Low-level helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _page_key(pdfplumber_page) -> tuple:
+        return (getattr(pdfplumber_page.pdf, "path", None), pdfplumber_page.page_number)
+
     def _rasterise(self, pdfplumber_page):
-        """Convert a pdfplumber page to a PIL Image."""
-        return pdfplumber_page.to_image(resolution=self.resolution).original
+        """Convert a pdfplumber page to a PIL Image, reusing the last page's image."""
+        key = self._page_key(pdfplumber_page)
+        if self._last_raster is not None and self._last_raster[:2] == key:
+            return self._last_raster[2]
+        img = pdfplumber_page.to_image(resolution=self.resolution).original
+        self._last_raster = (*key, img)
+        return img
+
+    def _crop_to_bbox(self, img, pdfplumber_page, table_bbox):
+        """Crop a rasterised page to a PDF-point bbox plus a small margin."""
+        pw = pdfplumber_page.width
+        ph = pdfplumber_page.height
+        iw, ih = img.size
+        sx = iw / pw
+        sy = ih / ph
+        x0, top, x1, bottom = table_bbox
+        px0, ptop, px1, pbottom = int(x0*sx), int(top*sy), int(x1*sx), int(bottom*sy)
+        # add small margin
+        margin = int(4 * sx)
+        px0 = max(0, px0 - margin)
+        ptop = max(0, ptop - margin)
+        px1 = min(iw, px1 + margin)
+        pbottom = min(ih, pbottom + margin)
+        return img.crop((px0, ptop, px1, pbottom))
 
-    def _get_words_df(self, pil_image) -> pd.DataFrame:
-        """Run Tesseract and return a filtered DataFrame of words with geometry."""
-        df = self.pytesseract.image_to_data(
-            pil_image,
-            output_type=self.pytesseract.Output.DATAFRAME,
-            config="--oem 3 --psm 11",   # sparse text — good for mixed layout pages
+    # ------------------------------------------------------------------
+    # OCR result cache
+    # ------------------------------------------------------------------
+
+    def remember_digest(self, pdf_path, digest: str) -> None:
+        """Use a SHA-256 the caller already has instead of hashing the PDF again."""
+        self._pdf_digests[os.fspath(pdf_path)] = digest
+
+    def _cache_path(self, pdfplumber_page, table_bbox=None) -> str | None:
+        """
+        Cache file for one Tesseract run, or None when caching is off or the
+        page was not opened from a file.  The key covers everything that
+        changes Tesseract's output: PDF content, page, region, DPI and config.
+        """
+        path = getattr(pdfplumber_page.pdf, "path", None)
+        if not self.cache_folder or not path:
+            return None
+        path = os.fspath(path)
+        if path not in self._pdf_digests:
+            self._pdf_digests[path] = file_sha256(path)
+        key = json.dumps([
+            pdfplumber_page.page_number,
+            [round(v, 2) for v in table_bbox] if table_bbox is not None else None,
+            self.resolution,
+            self.config,
+        ])
+        return os.path.join(
+            self.cache_folder,
+            self._pdf_digests[path],
+            f"p{pdfplumber_page.page_number:04d}-"
+            f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.tsv",
         )
+
+    def _run_tesseract(self, pil_image, cache_path: str | None = None) -> str:
+        tsv = self.pytesseract.image_to_data(pil_image, config=self.config)
+        if cache_path:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(tsv)
+            os.replace(tmp_path, cache_path)
+        return tsv
+
+    def _ocr_tsv(self, pdfplumber_page, table_bbox=None) -> str:
+        """Tesseract TSV for a page or a region of it, from the cache when possible."""
+        cache_path = self._cache_path(pdfplumber_page, table_bbox)
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, encoding="utf-8") as f:
+                return f.read()
+        img = self._rasterise(pdfplumber_page)
+        if table_bbox is not None:
+            img = self._crop_to_bbox(img, pdfplumber_page, table_bbox)
+        return self._run_tesseract(img, cache_path)
+
+    def prefetch(self, pdfplumber_pages) -> None:
+        """
+        OCR whole pages ahead of the main pass so later lookups hit the cache.
+
+        Pages are rasterised in batches of ``threads`` on this thread (pdfium
+        is not thread-safe) and each batch is recognised by a pool of
+        Tesseract processes.
+        """
+        missing = []
+        for page in pdfplumber_pages:
+            cache_path = self._cache_path(page)
+            if cache_path and not os.path.exists(cache_path):
+                missing.append((page, cache_path))
+        if not missing:
+            return
+        # One OpenMP thread per Tesseract process; the pool (or the worker
+        # processes running one Tesseract each) supplies the parallelism.
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        if self.threads == 1:
+            for page, cache_path in missing:
+                self._run_tesseract(self._rasterise(page), cache_path)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            for start in range(0, len(missing), self.threads):
+                batch = [
+                    (page.to_image(resolution=self.resolution).original, cache_path)
+                    for page, cache_path in missing[start:start + self.threads]
+                ]
+                for future in [pool.submit(self._run_tesseract, img, cache_path)
+                               for img, cache_path in batch]:
+                    future.result()
+
+    def _get_words_df(self, pdfplumber_page, table_bbox=None) -> pd.DataFrame:
+        """Run Tesseract and return a filtered DataFrame of words with geometry."""
+        # Parsed the same way as pytesseract's Output.DATAFRAME.
+        df = pd.read_csv(io.StringIO(self._ocr_tsv(pdfplumber_page, table_bbox)),
+                         sep="\t", quoting=csv.QUOTE_NONE)
         df = df[df["conf"] >= self.conf_threshold].copy()
         df = df[df["text"].notna() & (df["text"].str.strip() != "")]
         df = df.reset_index(drop=True)
@@ -123,8 +265,7 @@ class LayoutOCR:
         Extract narrative/plain text from a scanned page preserving reading order.
         Equivalent to the old pytesseract.image_to_string() but layout-aware.
         """
-        img = self._rasterise(pdfplumber_page)
-        words_df = self._get_words_df(img)
+        words_df = self._get_words_df(pdfplumber_page)
         lines = self._cluster_lines(words_df)
         return "\n".join(self._line_to_text(ln) for ln in lines)
 
@@ -194,26 +335,7 @@ class LayoutOCR:
         -------
         list of rows, each row is a list of cell strings (may be empty strings).
         """
-        img = self._rasterise(pdfplumber_page)
-
-        if table_bbox is not None:
-            # Convert PDF-point bbox → pixel bbox
-            pw = pdfplumber_page.width
-            ph = pdfplumber_page.height
-            iw, ih = img.size
-            sx = iw / pw
-            sy = ih / ph
-            x0, top, x1, bottom = table_bbox
-            px0, ptop, px1, pbottom = int(x0*sx), int(top*sy), int(x1*sx), int(bottom*sy)
-            # add small margin
-            margin = int(4 * sx)
-            px0 = max(0, px0 - margin)
-            ptop = max(0, ptop - margin)
-            px1 = min(iw, px1 + margin)
-            pbottom = min(ih, pbottom + margin)
-            img = img.crop((px0, ptop, px1, pbottom))
-
-        words_df = self._get_words_df(img)
+        words_df = self._get_words_df(pdfplumber_page, table_bbox)
         if words_df.empty:
             return []
 
@@ -256,11 +378,7 @@ class LayoutOCR:
 
         # Attempt to find table regions via drawn lines (works even on scanned pages
         # if the scanner preserved the lines in the PDF layer)
-        table_objs = page.find_tables({
-            "vertical_strategy": "lines",
-            "horizontal_strategy": "lines",
-            "snap_tolerance": 5,
-        })
+        table_objs = page.find_tables(TABLE_SETTINGS)
         table_bboxes = [t.bbox for t in table_objs]
 
         tables = []
@@ -270,8 +388,7 @@ class LayoutOCR:
 
         # If no drawn lines found, try text-clustering to detect table-like regions
         if not table_bboxes:
-            img = self._rasterise(page)
-            words_df = self._get_words_df(img)
+            words_df = self._get_words_df(page)
             lines = self._cluster_lines(words_df)
             # Heuristic: if ≥3 words per line on average and ≥3 lines → treat whole page as table
             if lines:
@@ -327,6 +444,54 @@ def get_page_text(page, use_ocr: bool = False) -> str:
     return text
 
 
+# -----------------------------------------------------------------------
+# PAGE WORD INDEX
+# -----------------------------------------------------------------------
+
+class WordGrid:
+    """
+    Uniform grid over a page's words, extracted once per page.
+
+    Replaces ``page.crop(bbox).extract_words()`` / ``extract_text()`` for
+    cell-alignment and title lookups.  A word belongs to a region when its
+    centre lies inside it.
+    """
+
+    def __init__(self, page, cell: float = WORD_GRID_CELL):
+        self.width = page.width
+        self.height = page.height
+        self.words = page.extract_words()
+        self.cell = cell
+        self.buckets: dict[tuple[int, int], list[int]] = {}
+        for idx, w in enumerate(self.words):
+            key = (int((w["x0"] + w["x1"]) / 2 // cell),
+                   int((w["top"] + w["bottom"]) / 2 // cell))
+            self.buckets.setdefault(key, []).append(idx)
+
+    def words_in(self, bbox) -> list[dict]:
+        x0, top, x1, bottom = bbox
+        found = []
+        for gx in range(int(x0 // self.cell), int(x1 // self.cell) + 1):
+            for gy in range(int(top // self.cell), int(bottom // self.cell) + 1):
+                for idx in self.buckets.get((gx, gy), ()):
+                    w = self.words[idx]
+                    cx = (w["x0"] + w["x1"]) / 2
+                    cy = (w["top"] + w["bottom"]) / 2
+                    if x0 <= cx <= x1 and top <= cy <= bottom:
+                        found.append(idx)
+        return [self.words[idx] for idx in sorted(found)]
+
+    def lines_in(self, bbox) -> list[str]:
+        lines: list[list[dict]] = []
+        for w in sorted(self.words_in(bbox), key=lambda w: (w["top"], w["x0"])):
+            if lines and w["top"] - lines[-1][0]["top"] < LINE_Y_TOLERANCE:
+                lines[-1].append(w)
+            else:
+                lines.append([w])
+        return [" ".join(w["text"] for w in sorted(line, key=lambda w: w["x0"]))
+                for line in lines]
+
+
 # -----------------------------------------------------------------------
 # EVENT DATACLASS
 # -----------------------------------------------------------------------
@@ -348,66 +513,73 @@ class Event:
 # MULTI-PAGE NARRATIVE EXTRACTION
 # -----------------------------------------------------------------------
 
+def read_page_texts(pdf_path: str, use_ocr: bool = False,
+                    max_pages: int = NARRATIVE_MAX_PAGES) -> list[str]:
+    with pdfplumber.open(pdf_path) as pdf:
+        return [get_page_text(page, use_ocr=use_ocr) for page in pdf.pages[:max_pages]]
+
+
 def extract_multi_page_narrative(pdf_path: str, event_name: str,
                                   use_ocr: bool = False) -> str:
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if len(pdf.pages) == 0:
-                return ""
-
-            narrative_parts = []
-
-            table_start_patterns = [
-                r'REGION\s*\|\s*PROVINCE',
-                r'AFFECTED POPULATION',
-                r'RELATED INCIDENTS',
-                r'CASUALTIES',
-                r'^\s*REGION\s*$',
-                r'^\s*PROVINCE\s*$',
-                r'Page \d+\s*/\s*\d+',
-            ]
-
-            max_narrative_pages = min(5, len(pdf.pages))
-
-            for page_num in range(max_narrative_pages):
-                page = pdf.pages[page_num]
-                page_text = get_page_text(page, use_ocr=use_ocr)
-
-                if page_num == 0:
-                    lines = page_text.split('\n')
-                    cleaned_lines = []
-                    for i, line in enumerate(lines):
-                        line = line.strip()
-                        if i < 3:
-                            continue
-                        if 'Telefax:' in line or 'Email:' in line or 'Websites:' in line:
-                            continue
-                        if len(line) < 10 and i < 10:
-                            continue
-                        if line:
-                            cleaned_lines.append(line)
-                    page_text = '\n'.join(cleaned_lines)
-
-                found_table_start = False
-                for pattern in table_start_patterns:
-                    if re.search(pattern, page_text, re.IGNORECASE | re.MULTILINE):
-                        match = re.search(pattern, page_text, re.IGNORECASE | re.MULTILINE)
-                        narrative_parts.append(page_text[:match.start()].strip())
-                        found_table_start = True
-                        break
-
-                if found_table_start:
-                    break
-                else:
-                    narrative_parts.append(page_text.strip())
-
-            return '\n\n'.join(narrative_parts).strip()
-
+        return narrative_from_page_texts(read_page_texts(pdf_path, use_ocr=use_ocr))
     except Exception as e:
         print(f"Error extracting multi-page narrative: {e}")
         return ""
 
 
+def narrative_from_page_texts(page_texts: list[str]) -> str:
+    if len(page_texts) == 0:
+        return ""
+
+    narrative_parts = []
+
+    table_start_patterns = [
+        r'REGION\s*\|\s*PROVINCE',
+        r'AFFECTED POPULATION',
+        r'RELATED INCIDENTS',
+        r'CASUALTIES',
+        r'^\s*REGION\s*$',
+        r'^\s*PROVINCE\s*$',
+        r'Page \d+\s*/\s*\d+',
+    ]
+
+    max_narrative_pages = min(NARRATIVE_MAX_PAGES, len(page_texts))
+
+    for page_num in range(max_narrative_pages):
+        page_text = page_texts[page_num]
+
+        if page_num == 0:
+            lines = page_text.split('\n')
+            cleaned_lines = []
+            for i, line in enumerate(lines):
+                line = line.strip()
+                if i < 3:
+                    continue
+                if 'Telefax:' in line or 'Email:' in line or 'Websites:' in line:
+                    continue
+                if len(line) < 10 and i < 10:
+                    continue
+                if line:
+                    cleaned_lines.append(line)
+            page_text = '\n'.join(cleaned_lines)
+
+        found_table_start = False
+        for pattern in table_start_patterns:
+            if re.search(pattern, page_text, re.IGNORECASE | re.MULTILINE):
+                match = re.search(pattern, page_text, re.IGNORECASE | re.MULTILINE)
+                narrative_parts.append(page_text[:match.start()].strip())
+                found_table_start = True
+                break
+
+        if found_table_start:
+            break
+        else:
+            narrative_parts.append(page_text.strip())
+
+    return '\n\n'.join(narrative_parts).strip()
+
+
 # -----------------------------------------------------------------------
 # DATE EXTRACTION
 # -----------------------------------------------------------------------
@@ -462,90 +634,98 @@ def parse_flexible_date(date_str: str) -> datetime | None:
 def extract_narrative_dates(pdf_path: str, event_name: str,
                               use_ocr: bool = False):
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if len(pdf.pages) == 0:
-                return None, None, "", None
-
-            first_page_text = get_page_text(pdf.pages[0], use_ocr=use_ocr)
-            narrative_text = extract_multi_page_narrative(pdf_path, event_name, use_ocr=use_ocr)
-            print(f"   → Extracted narrative: {len(narrative_text)} characters")
-
-            event_lower = event_name.lower()
-            is_sitrep = 'sitrep' in event_lower or 'situational report' in narrative_text.lower()
-            is_election = 'election' in event_lower or 'bske' in event_lower
-            is_monitoring = is_sitrep or 'monitoring' in event_lower or 'cases' in event_lower
-
-            # "As of" date
-            as_of_date = None
-            for page_num in range(min(2, len(pdf.pages))):
-                page_text = get_page_text(pdf.pages[page_num], use_ocr=use_ocr)
-                m = re.search(r'as\s+of\s*[(\[]?\s*([^)\]]+?)\s*[)\]]?(?:\s|$)',
-                               page_text, re.IGNORECASE)
-                if m:
-                    dt = parse_flexible_date(m.group(1).strip())
-                    if dt:
-                        as_of_date = dt
-                        print(f"   → Found 'as of' date: {m.group(1).strip()}")
-                        break
-
-            # Report date (timestamp near top of page)
-            report_date = None
-            for dtype, dstr, dobj, pos in extract_dates_from_text(first_page_text[:300]):
-                if ':' in dstr and pos < 200:
-                    report_date = dobj
-                    print(f"   → Found report date: {dstr}")
+        page_texts = read_page_texts(pdf_path, use_ocr=use_ocr)
+    except Exception as e:
+        print(f"Error extracting dates: {e}")
+        return None, None, "", None
+    return narrative_dates_from_page_texts(page_texts, event_name)
+
+
+def narrative_dates_from_page_texts(page_texts: list[str], event_name: str):
+    """Narrative, start/end and report dates from a report's leading page texts."""
+    try:
+        if len(page_texts) == 0:
+            return None, None, "", None
+
+        first_page_text = page_texts[0]
+        narrative_text = narrative_from_page_texts(page_texts)
+        print(f"   → Extracted narrative: {len(narrative_text)} characters")
+
+        event_lower = event_name.lower()
+        is_sitrep = 'sitrep' in event_lower or 'situational report' in narrative_text.lower()
+        is_election = 'election' in event_lower or 'bske' in event_lower
+        is_monitoring = is_sitrep or 'monitoring' in event_lower or 'cases' in event_lower
+
+        # "As of" date
+        as_of_date = None
+        for page_text in page_texts[:2]:
+            m = re.search(r'as\s+of\s*[(\[]?\s*([^)\]]+?)\s*[)\]]?(?:\s|$)',
+                           page_text, re.IGNORECASE)
+            if m:
+                dt = parse_flexible_date(m.group(1).strip())
+                if dt:
+                    as_of_date = dt
+                    print(f"   → Found 'as of' date: {m.group(1).strip()}")
                     break
 
-            all_narrative_dates = extract_dates_from_text(narrative_text)
-            print(f"   → Found {len(all_narrative_dates)} dates in narrative")
-
-            narrative_dates = [
-                d for d in all_narrative_dates
-                if not (d[3] < 200 and ':' in d[1])
-            ]
-
-            if is_monitoring and not narrative_dates:
-                print("   → Detected monitoring report")
-                if as_of_date:
-                    return as_of_date, as_of_date, narrative_text, report_date
-                if report_date:
-                    return report_date, report_date, narrative_text, report_date
-                return None, None, narrative_text, None
-
-            if is_election:
-                print("   → Detected election event")
-                for pattern in [
-                    r'scheduled\s+for\s+(\d{1,2}\s+\w+\s+\d{4})',
-                    r'election.*?(\d{1,2}\s+\w+\s+\d{4})',
-                    r'(\d{1,2}\s+\w+\s+\d{4}).*?election',
-                ]:
-                    m = re.search(pattern, narrative_text, re.IGNORECASE)
-                    if m:
-                        dt = parse_flexible_date(m.group(1))
-                        if dt:
-                            print(f"   → Found election date: {m.group(1)}")
-                            return dt, dt, narrative_text, report_date
-                if narrative_dates:
-                    return narrative_dates[0][2], narrative_dates[0][2], narrative_text, report_date
-
-            if not narrative_dates:
-                print("   → No narrative dates found")
-                if as_of_date:
-                    return as_of_date, as_of_date, narrative_text, report_date
-                if report_date:
-                    return report_date, report_date, narrative_text, report_date
-                return None, None, narrative_text, None
-
-            range_starts = [d for d in narrative_dates if d[0] == 'range_start']
-            range_ends   = [d for d in narrative_dates if d[0] == 'range_end']
-
-            if range_starts and range_ends:
-                print("   → Using explicit date range")
-                return range_starts[0][2], range_ends[0][2], narrative_text, report_date
-
-            date_objs = sorted(d[2] for d in narrative_dates)
-            print(f"   → Using chronological range from {len(date_objs)} dates")
-            return date_objs[0], date_objs[-1], narrative_text, report_date
+        # Report date (timestamp near top of page)
+        report_date = None
+        for dtype, dstr, dobj, pos in extract_dates_from_text(first_page_text[:300]):
+            if ':' in dstr and pos < 200:
+                report_date = dobj
+                print(f"   → Found report date: {dstr}")
+                break
+
+        all_narrative_dates = extract_dates_from_text(narrative_text)
+        print(f"   → Found {len(all_narrative_dates)} dates in narrative")
+
+        narrative_dates = [
+            d for d in all_narrative_dates
+            if not (d[3] < 200 and ':' in d[1])
+        ]
+
+        if is_monitoring and not narrative_dates:
+            print("   → Detected monitoring report")
+            if as_of_date:
+                return as_of_date, as_of_date, narrative_text, report_date
+            if report_date:
+                return report_date, report_date, narrative_text, report_date
+            return None, None, narrative_text, None
+
+        if is_election:
+            print("   → Detected election event")
+            for pattern in [
+                r'scheduled\s+for\s+(\d{1,2}\s+\w+\s+\d{4})',
+                r'election.*?(\d{1,2}\s+\w+\s+\d{4})',
+                r'(\d{1,2}\s+\w+\s+\d{4}).*?election',
+            ]:
+                m = re.search(pattern, narrative_text, re.IGNORECASE)
+                if m:
+                    dt = parse_flexible_date(m.group(1))
+                    if dt:
+                        print(f"   → Found election date: {m.group(1)}")
+                        return dt, dt, narrative_text, report_date
+            if narrative_dates:
+                return narrative_dates[0][2], narrative_dates[0][2], narrative_text, report_date
+
+        if not narrative_dates:
+            print("   → No narrative dates found")
+            if as_of_date:
+                return as_of_date, as_of_date, narrative_text, report_date
+            if report_date:
+                return report_date, report_date, narrative_text, report_date
+            return None, None, narrative_text, None
+
+        range_starts = [d for d in narrative_dates if d[0] == 'range_start']
+        range_ends   = [d for d in narrative_dates if d[0] == 'range_end']
+
+        if range_starts and range_ends:
+            print("   → Using explicit date range")
+            return range_starts[0][2], range_ends[0][2], narrative_text, report_date
+
+        date_objs = sorted(d[2] for d in narrative_dates)
+        print(f"   → Using chronological range from {len(date_objs)} dates")
+        return date_objs[0], date_objs[-1], narrative_text, report_date
 
     except Exception as e:
         import traceback
@@ -619,13 +799,10 @@ def generate_json(event: Event, output_dir: str):
         print(f"✓ Saved: {path}")
 
 
-def get_text_alignment_and_case(page, cell_bbox):
+def get_text_alignment_and_case(grid: WordGrid, cell_bbox):
     if not cell_bbox:
         return None, None, ""
-    try:
-        words = page.crop(cell_bbox).extract_words()
-    except ValueError:
-        return None, None, ""
+    words = grid.words_in(cell_bbox)
     if not words:
         return None, None, ""
 
@@ -749,15 +926,25 @@ def detect_and_merge_headers_with_spanning(extracted_rows):
 # -----------------------------------------------------------------------
 
 class SimpleTitleTracker:
+    """
+    Carries a table title printed at the bottom of one page over to a table
+    at the top of the next page.
+
+    The page-local lookups (``find_bottom_title`` / ``find_header_title``) are
+    separate from the carry-over state (``note_bottom_title`` /
+    ``resolve_title``) so pages can be read in parallel and replayed in order.
+    """
+
     def __init__(self):
         self.pending_title = None
         self.pending_title_page = None
 
-    def check_page_bottom(self, page, page_num):
-        page_height = page.height
-        bottom_crop = page.crop((0, page_height - 150, page.width, page_height))
-        bottom_text = bottom_crop.extract_text() or ""
-        lines = [l.strip() for l in bottom_text.split("\n") if l.strip()]
+    @staticmethod
+    def find_bottom_title(grid: WordGrid, tables):
+        page_height = grid.height
+        lines = [l.strip() for l in
+                 grid.lines_in((0, page_height - 150, grid.width, page_height))
+                 if l.strip()]
 
         potential_title = None
         for line in reversed(lines):
@@ -768,42 +955,53 @@ class SimpleTitleTracker:
                 break
 
         if potential_title:
-            tables = page.find_tables({
-                "vertical_strategy": "lines",
-                "horizontal_strategy": "lines",
-                "snap_tolerance": 5,
-            })
             title_y = page_height - 50
             inside = any(t.bbox[1] < title_y < t.bbox[3] for t in tables)
             if not inside:
-                self.pending_title = potential_title
-                self.pending_title_page = page_num
-                print(f"   → Potential carry-over title (page {page_num}): {potential_title}")
                 return potential_title
         return None
 
-    def get_title_for_table(self, page, page_num, table_bbox):
+    @staticmethod
+    def find_header_title(grid: WordGrid, table_bbox):
+        x0, top, x1, _ = table_bbox
+        lines = [l.strip() for l in
+                 grid.lines_in((0, max(0, top - HEADER_SEARCH_DISTANCE), grid.width, top))
+                 if l.strip()]
+        if lines:
+            pt = lines[-1]
+            if pt.isupper() or len(pt) < 100:
+                return pt
+        return None
+
+    def note_bottom_title(self, potential_title, page_num):
+        if potential_title:
+            self.pending_title = potential_title
+            self.pending_title_page = page_num
+            print(f"   → Potential carry-over title (page {page_num}): {potential_title}")
+        return potential_title
+
+    def resolve_title(self, page_num, near_top, header_title):
         if (self.pending_title and
                 self.pending_title_page == page_num - 1 and
-                table_bbox[1] < page.height * 0.3):
+                near_top):
             title = self.pending_title
             self.pending_title = None
             print(f"   → Using carry-over title: {title}")
             return title
+        return header_title
 
-        x0, top, x1, _ = table_bbox
-        try:
-            header_text = page.crop(
-                (0, max(0, top - HEADER_SEARCH_DISTANCE), page.width, top)
-            ).extract_text() or ""
-            lines = [l.strip() for l in header_text.split("\n") if l.strip()]
-            if lines:
-                pt = lines[-1]
-                if pt.isupper() or len(pt) < 100:
-                    return pt
-        except Exception:
-            pass
-        return None
+    def check_page_bottom(self, page, page_num):
+        return self.note_bottom_title(
+            self.find_bottom_title(WordGrid(page), page.find_tables(TABLE_SETTINGS)),
+            page_num,
+        )
+
+    def get_title_for_table(self, page, page_num, table_bbox):
+        return self.resolve_title(
+            page_num,
+            table_bbox[1] < page.height * 0.3,
+            self.find_header_title(WordGrid(page), table_bbox),
+        )
 
 
 # -----------------------------------------------------------------------
@@ -843,18 +1041,268 @@ def _ocr_table_rows_from_layout(page, table_bbox,
     return results, column_headers, data_start_idx
 
 
+# -----------------------------------------------------------------------
+# PAGE EXTRACTION  (page-local work, safe to run in parallel)
+# -----------------------------------------------------------------------
+
+@dataclass
+class TableRecord:
+    bbox: tuple
+    near_top: bool                      # table starts in the top 30% of the page
+    header_title: str | None            # title text found just above the table
+    rows: list                          # native rows (OCR rows for layout tables)
+    ocr_rows: list | None = None        # OCR replacement for a sparse native table
+    row_locations: list | None = None   # (align, casing, text) of each row's first cell
+
+
+@dataclass
+class PageRecord:
+    page_index: int
+    text: str | None                    # page text, kept for the narrative pages only
+    bottom_title: str | None
+    layout_tables: list                 # tables found by full-page layout OCR
+    tables: list                        # drawn-line tables found by pdfplumber
+
+
+def _table_record(grid: WordGrid, bbox, rows, **kwargs) -> TableRecord:
+    return TableRecord(
+        bbox=bbox,
+        near_top=bbox[1] < grid.height * 0.3,
+        header_title=SimpleTitleTracker.find_header_title(grid, bbox),
+        rows=rows,
+        **kwargs,
+    )
+
+
+def _is_scanned(page, use_ocr: bool) -> bool:
+    return use_ocr and sum(1 for c in page.chars if not c["text"].isspace()) < OCR_MIN_CHARS
+
+
+def _narrative_page_text(page, page_index: int, use_ocr: bool) -> str | None:
+    """Text of a narrative page; a page whose extraction fails is left out."""
+    if page_index > NARRATIVE_MAX_PAGES:
+        return None
+    try:
+        return get_page_text(page, use_ocr=use_ocr)
+    except Exception as e:
+        print(f"   ⚠ Page {page_index}: text extraction failed, skipping its narrative: {e}")
+        return None
+
+
+def extract_page_record(page, page_index: int, use_ocr: bool = False,
+                        tables_found=None) -> PageRecord:
+    """
+    Read everything the parser needs from one page in a single pass: words
+    are extracted once into a WordGrid and tables are found once.
+    """
+    grid = WordGrid(page)
+    if tables_found is None:
+        tables_found = page.find_tables(TABLE_SETTINGS)
+    record = PageRecord(
+        page_index=page_index,
+        text=_narrative_page_text(page, page_index, use_ocr),
+        bottom_title=SimpleTitleTracker.find_bottom_title(grid, tables_found),
+        layout_tables=[],
+        tables=[],
+    )
+
+    page_is_scanned = _is_scanned(page, use_ocr)
+
+    if not tables_found:
+        if page_is_scanned:
+            # --- OCR full-page layout analysis for scanned pages ---
+            print(f"   ⚙ Page {page_index}: scanned, running layout OCR for tables…")
+            layout = _get_ocr().extract_page_layout(page)
+            for tbl_rows, tbl_bbox in zip(layout["tables"], layout["table_bboxes"]):
+                record.layout_tables.append(_table_record(grid, tbl_bbox, tbl_rows))
+        return record
+
+    # --- Native table extraction (drawn-line tables) ---
+    for table_obj in tables_found:
+        extracted_rows = table_obj.extract()
+
+        # Check if the native extraction is empty/poor and page is scanned
+        ocr_rows = None
+        native_cells = sum(
+            1 for row in extracted_rows
+            for cell in row if cell and str(cell).strip()
+        )
+        if page_is_scanned and native_cells < 5:
+            print(f"   ⚙ Page {page_index}: native table sparse ({native_cells} cells), "
+                  "using OCR for this table…")
+            ocr_rows = _get_ocr().extract_table(page, table_bbox=table_obj.bbox) or None
+
+        row_locations = [
+            get_text_alignment_and_case(grid, row_obj.cells[0]) if row_obj.cells else None
+            for row_obj in table_obj.rows
+        ]
+        record.tables.append(_table_record(
+            grid, table_obj.bbox, extracted_rows,
+            ocr_rows=ocr_rows, row_locations=row_locations,
+        ))
+
+    return record
+
+
+def extract_page_records(pdf_path: str, use_ocr: bool = False,
+                         start: int = 0, end: int | None = None,
+                         pdf_digest: str | None = None) -> list[PageRecord]:
+    """
+    Extract pages [start, end) of a PDF; page indexes stay 1-based and absolute.
+    ``pdf_digest`` is the PDF's SHA-256 when the caller already has it, so
+    the OCR cache does not hash the file again for every page range.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        pages = list(enumerate(pdf.pages[start:end], start=start + 1))
+        tables = [page.find_tables(TABLE_SETTINGS) for _, page in pages]
+        if use_ocr and pdf_digest:
+            _get_ocr().remember_digest(getattr(pdf, "path", None) or pdf_path, pdf_digest)
+        if use_ocr:
+            # Scanned pages that will need a full-page OCR: narrative pages
+            # and pages whose tables come from layout OCR.
+            _get_ocr().prefetch([
+                page for (page_index, page), found in zip(pages, tables)
+                if _is_scanned(page, use_ocr)
+                and (page_index <= NARRATIVE_MAX_PAGES or not found)
+            ])
+        return [
+            extract_page_record(page, page_index, use_ocr=use_ocr, tables_found=found)
+            for (page_index, page), found in zip(pages, tables)
+        ]
+
+
+# -----------------------------------------------------------------------
+# TABLE ASSEMBLY  (sequential replay of titles and header carry-over)
+# -----------------------------------------------------------------------
+
+def _cell_columns(rd: dict, row, col_headers) -> dict:
+    for col_idx, cell in enumerate(row):
+        if col_idx == 0:
+            continue
+        header = (col_headers[col_idx]
+                  if col_headers and col_idx < len(col_headers)
+                  else f"Column_{col_idx}")
+        rd[header] = (cell or "").replace("\n", " ").strip()
+    return rd
+
+
+def assemble_tables(pdf_event: Event, page_records: list[PageRecord]) -> dict[str, list]:
+    """Replay page records in page order into per-title row buffers."""
+    current_title = "Unknown_Section"
+    all_tables_buffer: dict[str, list] = {}
+    table_headers_used: dict[str, tuple] = {}
+    title_tracker = SimpleTitleTracker()
+
+    for record in sorted(page_records, key=lambda r: r.page_index):
+        page_index = record.page_index
+        title_tracker.note_bottom_title(record.bottom_title, page_index)
+
+        for table in record.layout_tables:
+            potential_title = title_tracker.resolve_title(
+                page_index, table.near_top, table.header_title)
+            if potential_title:
+                current_title = clean_tablename(pdf_event, potential_title)
+
+            if current_title not in all_tables_buffer:
+                all_tables_buffer[current_title] = []
+
+            col_headers, ds_idx = table_headers_used.get(current_title, (None, 0))
+            if col_headers is None:
+                col_headers, ds_idx = detect_and_merge_headers_with_spanning(table.rows)
+                table_headers_used[current_title] = (col_headers, ds_idx)
+
+            for row_idx, row in enumerate(table.rows):
+                if ds_idx and row_idx < ds_idx:
+                    continue
+                rd = {
+                    "Page": page_index,
+                    "Region": None, "Province": None,
+                    "City_Muni": None, "Barangay": None,
+                    "Summary_Type": None,
+                }
+                all_tables_buffer[current_title].append(_cell_columns(rd, row, col_headers))
+
+        for table in record.tables:
+            potential_title = title_tracker.resolve_title(
+                page_index, table.near_top, table.header_title)
+            if potential_title:
+                current_title = clean_tablename(pdf_event, potential_title)
+
+            if current_title not in all_tables_buffer:
+                all_tables_buffer[current_title] = []
+
+            extracted_rows = table.rows
+
+            if current_title not in table_headers_used:
+                col_headers, ds_idx = detect_and_merge_headers_with_spanning(extracted_rows)
+                table_headers_used[current_title] = (col_headers, ds_idx)
+            else:
+                col_headers, ds_idx = table_headers_used[current_title]
+
+            if table.ocr_rows:
+                extracted_rows = table.ocr_rows
+                if table_headers_used[current_title][0] is None:
+                    col_headers, ds_idx = \
+                        detect_and_merge_headers_with_spanning(extracted_rows)
+                    table_headers_used[current_title] = (col_headers, ds_idx)
+
+            current_region = current_province = current_muni = current_barangay = None
+
+            for row_idx, (location, row_text) in enumerate(
+                    zip(table.row_locations, extracted_rows)):
+                if ds_idx and row_idx < ds_idx:
+                    continue
+                if location is None:
+                    continue
+
+                align, casing, text = location
+
+                if text and "REGION" in text and "PROVINCE" in text:
+                    continue
+
+                is_summary = is_summary_row(text)
+                summary_type = None
+
+                if text and not is_summary:
+                    if align == "CENTER" and casing == "UPPER":
+                        current_region = text
+                        current_province = current_muni = current_barangay = None
+                    elif align == "LEFT" and casing == "UPPER":
+                        current_province = text
+                        current_muni = current_barangay = None
+                    elif align == "CENTER" and casing != "UPPER":
+                        current_muni = text
+                        current_barangay = None
+                    elif align == "RIGHT":
+                        current_barangay = text
+                elif is_summary:
+                    summary_type = text
+
+                rd = {
+                    "Page": page_index,
+                    "Region": current_region if not is_summary else None,
+                    "Province": current_province if not is_summary else None,
+                    "City_Muni": current_muni if not is_summary else None,
+                    "Barangay": current_barangay if not is_summary else None,
+                    "Summary_Type": summary_type,
+                }
+                all_tables_buffer[current_title].append(_cell_columns(rd, row_text, col_headers))
+
+    return all_tables_buffer
+
+
 # -----------------------------------------------------------------------
 # MAIN PROCESSOR
 # -----------------------------------------------------------------------
 
-def process_pdf(pdf_event: Event, file_counter: int,
-                pdf_path: str, use_ocr: bool = False):
-    print(f"\n📄{file_counter} Processing PDF: {pdf_path}")
-    if use_ocr:
-        print("   → Layout-aware OCR mode enabled (bounding-box reconstruction)")
+def narrative_from_records(pdf_event: Event, page_records: list[PageRecord]):
+    page_texts = [r.text for r in sorted(page_records, key=lambda r: r.page_index)
+                  if r.text is not None]
+    return narrative_dates_from_page_texts(page_texts, pdf_event.eventName)
 
-    start_date, end_date, narrative_text, report_date = \
-        extract_narrative_dates(pdf_path, pdf_event.eventName, use_ocr=use_ocr)
+
+def apply_narrative(pdf_event: Event, narrative_result) -> None:
+    start_date, end_date, narrative_text, report_date = narrative_result
 
     if narrative_text:
         pdf_event.remarks = narrative_text
@@ -866,214 +1314,250 @@ def process_pdf(pdf_event: Event, file_counter: int,
         pdf_event.endDate = end_date.strftime("%Y-%m-%d")
         print(f"   → End Date: {pdf_event.endDate}")
 
+
+def write_event_output(pdf_event: Event, page_records: list[PageRecord],
+                       table_format: str = OUTPUT_FORMAT) -> None:
     output_dir = os.path.join(OUTPUT_FOLDER, pdf_event.eventName)
     os.makedirs(output_dir, exist_ok=True)
 
-    current_title = "Unknown_Section"
-    all_tables_buffer: dict[str, list] = {}
-    table_headers_used: dict[str, tuple] = {}
-    title_tracker = SimpleTitleTracker()
+    tables = {
+        title: dict_rows(rows)
+        for title, rows in assemble_tables(pdf_event, page_records).items()
+        if rows
+    }
+    manifest = write_tables(output_dir, tables, "ndrrmc", table_format)
+    for entry in manifest["tables"].values():
+        print(f"   ✓ Saved table: {os.path.join(output_dir, entry['file'])} "
+              f"({entry['rows']} rows)")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_index, page in enumerate(pdf.pages, start=1):
-            title_tracker.check_page_bottom(page, page_index)
+    generate_json(pdf_event, output_dir)
 
-            native_text = page.extract_text() or ""
-            page_is_scanned = (
-                use_ocr and
-                len(native_text.replace(" ", "").replace("\n", "")) < OCR_MIN_CHARS
-            )
 
-            tables_found = page.find_tables({
-                "vertical_strategy": "lines",
-                "horizontal_strategy": "lines",
-                "snap_tolerance": 5,
-            })
-
-            if not tables_found:
-                if page_is_scanned:
-                    # --- OCR full-page layout analysis for scanned pages ---
-                    print(f"   ⚙ Page {page_index}: scanned, running layout OCR for tables…")
-                    layout = _get_ocr().extract_page_layout(page)
-
-                    for tbl_idx, (tbl_rows, tbl_bbox) in enumerate(
-                            zip(layout["tables"], layout["table_bboxes"])):
-
-                        potential_title = title_tracker.get_title_for_table(
-                            page, page_index, tbl_bbox)
-                        if potential_title:
-                            current_title = clean_tablename(pdf_event, potential_title)
-
-                        if current_title not in all_tables_buffer:
-                            all_tables_buffer[current_title] = []
-
-                        col_headers, ds_idx = table_headers_used.get(
-                            current_title, (None, 0))
-                        if col_headers is None:
-                            col_headers, ds_idx = detect_and_merge_headers_with_spanning(tbl_rows)
-                            table_headers_used[current_title] = (col_headers, ds_idx)
-
-                        for row_idx, row in enumerate(tbl_rows):
-                            if ds_idx and row_idx < ds_idx:
-                                continue
-                            rd = {
-                                "Page": page_index,
-                                "Region": None, "Province": None,
-                                "City_Muni": None, "Barangay": None,
-                                "Summary_Type": None,
-                            }
-                            for col_idx, cell in enumerate(row):
-                                if col_idx == 0:
-                                    continue
-                                header = (col_headers[col_idx]
-                                          if col_headers and col_idx < len(col_headers)
-                                          else f"Column_{col_idx}")
-                                rd[header] = (cell or "").replace("\n", " ").strip()
-                            all_tables_buffer[current_title].append(rd)
-                else:
-                    # no tables, no OCR needed — skip
-                    continue
+def process_pdf(pdf_event: Event, file_counter: int,
+                pdf_path: str, use_ocr: bool = False,
+                table_format: str = OUTPUT_FORMAT, pdf_digest: str | None = None):
+    print(f"\n📄{file_counter} Processing PDF: {pdf_path}")
+    if use_ocr:
+        print("   → Layout-aware OCR mode enabled (bounding-box reconstruction)")
+
+    page_records = extract_page_records(pdf_path, use_ocr=use_ocr, pdf_digest=pdf_digest)
+    apply_narrative(pdf_event, narrative_from_records(pdf_event, page_records))
+    write_event_output(pdf_event, page_records, table_format)
+
 
-            # --- Native table extraction (drawn-line tables) ---
-            for table_obj in tables_found:
-                potential_title = title_tracker.get_title_for_table(
-                    page, page_index, table_obj.bbox)
-                if potential_title:
-                    current_title = clean_tablename(pdf_event, potential_title)
+# -----------------------------------------------------------------------
+# INCREMENTAL PARSE MANIFEST
+# -----------------------------------------------------------------------
 
-                if current_title not in all_tables_buffer:
-                    all_tables_buffer[current_title] = []
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
 
-                extracted_rows = table_obj.extract()
 
-                if current_title not in table_headers_used:
-                    col_headers, ds_idx = detect_and_merge_headers_with_spanning(extracted_rows)
-                    table_headers_used[current_title] = (col_headers, ds_idx)
-                else:
-                    col_headers, ds_idx = table_headers_used[current_title]
-
-                # Check if the native extraction is empty/poor and page is scanned
-                native_cells = sum(
-                    1 for row in extracted_rows
-                    for cell in row if cell and str(cell).strip()
-                )
-                if page_is_scanned and native_cells < 5:
-                    print(f"   ⚙ Page {page_index}: native table sparse ({native_cells} cells), "
-                          "using OCR for this table…")
-                    layout_rows = _get_ocr().extract_table(
-                        page, table_bbox=table_obj.bbox)
-                    if layout_rows:
-                        extracted_rows = layout_rows
-                        if current_title not in table_headers_used or \
-                                table_headers_used[current_title][0] is None:
-                            col_headers, ds_idx = \
-                                detect_and_merge_headers_with_spanning(extracted_rows)
-                            table_headers_used[current_title] = (col_headers, ds_idx)
-
-                row_geometries = table_obj.rows
-                current_region = current_province = current_muni = current_barangay = None
-
-                for row_idx, (row_obj, row_text) in enumerate(
-                        zip(row_geometries, extracted_rows)):
-                    if ds_idx and row_idx < ds_idx:
-                        continue
-                    if not row_obj.cells:
-                        continue
-
-                    loc_bbox = row_obj.cells[0]
-                    align, casing, text = get_text_alignment_and_case(page, loc_bbox)
-
-                    if text and "REGION" in text and "PROVINCE" in text:
-                        continue
-
-                    is_summary = is_summary_row(text)
-                    summary_type = None
-
-                    if text and not is_summary:
-                        if align == "CENTER" and casing == "UPPER":
-                            current_region = text
-                            current_province = current_muni = current_barangay = None
-                        elif align == "LEFT" and casing == "UPPER":
-                            current_province = text
-                            current_muni = current_barangay = None
-                        elif align == "CENTER" and casing != "UPPER":
-                            current_muni = text
-                            current_barangay = None
-                        elif align == "RIGHT":
-                            current_barangay = text
-                    elif is_summary:
-                        summary_type = text
-
-                    rd = {
-                        "Page": page_index,
-                        "Region": current_region if not is_summary else None,
-                        "Province": current_province if not is_summary else None,
-                        "City_Muni": current_muni if not is_summary else None,
-                        "Barangay": current_barangay if not is_summary else None,
-                        "Summary_Type": summary_type,
-                    }
-                    for col_idx, cell in enumerate(row_text):
-                        if col_idx == 0:
-                            continue
-                        header = (col_headers[col_idx]
-                                  if col_headers and col_idx < len(col_headers)
-                                  else f"Column_{col_idx}")
-                        rd[header] = (cell or "").replace("\n", " ").strip()
-
-                    all_tables_buffer[current_title].append(rd)
-
-    for title, rows in all_tables_buffer.items():
-        if not rows:
+def load_manifest(output_folder: str = OUTPUT_FOLDER) -> dict:
+    path = os.path.join(output_folder, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠ Ignoring unreadable manifest {path}: {e}")
+        return {}
+
+
+def save_manifest(manifest: dict, output_folder: str = OUTPUT_FOLDER) -> None:
+    os.makedirs(output_folder, exist_ok=True)
+    path = os.path.join(output_folder, MANIFEST_FILENAME)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _content_hash(path: str, previous: dict | None) -> str:
+    """SHA-256 of the file, reusing the stored hash when size and mtime match."""
+    stat = os.stat(path)
+    if (previous and previous.get("size") == stat.st_size
+            and previous.get("mtime_ns") == stat.st_mtime_ns):
+        return previous["sha256"]
+    return file_sha256(path)
+
+
+def plan_incremental_parse(pdf_files: list[str],
+                           manifest: dict,
+                           force_patterns: list[str] | None = None,
+                           input_folder: str = INPUT_FOLDER,
+                           output_folder: str = OUTPUT_FOLDER,
+                           table_format: str = OUTPUT_FORMAT) -> tuple[list[tuple[str, str]], int]:
+    """
+    Decide which PDFs need parsing.
+
+    A PDF is skipped when its SHA-256, the parser version and the table
+    format match the manifest entry and its output folder still exists. Filenames matching
+    any of ``force_patterns`` (fnmatch globs) are always reparsed.
+    Returns ([(filename, sha256), ...] to parse, number skipped).
+    """
+    force_patterns = force_patterns or []
+    to_parse, skipped = [], 0
+    for filename in pdf_files:
+        previous = manifest.get(filename)
+        digest = _content_hash(os.path.join(input_folder, filename), previous)
+        forced = any(fnmatch.fnmatch(filename, p) for p in force_patterns)
+        unchanged = (
+            previous is not None
+            and previous.get("sha256") == digest
+            and previous.get("parser_version") == PARSER_VERSION
+            and previous.get("format", "csv") == table_format
+            and os.path.isdir(os.path.join(output_folder, previous.get("eventName", "")))
+        )
+        if unchanged and not forced:
+            skipped += 1
             continue
-        df = pd.DataFrame(rows)
-        csv_path = os.path.join(output_dir, f"{title}.csv")
-        df.to_csv(csv_path, index=False)
-        print(f"   ✓ Saved table: {csv_path} ({len(rows)} rows)")
+        to_parse.append((filename, digest))
+    return to_parse, skipped
 
-    generate_json(pdf_event, output_dir)
+
+def record_parsed(manifest: dict, filename: str, digest: str,
+                  event_name: str, input_folder: str = INPUT_FOLDER,
+                  table_format: str = OUTPUT_FORMAT) -> None:
+    stat = os.stat(os.path.join(input_folder, filename))
+    manifest[filename] = {
+        "sha256": digest,
+        "parser_version": PARSER_VERSION,
+        "format": table_format,
+        "eventName": event_name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "parsedAt": datetime.now().isoformat(timespec="seconds"),
+    }
 
 
 # -----------------------------------------------------------------------
 # BATCH RUNNERS
 # -----------------------------------------------------------------------
 
-def process_all_pdfs(use_ocr: bool = False):
+def _pending_pdfs(force_patterns: list[str] | None,
+                  table_format: str = OUTPUT_FORMAT) -> tuple[dict, list[tuple[str, str]], int]:
     print("🔎 Scanning folder for PDFs...")
     files = os.listdir(INPUT_FOLDER)
-    pdf_files = [f for f in files if f.lower().endswith(".pdf")]
-    for idx, filename in enumerate(pdf_files, start=1):
+    pdf_files = sorted(f for f in files if f.lower().endswith(".pdf"))
+    manifest = load_manifest()
+    to_parse, skipped = plan_incremental_parse(pdf_files, manifest, force_patterns,
+                                               table_format=table_format)
+    print(f"   → {len(to_parse)} new/changed PDFs, {skipped} unchanged skipped "
+          f"(parser v{PARSER_VERSION})")
+    return manifest, to_parse, skipped
+
+
+def _print_summary(parsed: int, skipped: int, failed: int) -> None:
+    print(f"\n🎉 Finished parsing all PDFs! {parsed} parsed, {skipped} unchanged skipped, "
+          f"{failed} failed")
+
+
+def process_all_pdfs(use_ocr: bool = False, force_patterns: list[str] | None = None,
+                     table_format: str = OUTPUT_FORMAT):
+    manifest, to_parse, skipped = _pending_pdfs(force_patterns, table_format)
+    parsed = failed = 0
+    for idx, (filename, digest) in enumerate(to_parse, start=1):
         event = Event(reportName=filename, eventName=clean_filename(filename))
-        process_pdf(event, idx, os.path.join(INPUT_FOLDER, filename), use_ocr=use_ocr)
-    print(f"\n🎉 Finished parsing all PDFs! {len(pdf_files)}/{len(files)}")
+        try:
+            process_pdf(event, idx, os.path.join(INPUT_FOLDER, filename), use_ocr=use_ocr,
+                        table_format=table_format, pdf_digest=digest)
+        except Exception as e:
+            failed += 1
+            print(f"❌ Error processing {filename}: {e}")
+            continue
+        parsed += 1
+        record_parsed(manifest, filename, digest, event.eventName,
+                      table_format=table_format)
+        save_manifest(manifest)
+    _print_summary(parsed, skipped, failed)
 
 
-def process_all_pdfs_parallel(use_ocr: bool = False):
-    print("🔎 Scanning folder for PDFs...")
-    files = os.listdir(INPUT_FOLDER)
-    pdf_files = [f for f in files if f.lower().endswith(".pdf")]
+def _init_worker(use_ocr: bool) -> None:
+    """Set up per-process state once instead of once per task."""
+    global _layout_ocr
+    if use_ocr:
+        # The pool already uses every core; one single-threaded Tesseract run per worker.
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        _layout_ocr = LayoutOCR(threads=1)
+
+
+def _page_count(pdf_path: str) -> int:
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _page_ranges(page_count: int, chunk_size: int = PAGE_CHUNK_SIZE) -> list[tuple[int, int]]:
+    return [(start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)] or [(0, 0)]
+
+
+def process_all_pdfs_parallel(use_ocr: bool = False, force_patterns: list[str] | None = None,
+                              max_workers: int | None = None,
+                              table_format: str = OUTPUT_FORMAT):
+    """
+    Parse PDFs with page-range tasks on a long-lived worker pool.
+
+    Each PDF becomes one task per PAGE_CHUNK_SIZE pages, submitted largest
+    PDF first so big reports do not straggle at the
+    end.  Workers only extract page records; the narrative, titles and header
+    carry-over are replayed in page order in this process once a PDF's tasks
+    have finished.
+    """
+    manifest, to_parse, skipped = _pending_pdfs(force_patterns, table_format)
+    page_counts = {fn: _page_count(os.path.join(INPUT_FOLDER, fn)) for fn, _ in to_parse}
+    to_parse.sort(key=lambda item: page_counts[item[0]], reverse=True)
     done = 0
 
-    with ProcessPoolExecutor() as executor:
-        futures = {
-            executor.submit(
-                process_pdf,
-                Event(reportName=fn, eventName=clean_filename(fn)),
-                idx + 1,
-                os.path.join(INPUT_FOLDER, fn),
-                use_ocr,
-            ): fn
-            for idx, fn in enumerate(pdf_files)
-        }
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_worker,
+                             initargs=(use_ocr,)) as executor:
+        pending: dict[str, dict] = {}
+        futures = {}
+        for idx, (fn, digest) in enumerate(to_parse, start=1):
+            pdf_path = os.path.join(INPUT_FOLDER, fn)
+            event = Event(reportName=fn, eventName=clean_filename(fn))
+            ranges = _page_ranges(page_counts[fn])
+            print(f"\n📄{idx} Queued PDF: {pdf_path} "
+                  f"({page_counts[fn]} pages, {len(ranges)} tasks)")
+            pending[fn] = {"event": event, "digest": digest,
+                           "records": [], "remaining": len(ranges), "error": None}
+            for start, end in ranges:
+                futures[executor.submit(extract_page_records, pdf_path,
+                                        use_ocr, start, end, digest)] = fn
+
         for future in as_completed(futures):
             fn = futures[future]
+            state = pending[fn]
+            state["remaining"] -= 1
             try:
-                future.result()
+                state["records"].extend(future.result())
+            except Exception as e:
+                state["error"] = e
+            if state["remaining"]:
+                continue
+
+            del pending[fn]
+            try:
+                if state["error"] is not None:
+                    raise state["error"]
+                apply_narrative(state["event"],
+                                narrative_from_records(state["event"], state["records"]))
+                write_event_output(state["event"], state["records"], table_format)
                 done += 1
+                record_parsed(manifest, fn, state["digest"], state["event"].eventName,
+                              table_format=table_format)
+                save_manifest(manifest)
                 print(f"✓ Finished {fn}")
             except Exception as e:
                 print(f"❌ Error processing {fn}: {e}")
 
-    print(f"\n🎉 Finished parsing all PDFs! {done}/{len(pdf_files)}")
+    _print_summary(done, skipped, len(to_parse) - done)
 
 
 # -----------------------------------------------------------------------
@@ -1090,9 +1574,22 @@ if __name__ == "__main__":
     parser.add_argument(
         "--sequential", action="store_true",
         help="Process PDFs sequentially instead of in parallel")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Worker processes for parallel parsing (default: CPU count)")
+    parser.add_argument(
+        "--format", choices=TABLE_FORMATS, default=OUTPUT_FORMAT, dest="table_format",
+        help="Write tables as CSV or as typed Parquet")
+    parser.add_argument(
+        "--force", action="append", default=[], metavar="PATTERN",
+        help="Reparse PDFs whose filename matches this glob even if unchanged "
+             "(repeatable; use '*' to reparse everything)")
     args = parser.parse_args()
 
     if args.sequential:
-        process_all_pdfs(use_ocr=args.ocr)
+        process_all_pdfs(use_ocr=args.ocr, force_patterns=args.force,
+                         table_format=args.table_format)
     else:
-        process_all_pdfs_parallel(use_ocr=args.ocr)
\ No newline at end of file
+        process_all_pdfs_parallel(use_ocr=args.ocr, force_patterns=args.force,
+                                  max_workers=args.workers,
+                                  table_format=args.table_format)
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+Reads and writes the tables a parser extracts from one report into its event folder,
+as CSV (the default) or typed Parquet, together with a `_tables.json`
+manifest listing every table, its file, row count and column types.
+
+Parquet columns are typed once here instead of on every transform run:
+location columns get the fixed schema of their table kind, and every other
+column is narrowed to Int64 / Float64 / Boolean when all of its values parse, which
+is the same inference `pl.read_csv` applies to the CSV output.
+"""
+
+import json
+import math
+import os
+from typing import Mapping
+
+import polars as pl
+
+TABLE_FORMATS = ("csv", "parquet")
+TABLE_EXTENSIONS = (".csv", ".parquet")
+TABLES_MANIFEST = "_tables.json"
+
+# Fixed columns of each table kind; anything else is a report-specific value column.
+TABLE_SCHEMAS: dict[str, dict[str, pl.DataType]] = {
+    "ndrrmc": {
+        "Page": pl.Int64(),
+        "Region": pl.Utf8(),
+        "Province": pl.Utf8(),
+        "City_Muni": pl.Utf8(),
+        "Barangay": pl.Utf8(),
+        "Summary_Type": pl.Utf8(),
+    },
+    "dromic": {
+        "region": pl.Utf8(),
+        "province": pl.Utf8(),
+        "municipality": pl.Utf8(),
+    },
+}
+
+
+def _cell(value) -> str | None:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    text = str(value)
+    return text if text != "" else None
+
+
+def _narrow(series: pl.Series) -> pl.Series:
+    """Int64, Float64 or Boolean when every non-null value converts; else keep Utf8."""
+    if series.null_count() == series.len():
+        return series
+    lowered = series.str.to_lowercase()
+    if lowered.is_in(["true", "false"]).sum() == series.len() - series.null_count():
+        return lowered == "true"
+    for dtype in (pl.Int64(), pl.Float64()):
+        cast = series.cast(dtype, strict=False)
+        if cast.null_count() == series.null_count():
+            return cast
+    return series
+
+
+def _unique_columns(columns: list[str]) -> list[str]:
+    """Rename repeated headers the way ``pl.read_csv`` does (``x_duplicated_0``)."""
+    seen: dict[str, int] = {}
+    unique = []
+    for col in columns:
+        if col in seen:
+            unique.append(f"{col}_duplicated_{seen[col]}")
+            seen[col] += 1
+        else:
+            unique.append(col)
+            seen[col] = 0
+    return unique
+
+
+def text_frame(columns: list[str], rows: list[list]) -> pl.DataFrame:
+    """Frame of the raw cell text (None / NaN / "" become null)."""
+    return pl.DataFrame({
+        col: pl.Series(col, [_cell(row[idx]) for row in rows], dtype=pl.Utf8())
+        for idx, col in enumerate(_unique_columns(columns))
+    })
+
+
+def typed_frame(columns: list[str], rows: list[list], kind: str) -> pl.DataFrame:
+    """Frame with the kind's fixed column types and inferred value columns."""
+    schema = TABLE_SCHEMAS.get(kind, {})
+    return pl.DataFrame([
+        series.cast(schema[series.name]) if series.name in schema else _narrow(series)
+        for series in text_frame(columns, rows).get_columns()
+    ])
+
+
+def _manifest_files(output_dir: str) -> set[str]:
+    """Table files the folder's existing manifest lists, if it has one."""
+    path = os.path.join(output_dir, TABLES_MANIFEST)
+    if not os.path.exists(path):
+        return set()
+    try:
+        with open(path, encoding="utf-8") as f:
+            tables = json.load(f).get("tables", {})
+    except (OSError, ValueError):
+        return set()
+    files = (os.path.basename(entry.get("file", "")) for entry in tables.values())
+    return {f for f in files if is_table_file(f)}
+
+
+def write_tables(output_dir: str, tables: dict[str, tuple[list[str], list[list]]],
+                 kind: str, table_format: str = "csv") -> dict:
+    """
+    Write ``{name: (columns, rows)}`` to ``output_dir`` and return the manifest.
+
+    A table written in one format replaces a same-named file in the other, so
+    transforms never see a report's table twice after switching formats, and
+    tables the previous manifest listed that this write no longer produces
+    are removed, so a rerun replaces the report's tables instead of adding to them.
+    """
+    if table_format not in TABLE_FORMATS:
+        raise ValueError(f"table_format must be one of {TABLE_FORMATS}")
+    os.makedirs(output_dir, exist_ok=True)
+    previous = _manifest_files(output_dir)
+
+    entries = {}
+    for name, (columns, rows) in tables.items():
+        df = typed_frame(columns, rows, kind)
+        filename = f"{name}.{table_format}"
+        path = os.path.join(output_dir, filename)
+        if table_format == "parquet":
+            df.write_parquet(path, compression="zstd", statistics=False)
+        else:
+            # CSV keeps the text as extracted; readers infer the same types.
+            text_frame(columns, rows).write_csv(path)
+        for other in TABLE_FORMATS:
+            stale = os.path.join(output_dir, f"{name}.{other}")
+            if other != table_format and os.path.exists(stale):
+                os.remove(stale)
+        entries[name] = {
+            "file": filename,
+            "rows": df.height,
+            "schema": {col: str(dtype) for col, dtype in df.schema.items()},
+        }
+
+    written = {entry["file"] for entry in entries.values()}
+    for filename in previous - written:
+        stale = os.path.join(output_dir, filename)
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    manifest = {"kind": kind, "format": table_format, "tables": entries}
+    with open(os.path.join(output_dir, TABLES_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+def frame_rows(df) -> tuple[list[str], list[list]]:
+    """Columns and row-major cells of a pandas DataFrame."""
+    return [str(c) for c in df.columns], df.astype(object).values.tolist()
+
+
+def dict_rows(rows: list[dict]) -> tuple[list[str], list[list]]:
+    """Columns (in first-seen order) and row-major cells of a list of dicts."""
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    return columns, [[row.get(col) for col in columns] for row in rows]
+
+
+def is_table_file(filename: str) -> bool:
+    """True for a parsed table, whichever format the parser wrote it in."""
+    return filename.endswith(TABLE_EXTENSIONS)
+
+
+def table_file(folder: str, stem: str) -> str:
+    """Path of a parsed table, preferring the typed Parquet file over CSV."""
+    parquet_path = os.path.join(folder, f"{stem}.parquet")
+    if os.path.exists(parquet_path):
+        return parquet_path
+    return os.path.join(folder, f"{stem}.csv")
+
+
+def read_table(
+    path: str,
+    schema_overrides: Mapping[str, pl.DataType] | None = None,
+) -> pl.DataFrame:
+    """
+    Read a parsed table. Parquet is memory-mapped with the types the parser
+    stored; CSV types are inferred as before.
+    """
+    if not path.endswith(".parquet"):
+        return pl.read_csv(
+            path,
+            schema_overrides=schema_overrides,
+            infer_schema_length=10000)
+
+    df = pl.read_parquet(path, memory_map=True)
+    if schema_overrides:
+        df = df.with_columns(
+            pl.col(col).cast(dtype)
+            for col, dtype in schema_overrides.items() if col in df.columns
+        )
+    return df
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from rdflib import Graph
 
+from semantic_processing.gazetteer import write_gazetteer
 from transform import psgc_datafile
 from validate.validate import ShaclValidationError, validate_graph
 
@@ -81,7 +82,7 @@ def run(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     staged_path.parent.mkdir(parents=True, exist_ok=True)
 
-    log.info("Step 1/3: Transforming PSGC workbook to staged RDF")
+    log.info("Step 1/4: Transforming PSGC workbook to staged RDF")
     graph, individual_count, part_count = build_psgc_graph(
         input_path,
         include_barangay=include_barangay,
@@ -95,14 +96,14 @@ def run(
     graph.serialize(destination=str(staged_path), format=rdf_format)
     log.info("Wrote staged PSGC RDF: %s", staged_path)
 
-    log.info("Step 2/3: Validating staged RDF")
+    log.info("Step 2/4: Validating staged RDF")
     try:
         validate_psgc_graph(staged_path, shapes_path=shapes_path)
     except ShaclValidationError:
         log.error("Validation failed; final PSGC RDF was not updated: %s", output_path)
         raise
 
-    log.info("Step 3/3: Promoting staged RDF to final output")
+    log.info("Step 3/4: Promoting staged RDF to final output")
     if keep_staged:
         shutil.copyfile(staged_path, output_path)
         log.info("Copied staged RDF to final output and kept staged file")
@@ -110,6 +111,9 @@ def run(
         staged_path.replace(output_path)
         log.info("Moved staged RDF to final output")
 
+    log.info("Step 4/4: Writing the location matchers' gazetteer")
+    write_gazetteer(output_path)
+
     log.info("=== PSGC pipeline complete: %s ===", output_path)
     return output_path
 
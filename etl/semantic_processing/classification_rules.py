@@ -1,3 +1,4 @@
+import re
 from typing import TypeAlias
 
 ClassificationRule: TypeAlias = (
@@ -10,6 +11,8 @@ ClassificationRule: TypeAlias = (
 # Matching: case-insensitive substring.
 #   - Any trigger token must appear in the text.
 #   - If context_tokens is present, at least one must also appear (AND requirement).
+# RuleMatcher (below) compiles a rule list once into a single regex over every
+# token, so a text is scanned once however many rules there are.
 #
 # ORDERING NOTE: ordering no longer affects correctness for labels listed in
 # AMBIGUOUS_GROUPS — _rule_candidates() collects ALL firing rules, and the
@@ -180,4 +183,100 @@ CLASSIFICATION_RULES: list[ClassificationRule] = [
     # ── Extraterrestrial ──────────────────────────────────────────────────────
     (["meteorite", "asteroid", "space impact"],                                   "SpaceImpact"),
     (["geomagnetic storm", "solar flare", "space weather"],                       "SpaceWeather"),
-]
\ No newline at end of file
+]
+
+
+# ── Compiled matcher ──────────────────────────────────────────────────────────
+
+def _trie_pattern(tokens: list[str]) -> str:
+    """
+    Regex matching any of *tokens*, as a trie of nested alternations so the
+    engine never re-reads a shared prefix. Longer continuations are tried
+    before stopping, so a match is always the longest token at its position.
+    """
+    trie: dict = {}
+    for token in tokens:
+        node = trie
+        for ch in token:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        end = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            body = (body if len(branches) > 1 else "(?:" + body + ")") + "?"
+        return body
+
+    return build(trie)
+
+
+class RuleMatcher:
+    """
+    A rule list compiled for `labels(text)`: every label whose rule fires on
+    the text, in rule order without repeats, exactly as checking each rule's
+    tokens with ``in`` would give.
+
+    The text is scanned once with a zero-width lookahead at every position,
+    which finds the longest token starting there even when matches overlap.
+    The other tokens starting at that position are its prefixes, so each
+    match expands to a precomputed prefix set.
+    """
+
+    def __init__(self, rules: list[ClassificationRule]) -> None:
+        self.rules: list[tuple[str, frozenset[str], frozenset[str] | None]] = []
+        for rule in rules:
+            tokens, label = rule[0], rule[1]
+            context = rule[2] if len(rule) > 2 else None  # type: ignore[misc]
+            self.rules.append((
+                label,
+                frozenset(t.lower() for t in tokens),
+                None if context is None else frozenset(c.lower() for c in context),
+            ))
+
+        vocabulary = sorted({
+            token
+            for _, triggers, context in self.rules
+            for token in triggers | (context or frozenset())
+            if token
+        })
+        self._prefixes = {
+            token: frozenset(t for t in vocabulary if token.startswith(t))
+            for token in vocabulary
+        }
+        # trigger token → indices of the rules it can fire
+        self._rules_by_trigger: dict[str, list[int]] = {}
+        for i, (_, triggers, _) in enumerate(self.rules):
+            for token in triggers:
+                self._rules_by_trigger.setdefault(token, []).append(i)
+        self._pattern = re.compile(f"(?=({_trie_pattern(vocabulary)}))") if vocabulary else None
+
+    def tokens_in(self, text: str) -> set[str]:
+        """Every rule token occurring in *text* (case-insensitive)."""
+        found: set[str] = set()
+        if self._pattern is None:
+            return found
+        prefixes = self._prefixes
+        for token in set(self._pattern.findall(text.lower())):
+            found |= prefixes[token]
+        return found
+
+    def labels(self, text: str) -> list[str]:
+        found = self.tokens_in(text)
+        triggered = sorted({
+            i for token in found for i in self._rules_by_trigger.get(token, ())
+        })
+        seen: set[str] = set()
+        labels: list[str] = []
+        for i in triggered:
+            label, _, context = self.rules[i]
+            if label in seen:
+                continue
+            if context is not None and context.isdisjoint(found):
+                continue
+            seen.add(label)
+            labels.append(label)
+        return labels
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
 from dataclasses import dataclass
@@ -10,12 +12,22 @@ from typing import Any
 from dateutil.parser import ParserError, parse
 from rdflib import Graph, Namespace, RDF, URIRef
 
+from semantic_processing.lazy import LazySingleton
+
 SKG = Namespace("https://sakuna.ph/")
 BAW = Namespace("https://raw.githubusercontent.com/beAWARE-project/ontology/master/beAWARE_ontology#")
 
 ONTOLOGY_PATH = str(Path(__file__).resolve().parents[2] / "ontology" / "sakunagraph.ttl")
 DEFAULT_MODEL = "fastino/gliner2-base-v1"
 
+# Texts per GLiNER2 forward pass.
+DEFAULT_BATCH_SIZE = int(os.getenv("GLINER2_BATCH_SIZE", "8"))
+
+# Narratives longer than CHUNK_CHARS are split into overlapping chunks so
+# nothing past the encoder's input length is silently dropped.
+CHUNK_CHARS = 1500
+CHUNK_OVERLAP = 200
+
 CLIMATE_PARAMETER_QUERY = """
 SELECT DISTINCT ?param WHERE {
   ?param a baw:ClimateParameterType .
@@ -122,6 +134,35 @@ EARTHQUAKE_DEPTH_SCHEMA = {
     ]
 }
 
+CLIMATE_PARAMETER_SCHEMA = {
+    "climate_parameters": [
+        "parameter::str::Climate parameter name or measurement type, such as temperature, magnitude, wind speed, precipitation, humidity, intensity",
+        "value::str::Numeric measured value",
+        "unit::str::Measurement unit",
+        "location::str::Location where the measurement applies",
+    ]
+}
+
+WARNING_SCHEMA = {
+    "warnings": [
+        "warning_released::str::Released disaster warning, alert level, Tropical Cyclone Wind Signal, rainfall warning, flood warning, storm surge warning, lahar alert, or similar warning",
+        "warning_timestamp::str::Date or time when the warning was issued, raised, released, or in effect",
+    ]
+}
+
+# Every structure extracted from a remarks text, in one GLiNER2 pass.
+EXTRACTION_SCHEMA = {
+    **EARTHQUAKE_MAGNITUDE_SCHEMA,
+    **EARTHQUAKE_DEPTH_SCHEMA,
+    **CLIMATE_PARAMETER_SCHEMA,
+    **WARNING_SCHEMA,
+}
+
+# Changes whenever the schema or chunking does, so cached results go stale with them.
+SCHEMA_VERSION = hashlib.sha256(
+    json.dumps([EXTRACTION_SCHEMA, CHUNK_CHARS, CHUNK_OVERLAP], sort_keys=True).encode("utf-8")
+).hexdigest()[:12]
+
 TIMESTAMP_PATTERN = re.compile(
     r"\b(?:as\s+of\s+)?"
     r"(?:(?:on\s+)?(?P<date1>\d{1,2}\s+"
@@ -262,7 +303,38 @@ def _looks_like_range_or_old_value(value: Any) -> bool:
     return "updated from" in text.lower()
 
 
-def _extract_earthquake_parameters(extractor: Any, text: str) -> list[ExtractedClimateParameter]:
+def _chunks(text: str, size: int = CHUNK_CHARS, overlap: int = CHUNK_OVERLAP) -> list[str]:
+    """
+    *text* split into pieces of at most *size* characters, each starting
+    *overlap* characters before the previous one ended. Pieces end at a
+    sentence or line break in their second half when there is one.
+    """
+    if len(text) <= size:
+        return [text]
+
+    chunks: list[str] = []
+    start = 0
+    while True:
+        end = min(start + size, len(text))
+        if end < len(text):
+            cut = max(text.rfind(". ", start + size // 2, end), text.rfind("\n", start + size // 2, end))
+            if cut != -1:
+                end = cut + 1
+        chunks.append(text[start:end])
+        if end >= len(text):
+            return chunks
+        start = max(end - overlap, start + 1)
+
+
+def _merge_results(results: list[Any]) -> dict[str, list[dict[str, Any]]]:
+    """One text's extraction result from the results of its chunks."""
+    return {
+        key: [item for result in results for item in _json_items(result, key)]
+        for key in EXTRACTION_SCHEMA
+    }
+
+
+def _extract_earthquake_parameters(raw: dict[str, Any]) -> list[ExtractedClimateParameter]:
     extracted: list[ExtractedClimateParameter] = []
     seen: dict[tuple[str, float], ExtractedClimateParameter] = {}
 
@@ -284,8 +356,7 @@ def _extract_earthquake_parameters(extractor: Any, text: str) -> list[ExtractedC
         seen[key] = item
         extracted.append(item)
 
-    magnitude_result = extractor.extract_json(text, EARTHQUAKE_MAGNITUDE_SCHEMA)
-    for item in _json_items(magnitude_result, "earthquake_magnitudes"):
+    for item in _json_items(raw, "earthquake_magnitudes"):
         raw_value = item.get("value")
         if _looks_like_range_or_old_value(raw_value):
             continue
@@ -296,8 +367,7 @@ def _extract_earthquake_parameters(extractor: Any, text: str) -> list[ExtractedC
 
         add_item("Magnitude", "magnitude", value, _normalize_unit(item.get("scale")))
 
-    depth_result = extractor.extract_json(text, EARTHQUAKE_DEPTH_SCHEMA)
-    for item in _json_items(depth_result, "earthquake_depths"):
+    for item in _json_items(raw, "earthquake_depths"):
         raw_value = item.get("value")
         if _looks_like_range_or_old_value(raw_value):
             continue
@@ -501,10 +571,16 @@ class ClimateParameterExtractor:
         self,
         model_name: str = DEFAULT_MODEL,
         ontology_path: str = ONTOLOGY_PATH,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cache_dir: str | os.PathLike[str] | None = None,
     ) -> None:
         self.model_name = os.getenv("GLINER2_MODEL", model_name)
         self.ontology_path = ontology_path
+        self.batch_size = batch_size
+        configured_cache = cache_dir or os.getenv("SAKUNA_GLINER2_CACHE_DIR")
+        self.cache_dir = Path(configured_cache) if configured_cache else None
         self._extractor: Any | None = None
+        self._raw_memo: dict[str, dict[str, Any]] = {}
         self.parameter_types = self._load_parameter_types()
 
     def _load_parameter_types(self) -> set[str]:
@@ -560,12 +636,79 @@ class ClimateParameterExtractor:
 
         return best_label
 
-    def extract(self, text: str) -> list[ExtractedClimateParameter]:
-        if not text.strip():
-            return []
+    # ── GLiNER2 pass ──────────────────────────────────────────────────────────
+
+    def _cache_key(self, text: str) -> str:
+        return hashlib.sha256(
+            f"{self.model_name}\n{SCHEMA_VERSION}\n{text}".encode("utf-8")
+        ).hexdigest()
+
+    def _cache_path(self, key: str) -> Path | None:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{key}.json"
 
+    def _batch_extract(self, chunks: list[str]) -> list[Any]:
         extractor = self._load_extractor()
-        extracted = _extract_earthquake_parameters(extractor, text)
+        batch_extract = getattr(extractor, "batch_extract_json", None)
+        if batch_extract is None:
+            return [extractor.extract_json(chunk, EXTRACTION_SCHEMA) for chunk in chunks]
+        return list(batch_extract(chunks, EXTRACTION_SCHEMA, batch_size=self.batch_size))
+
+    def _raw_extract_many(self, texts: list[str]) -> list[dict[str, Any]]:
+        """
+        The combined-schema result for every text: from memory or the disk
+        cache when the (model, schema version, text) key has been seen,
+        otherwise from one batched GLiNER2 run over the chunks of all the
+        remaining texts.
+        """
+        keys = [self._cache_key(text) for text in texts]
+        results: dict[str, dict[str, Any]] = {}
+        pending: dict[str, str] = {}
+
+        for key, text in zip(keys, texts):
+            if key in results or key in pending:
+                continue
+            if key in self._raw_memo:
+                results[key] = self._raw_memo[key]
+                continue
+            cache_path = self._cache_path(key)
+            if cache_path and cache_path.exists():
+                results[key] = json.loads(cache_path.read_text(encoding="utf-8"))
+                continue
+            pending[key] = text
+
+        if pending:
+            owners: list[str] = []
+            chunks: list[str] = []
+            for key, text in pending.items():
+                for chunk in _chunks(text):
+                    owners.append(key)
+                    chunks.append(chunk)
+
+            per_text: dict[str, list[Any]] = {key: [] for key in pending}
+            for key, result in zip(owners, self._batch_extract(chunks)):
+                per_text[key].append(result)
+
+            for key, chunk_results in per_text.items():
+                data = _merge_results(chunk_results)
+                results[key] = data
+                cache_path = self._cache_path(key)
+                if cache_path:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        if len(self._raw_memo) > 4096:
+            self._raw_memo.clear()
+        self._raw_memo.update(results)
+        return [results[key] for key in keys]
+
+    # ── Parsing ───────────────────────────────────────────────────────────────
+
+    def _climate_parameters_from_raw(
+        self, text: str, raw: dict[str, Any]
+    ) -> list[ExtractedClimateParameter]:
+        extracted = _extract_earthquake_parameters(raw)
         seen: set[tuple[str | None, float | None, str | None, str | None]] = {
             (item.parameter, item.value, item.unit, item.location)
             for item in extracted
@@ -576,19 +719,7 @@ class ClimateParameterExtractor:
             if item.parameter in {"Magnitude", "Depth"}
         }
 
-        result = extractor.extract_json(
-            text,
-            {
-                "climate_parameters": [
-                    "parameter::str::Climate parameter name or measurement type, such as temperature, magnitude, wind speed, precipitation, humidity, intensity",
-                    "value::str::Numeric measured value",
-                    "unit::str::Measurement unit",
-                    "location::str::Location where the measurement applies",
-                ]
-            },
-        )
-
-        raw_items = _json_items(result, "climate_parameters")
+        raw_items = _json_items(raw, "climate_parameters")
         if not raw_items:
             return extracted
 
@@ -621,10 +752,7 @@ class ClimateParameterExtractor:
 
         return extracted
 
-    def extract_warnings(self, text: str) -> list[ExtractedWarning]:
-        if not text.strip():
-            return []
-
+    def _warnings_from_raw(self, text: str, raw: dict[str, Any]) -> list[ExtractedWarning]:
         warnings: list[ExtractedWarning] = []
         seen: set[tuple[str, datetime | None]] = set()
 
@@ -635,27 +763,7 @@ class ClimateParameterExtractor:
             seen.add(key)
             warnings.append(warning)
 
-        extractor = self._load_extractor()
-        result = extractor.extract_json(
-            text,
-            {
-                "warnings": [
-                    "warning_released::str::Released disaster warning, alert level, Tropical Cyclone Wind Signal, rainfall warning, flood warning, storm surge warning, lahar alert, or similar warning",
-                    "warning_timestamp::str::Date or time when the warning was issued, raised, released, or in effect",
-                ]
-            },
-        )
-
-        raw_items = result.get("warnings") if isinstance(result, dict) else None
-        if isinstance(raw_items, dict):
-            raw_items = [raw_items]
-        if not isinstance(raw_items, list):
-            return warnings
-
-        for item in raw_items:
-            if not isinstance(item, dict):
-                continue
-
+        for item in _json_items(raw, "warnings"):
             raw_warning = str(item.get("warning_released") or "")
             warning = _expand_warning_level(raw_warning, text)
             if not warning:
@@ -680,5 +788,34 @@ class ClimateParameterExtractor:
 
         return warnings
 
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def extract_all_many(
+        self, texts: list[str]
+    ) -> list[tuple[list[ExtractedClimateParameter], list[ExtractedWarning]]]:
+        """(climate parameters, warnings) for every text, from one batched pass."""
+        nonblank = [text for text in texts if text.strip()]
+        raws = iter(self._raw_extract_many(nonblank)) if nonblank else iter(())
+
+        out: list[tuple[list[ExtractedClimateParameter], list[ExtractedWarning]]] = []
+        for text in texts:
+            if not text.strip():
+                out.append(([], []))
+                continue
+            raw = next(raws)
+            out.append((self._climate_parameters_from_raw(text, raw), self._warnings_from_raw(text, raw)))
+        return out
+
+    def extract_all(self, text: str) -> tuple[list[ExtractedClimateParameter], list[ExtractedWarning]]:
+        return self.extract_all_many([text])[0]
+
+    def extract(self, text: str) -> list[ExtractedClimateParameter]:
+        params, _ = self.extract_all(text)
+        return params
+
+    def extract_warnings(self, text: str) -> list[ExtractedWarning]:
+        _, warnings = self.extract_all(text)
+        return warnings
+
 
-PARAMS_EXTRACTOR = ClimateParameterExtractor()
+PARAMS_EXTRACTOR: ClimateParameterExtractor = LazySingleton(ClimateParameterExtractor)
@@ -1,21 +1,41 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
+import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, get_args
 
 import requests
 from dateutil.parser import ParserError, parse
 
+from http_session import make_session
+from semantic_processing.lazy import LazySingleton
+
 Provider = Literal["ollama", "openai_compatible", "lmstudio"]
 
 DEFAULT_PROVIDER = "lmstudio"
 
+log = logging.getLogger(__name__)
+
+# Requests in flight at once; match the server's parallel slots
+# (OLLAMA_NUM_PARALLEL, LM Studio's "max concurrent predictions").
+DEFAULT_CONCURRENCY = int(os.getenv("SAKUNA_LLM_CONCURRENCY", "4"))
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+
+LLM_CACHE_DIR = "../data/cache/llm"
+# Least recently used results are evicted once the cache exceeds this.
+DEFAULT_CACHE_MAX_MB = int(os.getenv("SAKUNA_LLM_CACHE_MAX_MB", "512"))
+
 ALLOWED_PARAMETERS = {
     "Temperature",
     "Magnitude",
@@ -240,6 +260,101 @@ def _warning_label(item: dict[str, Any]) -> str | None:
     return f"{warning_type} {signal}"
 
 
+class ResultCache:
+    """
+    Extraction results as one JSON file per key, bounded to ``max_bytes``.
+
+    ``index.json`` records each entry's size and last use, so eviction drops
+    the least recently used files without statting the directory. The index
+    is written every FLUSH_EVERY new entries and at exit; files it does not
+    know about (a crash, or a cache from before the index) are adopted on
+    load.
+    """
+
+    INDEX = "index.json"
+    FLUSH_EVERY = 50
+
+    def __init__(self, cache_dir: str | os.PathLike[str], max_bytes: int) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._unflushed = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+        atexit.register(self.flush)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self) -> dict[str, list[float]]:
+        """key → [size in bytes, last use as a Unix time]"""
+        try:
+            index = json.loads((self.cache_dir / self.INDEX).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = {}
+
+        on_disk = {p.stem: p for p in self.cache_dir.glob("*.json") if p.name != self.INDEX}
+        index = {key: entry for key, entry in index.items() if key in on_disk}
+        for key, path in on_disk.items():
+            if key not in index:
+                stat = path.stat()
+                index[key] = [stat.st_size, stat.st_mtime]
+        return index
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            with self._lock:
+                self._index.pop(key, None)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index[key][1] = time.time()
+        return data
+
+    def put(self, key: str, data: dict[str, Any]) -> None:
+        body = json.dumps(data, indent=2).encode("utf-8")
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+
+        with self._lock:
+            self._index[key] = [len(body), time.time()]
+            self._evict()
+            self._unflushed += 1
+            flush = self._unflushed >= self.FLUSH_EVERY
+        if flush:
+            self.flush()
+
+    def _evict(self) -> None:
+        total = sum(size for size, _ in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self._index, key=lambda k: self._index[k][1]):
+            size, _ = self._index.pop(key)
+            self._path(key).unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._unflushed += 1
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._unflushed:
+                return
+            index_path = self.cache_dir / self.INDEX
+            tmp = index_path.with_name(index_path.name + ".tmp")
+            try:
+                tmp.write_text(json.dumps(self._index), encoding="utf-8")
+                os.replace(tmp, index_path)
+            except OSError as e:
+                log.warning("Could not write LLM cache index (%s)", e)
+                return
+            self._unflushed = 0
+
+
 class LLMClimateParameterExtractor:
     def __init__(
         self,
@@ -249,24 +364,33 @@ class LLMClimateParameterExtractor:
         timeout: int | None = None,
         token: str | None = None,
         cache_dir: str | os.PathLike[str] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        cache_max_mb: int = DEFAULT_CACHE_MAX_MB,
     ) -> None:
         self.provider: Provider = (provider or os.getenv("SAKUNA_LLM_PROVIDER") or DEFAULT_PROVIDER)  # type: ignore[assignment]
+        if self.provider not in get_args(Provider):
+            raise ValueError(
+                f"Unsupported LLM provider {self.provider!r}; expected one of {sorted(get_args(Provider))}"
+            )
         self.model = model or os.getenv("SAKUNA_LLM_MODEL") 
         self.timeout = timeout or int(os.getenv("SAKUNA_LLM_TIMEOUT", "120"))
         self.base_url = (base_url or os.getenv("SAKUNA_LLM_BASE_URL"))
-        configured_cache = cache_dir or os.getenv("SAKUNA_LLM_CACHE_DIR")
-        self.cache_dir = Path(configured_cache) if configured_cache else None
+        self.token = token or os.getenv("LM_STUDIO_TOKEN")
+        self.concurrency = max(1, concurrency)
+        # Requests run at temperature 0, so retrying a POST is safe.
+        self.session = make_session(self.concurrency, retries, backoff, allowed_methods=("POST",))
 
+        # An empty SAKUNA_LLM_CACHE_DIR turns the cache off.
+        configured_cache = cache_dir if cache_dir is not None else os.getenv("SAKUNA_LLM_CACHE_DIR", LLM_CACHE_DIR)
+        self.cache_dir = Path(configured_cache) if configured_cache else None
+        self.cache = ResultCache(self.cache_dir, cache_max_mb * 1024 * 1024) if self.cache_dir else None
 
-
-    def _cache_path(self, text: str) -> Path | None:
-        if not self.cache_dir:
-            return None
-
-        key = hashlib.sha256(
+    def _cache_key(self, text: str) -> str:
+        return hashlib.sha256(
             f"{self.provider}\n{self.model}\n{text}".encode("utf-8")
         ).hexdigest()
-        return self.cache_dir / f"{key}.json"
 
     def _messages(self, text: str) -> list[dict[str, str]]:
         if self.provider == "lmstudio":
@@ -277,7 +401,7 @@ class LLMClimateParameterExtractor:
         ]
 
     def _call_openai_compatible(self, text: str) -> str:
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/chat/completions",
             json={
                 "model": self.model,
@@ -296,7 +420,7 @@ class LLMClimateParameterExtractor:
         return str(message.get("content", "")) if isinstance(message, dict) else ""
 
     def _call_ollama(self, text: str) -> str:
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/chat",
             json={
                 "model": self.model,
@@ -313,7 +437,7 @@ class LLMClimateParameterExtractor:
         return str(message.get("content", "")) if isinstance(message, dict) else ""
     
     def _call_lmstudio(self, text: str) -> str:
-        response = requests.post(
+        response = self.session.post(
             url=f"{self.base_url}/api/v1/chat",
             headers={
                 "Authorization": f"Bearer {self.token}",
@@ -344,24 +468,24 @@ class LLMClimateParameterExtractor:
         return ""
 
     def _raw_extract(self, text: str) -> dict[str, Any]:
-        cache_path = self._cache_path(text)
-        if cache_path and cache_path.exists():
-            return json.loads(cache_path.read_text(encoding="utf-8"))
+        key = self._cache_key(text)
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
 
         if self.provider == "ollama":
             content = self._call_ollama(text)
         elif self.provider == "openai_compatible":
             content = self._call_openai_compatible(text)
         elif self.provider == "lmstudio":
-            self.token = os.getenv("LM_STUDIO_TOKEN")
             content = self._call_lmstudio(text)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.provider}")
 
         data = _parse_json_object(content)
-        if cache_path:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        if self.cache:
+            self.cache.put(key, data)
         return data
 
     def _climate_parameters_from_json(self, data: dict[str, Any]) -> list[ExtractedClimateParameter]:
@@ -436,6 +560,36 @@ class LLMClimateParameterExtractor:
         data = self._raw_extract(text)
         return self._climate_parameters_from_json(data), self._warnings_from_json(data)
 
+    def extract_many(
+        self, texts: list[str]
+    ) -> list[tuple[list[ExtractedClimateParameter], list[ExtractedWarning]]]:
+        """
+        extract_all for every text, with up to ``concurrency`` requests in
+        flight over the pooled session. Repeated texts are sent once. A text
+        whose request still fails after the retries is logged and gets empty
+        results (and no cache entry), so one bad narrative does not stop a
+        backfill.
+        """
+        unique = list(dict.fromkeys(text for text in texts if text.strip()))
+
+        def raw_or_empty(text: str) -> dict[str, Any]:
+            try:
+                return self._raw_extract(text)
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                log.warning("LLM extraction failed (%s: %s); skipping text", type(e).__name__, e)
+                return {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            raws = dict(zip(unique, executor.map(raw_or_empty, unique)))
+        if self.cache:
+            self.cache.flush()
+
+        return [
+            (self._climate_parameters_from_json(raws[text]), self._warnings_from_json(raws[text]))
+            if text in raws else ([], [])
+            for text in texts
+        ]
+
     def extract(self, text: str) -> list[ExtractedClimateParameter]:
         params, _ = self.extract_all(text)
         return params
@@ -445,4 +599,4 @@ class LLMClimateParameterExtractor:
         return warnings
 
 
-PARAMS_EXTRACTOR = LLMClimateParameterExtractor()
+PARAMS_EXTRACTOR: LLMClimateParameterExtractor = LazySingleton(LLMClimateParameterExtractor)
@@ -1,16 +1,28 @@
-from sentence_transformers import SentenceTransformer, util
+import argparse
+import hashlib
+import logging
+import os
+import re
 from typing import List, Tuple
 from pathlib import Path
+
+import numpy as np
 from rdflib import Graph, RDF, Namespace, URIRef, RDFS, SKOS
 from rdflib.namespace import DefinedNamespace
 
 from .classification_rules import (
     CLASSIFICATION_RULES,
     ClassificationRule,
+    RuleMatcher,
     labels_are_ambiguous,
     ambiguous_candidate_set,
     LABEL_TO_GROUP
 )
+from .embedding_cache import EMBEDDING_CACHE_PATH, EmbeddingCache
+from .encoders import DEFAULT_BACKEND, DEFAULT_MODEL, ENCODER_BACKENDS, Encoder, encoder_key, load_encoder
+from .lazy import LazySingleton
+
+log = logging.getLogger(__name__)
 
 SKG = Namespace("https://sakuna.ph/")
 ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -28,6 +40,15 @@ SELECT DISTINCT ?c ?defi WHERE {
 ONTOLOGY_PATH = ROOT_DIR / "ontology" / "disaster_type_scheme.ttl"
 INIT_NS: dict[str, Namespace | type[DefinedNamespace]] = {"rdfs": RDFS, "skg": SKG, "skos": SKOS}
 
+# Encoder the module singleton uses (see encoders.py).
+CLASSIFIER_MODEL = os.getenv("SAKUNA_CLASSIFIER_MODEL", DEFAULT_MODEL)
+CLASSIFIER_BACKEND = os.getenv("SAKUNA_CLASSIFIER_BACKEND", DEFAULT_BACKEND)
+
+# Texts per forward pass of the sentence encoder.
+DEFAULT_BATCH_SIZE = int(os.getenv("SAKUNA_EMBEDDING_BATCH_SIZE", "64"))
+
+CLASS_EMBEDDINGS_SUFFIX = ".embeddings.npz"
+
 
 def _uri_to_label(graph: Graph, uri: URIRef) -> str:
     return graph.namespace_manager.normalizeUri(uri).split(":", 1)[1]
@@ -42,15 +63,43 @@ def _load_classes(graph: Graph) -> dict[str, str]:
     return classes
 
 
+def class_embeddings_path(ontology_path: str | Path, encoder: str) -> Path:
+    """disaster_type_scheme.ttl → disaster_type_scheme.<encoder key>.embeddings.npz"""
+    path = Path(ontology_path)
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", encoder)
+    return path.with_name(f"{path.stem}.{slug}{CLASS_EMBEDDINGS_SUFFIX}")
+
+
+def _definitions_hash(encoder: str, class_keys: list[str]) -> str:
+    digest = hashlib.sha256(encoder.encode("utf-8"))
+    for key in class_keys:
+        digest.update(b"\0" + key.encode("utf-8"))
+    return digest.hexdigest()
+
+
 class DisasterClassifier:
     def __init__(
         self,
         model_name: str,
         ontology_path: str | Path = ONTOLOGY_PATH,
         rules: list[ClassificationRule] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cache_path: str | os.PathLike[str] | None = EMBEDDING_CACHE_PATH,
+        backend: str = DEFAULT_BACKEND,
     ):
-        self.model = SentenceTransformer(model_name)
+        if backend not in ENCODER_BACKENDS:
+            raise ValueError(
+                f"unknown encoder backend {backend!r}; expected one of {sorted(ENCODER_BACKENDS)}"
+            )
+        self.model_name = model_name
+        self.backend = backend
+        # names model + backend in the embedding caches
+        self.encoder_key = encoder_key(model_name, backend)
+        self._encoder: Encoder | None = None
+        self.batch_size = batch_size
+        self.cache = EmbeddingCache(cache_path) if cache_path else None
         self.rules = rules if rules is not None else CLASSIFICATION_RULES
+        self._rule_matcher = RuleMatcher(self.rules)
         ontology_path = Path(ontology_path)
 
         g = Graph()
@@ -65,13 +114,61 @@ class DisasterClassifier:
 
         self.class_keys = list(self.classes.keys())
         self.class_labels = list(self.classes.values())
-        self.embeddings = self.model.encode(self.class_keys, convert_to_tensor=True)
+        # (n_classes, dim), L2-normalised: cosine similarity is a dot product
+        self.embeddings_path = class_embeddings_path(ontology_path, self.encoder_key)
+        self.embeddings = self._load_class_embeddings()
 
         # Pre-build a definition-key index keyed by label for fast candidate lookup
         self._label_to_idx: dict[str, int] = {
             label: i for i, label in enumerate(self.class_labels)
         }
 
+    # ── Model and class embeddings ────────────────────────────────────────────
+
+    @property
+    def encoder(self) -> Encoder:
+        """The sentence encoder, loaded the first time a text needs encoding."""
+        if self._encoder is None:
+            self._encoder = load_encoder(self.model_name, self.backend)
+        return self._encoder
+
+    def _load_class_embeddings(self) -> np.ndarray:
+        """
+        Definition embeddings from the file next to the ontology when its hash
+        matches the current definitions and model; otherwise encode them and
+        rewrite the file.
+        """
+        digest = _definitions_hash(self.encoder_key, self.class_keys)
+        path = self.embeddings_path
+        if path.exists():
+            with np.load(path) as stored:
+                if str(stored["hash"]) == digest:
+                    return stored["embeddings"]
+            log.info("Class embeddings in %s are stale; re-encoding", path)
+
+        embeddings = self.encode(self.class_keys)
+        try:
+            self.write_class_embeddings(embeddings, digest)
+        except OSError as e:
+            log.warning("Could not write class embeddings (%s)", e)
+        return embeddings
+
+    def write_class_embeddings(
+        self, embeddings: np.ndarray | None = None, digest: str | None = None
+    ) -> Path:
+        """Store the definition embeddings next to the ontology, atomically."""
+        if embeddings is None:
+            embeddings = self.encode(self.class_keys)
+        if digest is None:
+            digest = _definitions_hash(self.encoder_key, self.class_keys)
+
+        tmp = self.embeddings_path.with_name(self.embeddings_path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, hash=np.array(digest), embeddings=embeddings)
+        os.replace(tmp, self.embeddings_path)
+        log.info("Wrote %d class embeddings: %s", len(embeddings), self.embeddings_path)
+        return self.embeddings_path
+
     # ── Rule layer ────────────────────────────────────────────────────────────
 
     def _rule_candidates(self, text: str) -> list[str]:
@@ -79,61 +176,79 @@ class DisasterClassifier:
         Return ALL labels whose rules fire on *text* (no early exit).
         Preserves insertion order; deduplicates.
         """
-        text_lower = text.lower()
-        seen: set[str] = set()
-        candidates: list[str] = []
-
-        for rule in self.rules:
-            tokens, label = rule[0], rule[1]
-            context: list[str] | None = rule[2] if len(rule) > 2 else None
-
-            if label in seen:
-                continue
-            if not any(t.lower() in text_lower for t in tokens):
-                continue
-            if context is not None and not any(c.lower() in text_lower for c in context):
-                continue
-
-            seen.add(label)
-            candidates.append(label)
-
-        return candidates
+        return self._rule_matcher.labels(text)
 
     # ── Transformer layer ─────────────────────────────────────────────────────
 
-    def _transformer_pick(
-        self, text: str, restrict_to: list[str] | None = None
-    ) -> tuple[str, float]:
+    def encode(self, texts: List[str]) -> np.ndarray:
         """
-        Run the transformer over *restrict_to* labels (or all labels if None).
-        Returns (label, cosine_similarity).
+        L2-normalised embeddings for *texts*, shape (len(texts), dim).
+
+        Each distinct text is encoded once, cached texts not at all; the rest
+        go through the encoder in a single batched `encode` call.
         """
+        unique = list(dict.fromkeys(texts))
+        vectors = self.cache.get_many(self.encoder_key, unique) if self.cache else {}
+
+        missing = [t for t in unique if t not in vectors]
+        if missing:
+            encoded = self.encoder.encode(missing, self.batch_size)
+            fresh = dict(zip(missing, encoded))
+            vectors.update(fresh)
+            if self.cache:
+                self.cache.put_many(self.encoder_key, fresh)
+        log.debug("Encoded %d texts (%d cached)", len(missing), len(unique) - len(missing))
+
+        if not texts:
+            return np.empty((0, self.embeddings.shape[1]), dtype=np.float32)
+        return np.stack([vectors[t] for t in texts])
+
+    def _candidate_indices(self, restrict_to: list[str] | None) -> list[int]:
+        """Class indices the transformer may pick from for *restrict_to* labels
+        (or all labels if None)."""
         if restrict_to:
             indices = [
                 self._label_to_idx[lbl]
                 for lbl in restrict_to
                 if lbl in self._label_to_idx
             ]
-            if not indices:
-                # Fallback: none of the candidates exist in the ontology — use full space
-                indices = list(range(len(self.class_labels)))
-        else:
-            indices = list(range(len(self.class_labels)))
-
-        if not indices:
+            if indices:
+                return indices
+            # Fallback: none of the candidates exist in the ontology — use full space
+        return list(range(len(self.class_labels)))
+
+    def _transformer_pick_many(
+        self, texts: List[str], restrict_to: List[list[str] | None]
+    ) -> List[Tuple[str, float]]:
+        """
+        Run the transformer over each text's *restrict_to* labels.
+        Returns (label, cosine_similarity) per text.
+        """
+        if not self.class_labels:
             raise ValueError("Disaster classifier has no ontology labels to score.")
+        if not texts:
+            return []
 
-        candidate_embeddings = self.embeddings[indices]
-        text_embedding = self.model.encode([text], convert_to_tensor=True)
-        scores = util.cos_sim(text_embedding, candidate_embeddings)[0]
+        scores = self.encode(texts) @ self.embeddings.T  # (n_texts, n_classes)
 
-        best_local = scores.argmax().item()
-        best_idx = indices[best_local]
-        return self.class_labels[best_idx], scores[best_local].item()
+        allowed = np.zeros(scores.shape, dtype=bool)
+        for row, restrict in enumerate(restrict_to):
+            allowed[row, self._candidate_indices(restrict)] = True
+        best = np.where(allowed, scores, -np.inf).argmax(axis=1)
+
+        return [
+            (self.class_labels[idx], float(scores[row, idx]))
+            for row, idx in enumerate(best)
+        ]
+
+    def _transformer_pick(
+        self, text: str, restrict_to: list[str] | None = None
+    ) -> tuple[str, float]:
+        return self._transformer_pick_many([text], [restrict_to])[0]
 
     # ── Classification routing ────────────────────────────────────────────────
 
-    def _route(self, text: str) -> tuple[str, float]:
+    def _route(self, text: str) -> tuple[str, float] | list[str] | None:
         """
         Routing logic for a single text:
 
@@ -145,12 +260,15 @@ class DisasterClassifier:
            restricted to the union of their ambiguity groups.
         5. If candidates span unrelated groups (e.g. Fire + Flood — unusual
            but possible) → transformer restricted to the union of fired labels.
+
+        Returns the (label, 1.0) of a hard rule win, otherwise the labels the
+        transformer should choose among (None for the full label space).
         """
         candidates = self._rule_candidates(text)
 
         # Case 2: no rules fired
         if not candidates:
-            return self._transformer_pick(text, restrict_to=None)
+            return None
 
         # Case 3: single unambiguous candidate
         if len(candidates) == 1 or candidates[0] not in LABEL_TO_GROUP:
@@ -158,12 +276,9 @@ class DisasterClassifier:
 
         # Case 4 & 5: ambiguous candidates — transformer resolves
         if labels_are_ambiguous(candidates):
-            restrict = ambiguous_candidate_set(candidates)
-        else:
-            # Mixed groups or single ambiguous label — restrict to fired set + their siblings
-            restrict = ambiguous_candidate_set(candidates) or candidates
-
-        return self._transformer_pick(text, restrict_to=restrict)
+            return ambiguous_candidate_set(candidates)
+        # Mixed groups or single ambiguous label — restrict to fired set + their siblings
+        return ambiguous_candidate_set(candidates) or candidates
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -173,10 +288,45 @@ class DisasterClassifier:
 
         Returns a list of (predicted_class_label, confidence_score) tuples.
         Score is 1.0 for hard rule wins, cosine similarity otherwise.
+        The rule layer runs over every text first; the texts it cannot
+        decide are then embedded and scored together in one batch.
         """
-        return [self._route(text) for text in texts]
+        results: list[Tuple[str, float] | None] = [None] * len(texts)
+        pending: list[int] = []
+        restrict_to: list[list[str] | None] = []
+
+        for i, text in enumerate(texts):
+            routed = self._route(text)
+            if isinstance(routed, tuple):
+                results[i] = routed
+            else:
+                pending.append(i)
+                restrict_to.append(routed)
+
+        picks = self._transformer_pick_many([texts[i] for i in pending], restrict_to)
+        for i, pick in zip(pending, picks):
+            results[i] = pick
+
+        return results  # type: ignore[return-value]
 
 
-DISASTER_CLASSIFIER = DisasterClassifier(
-    model_name="all-mpnet-base-v2",
+DISASTER_CLASSIFIER: DisasterClassifier = LazySingleton(
+    lambda: DisasterClassifier(model_name=CLASSIFIER_MODEL, backend=CLASSIFIER_BACKEND)
 )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Precompute the disaster type definition embeddings next to the ontology."
+    )
+    parser.add_argument("--ontology", default=str(ONTOLOGY_PATH))
+    parser.add_argument("--model", default=CLASSIFIER_MODEL)
+    parser.add_argument("--backend", default=CLASSIFIER_BACKEND, choices=sorted(ENCODER_BACKENDS))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    DisasterClassifier(args.model, args.ontology, backend=args.backend).write_class_embeddings()
+
+
+if __name__ == "__main__":
+    main()
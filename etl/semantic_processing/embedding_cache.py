@@ -0,0 +1,81 @@
+"""
+Persistent sentence-embedding cache, one SQLite table keyed by
+(model name, sha256 of the text).
+
+Vectors are stored L2-normalised as float32, so a re-run of the classifier
+over texts it has already seen does no inference at all.
+
+    cache = EmbeddingCache("../data/cache/embeddings.sqlite")
+    found = cache.get_many("all-mpnet-base-v2", texts)   # {text: vector}
+    cache.put_many("all-mpnet-base-v2", {text: vector, ...})
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+
+EMBEDDING_CACHE_PATH = Path(os.getenv("SAKUNA_EMBEDDING_CACHE", "../data/cache/embeddings.sqlite"))
+
+# SQLite caps bound parameters per statement; look keys up in chunks below it.
+_LOOKUP_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model  TEXT NOT NULL,
+    key    TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, key)
+) WITHOUT ROWID;
+"""
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    def __init__(self, db_path: str | os.PathLike[str] = EMBEDDING_CACHE_PATH) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=60, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def get_many(self, model: str, texts: Sequence[str]) -> dict[str, np.ndarray]:
+        """Cached vectors for whichever of ``texts`` have one."""
+        by_key = {text_key(t): t for t in texts}
+        keys = list(by_key)
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start:start + _LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE model = ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    (model, *chunk),
+                )
+                for key, blob in rows:
+                    found[by_key[key]] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, model: str, vectors: Mapping[str, np.ndarray]) -> None:
+        rows = [
+            (model, text_key(t), np.asarray(v, dtype=np.float32).tobytes())
+            for t, v in vectors.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, key, vector) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,225 @@
+"""
+PSGC gazetteer: the part of psgc.ttl the location matchers read, as one
+Arrow IPC table next to the graph (psgc.ttl → psgc.gazetteer.arrow).
+
+One row per place, with its IRI, rdf:type, :geographicLevel, rdfs:label,
+skos:altLabels and the row indices of its :isPartOf parents. Rows of a
+type keep the order rdflib yields them when parsing the graph, and
+`individual` records the owl:NamedIndividual order, so matchers built from
+the gazetteer break ties exactly as matchers built from the graph.
+
+The file is written uncompressed, which polars memory-maps on load, so a
+worker process reads it in milliseconds instead of parsing the graph with
+rdflib. Each process still copies the columns into Python lists for the
+matchers' indexes (Gazetteer.from_frame); that memory is per process, not
+shared.
+
+    python -m semantic_processing.gazetteer ../data/rdf/psgc/psgc.ttl
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+from rdflib import OWL, RDF, RDFS, SKOS, Graph, Namespace, URIRef
+
+log = logging.getLogger(__name__)
+
+SKG = Namespace("https://sakuna.ph/")
+IS_PART_OF = SKG["isPartOf"]
+GEOGRAPHIC_LEVEL = SKG["geographicLevel"]
+
+GAZETTEER_SUFFIX = ".gazetteer.arrow"
+
+PLACE_CLASSES = (
+    "Country", "IslandGroup", "Region", "Province", "City",
+    "Municipality", "SubMunicipality", "Barangay", "Location",
+)
+
+SCHEMA = {
+    "iri": pl.Utf8,
+    "type": pl.Utf8,
+    "level": pl.Utf8,
+    "label": pl.Utf8,
+    "alt_labels": pl.List(pl.Utf8),
+    "part_of": pl.List(pl.Int32),
+    "individual": pl.Int32,
+}
+
+
+def gazetteer_path(graph_path: str | Path) -> Path:
+    path = Path(graph_path)
+    return path.with_name(path.stem + GAZETTEER_SUFFIX)
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def build_gazetteer(g: Graph) -> pl.DataFrame:
+    """Gazetteer rows for every place in ``g``; parents that are not typed
+    places themselves get a row with a null type so indices always resolve."""
+    rows: dict[URIRef, dict] = {}
+
+    for cls in PLACE_CLASSES:
+        for s in g.subjects(RDF.type, SKG[cls]):
+            if s in rows:
+                continue
+            label = g.value(s, RDFS.label)
+            level = g.value(s, GEOGRAPHIC_LEVEL)
+            rows[s] = {
+                "iri": str(s),
+                "type": cls,
+                "level": None if level is None else str(level),
+                "label": None if label is None else str(label),
+                "alt_labels": [str(alt) for alt in g.objects(s, SKOS.altLabel)],
+                "parents": list(g.objects(s, IS_PART_OF)),
+                "individual": None,
+            }
+
+    for pos, s in enumerate(g.subjects(RDF.type, OWL.NamedIndividual)):
+        if s in rows and rows[s]["individual"] is None:
+            rows[s]["individual"] = pos
+
+    for row in list(rows.values()):
+        for parent in row["parents"]:
+            if parent not in rows:
+                rows[parent] = {
+                    "iri": str(parent), "type": None, "level": None, "label": None,
+                    "alt_labels": [], "parents": [], "individual": None,
+                }
+
+    index = {s: i for i, s in enumerate(rows)}
+    for row in rows.values():
+        row["part_of"] = [index[p] for p in row.pop("parents")]
+
+    return pl.DataFrame(list(rows.values()), schema=SCHEMA)
+
+
+def write_gazetteer(graph_path: str | Path, out_path: str | Path | None = None) -> Path:
+    """Parse ``graph_path`` and write its gazetteer atomically."""
+    graph_path = Path(graph_path)
+    out_path = Path(out_path) if out_path else gazetteer_path(graph_path)
+
+    g = Graph()
+    g.parse(graph_path)
+    df = build_gazetteer(g)
+
+    # Workers may build the same artifact at once on a cold start; each writes
+    # its own temp file so os.replace never publishes a half-written one.
+    tmp = out_path.with_name(f"{out_path.name}.{os.getpid()}.tmp")
+    df.write_ipc(tmp, compression="uncompressed")
+    os.replace(tmp, out_path)
+    log.info("Wrote PSGC gazetteer (%d places): %s", len(df), out_path)
+    return out_path
+
+
+# =============================================================================
+# LOAD
+# =============================================================================
+
+@dataclass
+class Gazetteer:
+    iris: list[str]
+    types: list[Optional[str]]
+    levels: list[Optional[str]]
+    labels: list[Optional[str]]
+    alt_labels: list[list[str]]
+    part_of: list[list[int]]
+    individual: list[Optional[int]]
+
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame) -> "Gazetteer":
+        return cls(
+            iris=df["iri"].to_list(),
+            types=df["type"].to_list(),
+            levels=df["level"].to_list(),
+            labels=df["label"].to_list(),
+            alt_labels=df["alt_labels"].to_list(),
+            part_of=df["part_of"].to_list(),
+            individual=df["individual"].to_list(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.iris)
+
+    def rows_of_type(self, cls: str) -> list[int]:
+        return [i for i, t in enumerate(self.types) if t == cls]
+
+    def individuals(self) -> list[int]:
+        """Rows typed owl:NamedIndividual, in that triple's order."""
+        rows = [i for i, pos in enumerate(self.individual) if pos is not None]
+        return sorted(rows, key=self.individual.__getitem__)
+
+    def parent(self, row: int) -> Optional[str]:
+        """IRI of the first :isPartOf parent, as Graph.value would return it."""
+        parents = self.part_of[row]
+        return self.iris[parents[0]] if parents else None
+
+
+_loaded: dict[tuple[str, int, int], Gazetteer] = {}
+
+
+def _mtime(path: Path) -> int:
+    return path.stat().st_mtime_ns if path.exists() else 0
+
+
+def _read_fresh(path: Path, graph_path: Path) -> Optional[pl.DataFrame]:
+    """The artifact at ``path`` if it is at least as new as the graph and
+    has the current schema, else None."""
+    if not path.exists():
+        return None
+    if _mtime(path) < _mtime(graph_path):
+        return None
+    df = pl.read_ipc(path)
+    return df if df.schema == pl.Schema(SCHEMA) else None
+
+
+def load_gazetteer(graph_path: str | Path) -> Gazetteer:
+    """
+    The gazetteer for ``graph_path``: read from the memory-mapped artifact if
+    it is current, otherwise built from the graph (and written for next
+    time). Loaded gazetteers are shared within the process.
+    """
+    graph_path = Path(graph_path)
+    path = gazetteer_path(graph_path)
+
+    key = (str(path.resolve()), _mtime(path), _mtime(graph_path))
+    if key in _loaded:
+        return _loaded[key]
+
+    df = _read_fresh(path, graph_path)
+    if df is None:
+        log.info("PSGC gazetteer missing or stale for %s; building it", graph_path)
+        try:
+            write_gazetteer(graph_path, path)
+        except OSError as e:
+            log.warning("Could not write PSGC gazetteer (%s); using the graph directly", e)
+            g = Graph()
+            g.parse(graph_path)
+            return Gazetteer.from_frame(build_gazetteer(g))
+        key = (str(path.resolve()), _mtime(path), _mtime(graph_path))
+        df = pl.read_ipc(path)
+
+    _loaded[key] = Gazetteer.from_frame(df)
+    return _loaded[key]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write the PSGC gazetteer for a psgc.ttl graph.")
+    parser.add_argument("graph", nargs="?", default="../data/rdf/psgc/psgc.ttl")
+    parser.add_argument("--out", default=None, help="default: next to the graph")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    write_gazetteer(args.graph, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Module-level singletons that are built on first use instead of at import.
+
+    LOCATION_MATCHER = LazySingleton(lambda: LocationMatcher(PSGC_PATH))
+
+Importing the module costs nothing; the first attribute access builds the
+object (once, even with several threads) and every later access is
+forwarded to it.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LazySingleton(Generic[T]):
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+        self._instance: T | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """The wrapped object, building it if needed."""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+    def __repr__(self) -> str:
+        state = repr(self._instance) if self.loaded else "not loaded"
+        return f"<LazySingleton {state}>"
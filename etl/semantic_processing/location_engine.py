@@ -0,0 +1,115 @@
+"""
+One entry point for PSGC location matching, with a strategy per input shape:
+
+    hierarchical  "municipality,province,region" strings, one place each
+                  (NDRRMC and DROMIC tables; LocationMatcher.match)
+    cell          "|"-separated cells of hierarchical strings
+                  (GDA, DROMIC metadata; LocationMatcher.match_cell)
+    flat          "|"-separated cells of bare place names
+                  (EM-DAT; location_matcher_single.canonicalize_column)
+
+Every strategy reads the same PsgcIndex and REGION_ALIASES
+(location_index.py) and returns the matched IRIs per input value.
+
+    from semantic_processing.location_engine import LOCATION_ENGINE
+    LOCATION_ENGINE.match(["Naujan, Oriental Mindoro, MIMAROPA"])
+    LOCATION_ENGINE.match(["Quezon Cty | mnla"], strategy="flat")
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Protocol
+
+from semantic_processing import location_matcher_single
+from semantic_processing.lazy import LazySingleton
+from semantic_processing.location_index import PSGC_PATH, PsgcIndex, load_index
+from semantic_processing.location_matcher_v2 import LOCATION_MATCHER, LocationMatcher
+
+# Strategy each source's transform uses.
+SOURCE_STRATEGIES = {
+    "ndrrmc": "hierarchical",
+    "dromic": "hierarchical",
+    "gda": "cell",
+    "emdat": "flat",
+}
+
+
+class MatchStrategy(Protocol):
+    def match(self, values: list[str]) -> list[list[str]]:
+        """Matched IRIs for each value, in input order."""
+        ...
+
+
+class HierarchicalStrategy:
+    def __init__(self, matcher: LocationMatcher) -> None:
+        self.matcher = matcher
+
+    def match(self, values: list[str]) -> list[list[str]]:
+        return [list(iris) for iris in self.matcher.match_each(values)]
+
+
+class CellStrategy:
+    def __init__(self, matcher: LocationMatcher) -> None:
+        self.matcher = matcher
+
+    def match(self, values: list[str]) -> list[list[str]]:
+        return self.matcher.match_cells(values)
+
+
+class FlatStrategy:
+    def __init__(self, index: PsgcIndex, threshold: int = 80) -> None:
+        self.index = index
+        self.threshold = threshold
+
+    def match(self, values: list[str]) -> list[list[str]]:
+        return [
+            iris.split("|") if iris else []
+            for _, iris, _ in location_matcher_single.match_cells(
+                values, self.threshold, self.index)
+        ]
+
+
+STRATEGIES: dict[str, Callable[["LocationEngine"], MatchStrategy]] = {
+    "hierarchical": lambda engine: HierarchicalStrategy(engine.matcher),
+    "cell": lambda engine: CellStrategy(engine.matcher),
+    "flat": lambda engine: FlatStrategy(engine.index),
+}
+
+
+def register_strategy(name: str, factory: Callable[["LocationEngine"], MatchStrategy]) -> None:
+    STRATEGIES[name] = factory
+
+
+class LocationEngine:
+    def __init__(self, graph_path: str = PSGC_PATH) -> None:
+        self.graph_path = graph_path
+        self.index: PsgcIndex = load_index(graph_path)
+        self._matcher: LocationMatcher | None = None
+        self._strategies: dict[str, MatchStrategy] = {}
+
+    @property
+    def matcher(self) -> LocationMatcher:
+        """The hierarchical matcher; the module singleton for the default graph,
+        so the engine and LOCATION_MATCHER share one memo."""
+        if self._matcher is None:
+            self._matcher = (
+                LOCATION_MATCHER.get() if self.graph_path == PSGC_PATH
+                else LocationMatcher(self.graph_path)
+            )
+        return self._matcher
+
+    def strategy(self, name: str) -> MatchStrategy:
+        if name not in self._strategies:
+            if name not in STRATEGIES:
+                raise ValueError(f"unknown location strategy {name!r}; expected one of {sorted(STRATEGIES)}")
+            self._strategies[name] = STRATEGIES[name](self)
+        return self._strategies[name]
+
+    def match(self, values: list[str], strategy: str = "hierarchical") -> list[list[str]]:
+        return self.strategy(strategy).match(values)
+
+    def match_source(self, values: list[str], source: str) -> list[list[str]]:
+        return self.match(values, SOURCE_STRATEGIES[source])
+
+
+LOCATION_ENGINE: LocationEngine = LazySingleton(LocationEngine)
@@ -0,0 +1,286 @@
+"""
+Shared PSGC lookup index for every location matching strategy.
+
+One `PsgcIndex` per gazetteer holds the label, parent and region lookups
+that the hierarchical matcher (location_matcher_v2) walks and the flat name
+list that location_matcher_single scores against, so a process builds them
+once no matter how many matchers or strategies it uses. `REGION_ALIASES` is
+the single region alias table both read.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from rapidfuzz import process
+
+from semantic_processing.gazetteer import Gazetteer, load_gazetteer
+
+BASE_IRI = "https://sakuna.ph/"
+PSGC_PATH = "../data/rdf/psgc/psgc.ttl"
+
+# Query rows per rapidfuzz.process.cdist call; bounds the score matrix.
+FUZZY_BATCH_ROWS = 2048
+
+# Lower-cased region alias → PSGC region code.
+REGION_ALIASES: dict[str, str] = {
+    "i": "0100000000",
+    "1": "0100000000",
+    "region i": "0100000000",
+    "region 1": "0100000000",
+    "ilocos": "0100000000",
+    "ilocos region": "0100000000",
+    "north luzon": "0100000000",
+    "northern luzon": "0100000000",
+
+    "ii": "0200000000",
+    "2": "0200000000",
+    "region ii": "0200000000",
+    "region 2": "0200000000",
+    "cagayan valley": "0200000000",
+
+    "iii": "0300000000",
+    "3": "0300000000",
+    "region iii": "0300000000",
+    "region 3": "0300000000",
+    "central luzon": "0300000000",
+
+    "iv-a": "0400000000",
+    "4a": "0400000000",
+    "iva": "0400000000",
+    "region iv-a": "0400000000",
+    "calabarzon": "0400000000",
+    "region calabarzon": "0400000000",
+    "southern tagalog": "0400000000",
+    "south luzon": "0400000000",
+
+    "iv-b": "1700000000",
+    "4b": "1700000000",
+    "ivb": "1700000000",
+    "region iv-b": "1700000000",
+    "mimaropa": "1700000000",
+    "region mimaropa": "1700000000",
+
+    "v": "0500000000",
+    "5": "0500000000",
+    "region v": "0500000000",
+    "region 5": "0500000000",
+    "bicol": "0500000000",
+    "bicol region": "0500000000",
+
+    "vi": "0600000000",
+    "6": "0600000000",
+    "region vi": "0600000000",
+    "region 6": "0600000000",
+    "western visayas": "0600000000",
+
+    "vii": "0700000000",
+    "7": "0700000000",
+    "region vii": "0700000000",
+    "region 7": "0700000000",
+    "central visayas": "0700000000",
+
+    "viii": "0800000000",
+    "8": "0800000000",
+    "region viii": "0800000000",
+    "region 8": "0800000000",
+    "eastern visayas": "0800000000",
+
+    "ix": "0900000000",
+    "9": "0900000000",
+    "region ix": "0900000000",
+    "region 9": "0900000000",
+    "zamboanga peninsula": "0900000000",
+
+    "x": "1000000000",
+    "10": "1000000000",
+    "region x": "1000000000",
+    "region 10": "1000000000",
+    "northern mindanao": "1000000000",
+
+    "xi": "1100000000",
+    "11": "1100000000",
+    "region xi": "1100000000",
+    "davao": "1100000000",
+    "davao region": "1100000000",
+    "region 11": "1100000000",
+
+    "xii": "1200000000",
+    "12": "1200000000",
+    "region xii": "1200000000",
+    "region 12": "1200000000",
+    "soccsksargen": "1200000000",
+
+    "xiii": "1600000000",
+    "13": "1600000000",
+    "region xiii": "1600000000",
+    "region 13": "1600000000",
+    "caraga": "1600000000",
+    "rtr": "1600000000",
+
+    "ncr": "1300000000",
+    "metro manila": "1300000000",
+    "metropolitan manila": "1300000000",
+    "national capital region": "1300000000",
+
+    "car": "1400000000",
+    "cordillera": "1400000000",
+
+    "barmm": "1900000000",
+    "armm": "1900000000",
+    "bangsamoro": "1900000000",
+
+    "nir": "1800000000",
+    "negros island region": "1800000000",
+}
+
+# :geographicLevel values the flat matcher scores against.
+FLAT_LEVELS = {"Reg", "Prov", "City", "Mun", "SubMun"}
+
+
+class PsgcIndex:
+    def __init__(self, gazetteer: Gazetteer) -> None:
+        self.gazetteer = gazetteer
+        self._load_hierarchy()
+        self._build_hierarchy_indexes()
+        self._load_flat()
+
+    # --------------------------------------------------
+    # Hierarchical lookups (location_matcher_v2)
+    # --------------------------------------------------
+    def _load_hierarchy(self) -> None:
+        gz = self.gazetteer
+
+        # IRI → label
+        self.municipalities: dict[str, str] = {}
+        # IRI -> IRI of the parent
+        self.municipalities_parent: dict[str, str] = {}
+        # label → IRI
+        self.provinces: dict[str, str] = {}
+        # altLabel → IRI, merged into municipalities_rev
+        self.municipalities_alts: dict[str, str] = {}
+
+        for cls in ("Municipality", "City", "SubMunicipality"):
+            for row in gz.rows_of_type(cls):
+                iri = gz.iris[row]
+                self.municipalities[iri] = str(gz.labels[row]).lower()
+                self.municipalities_parent[iri] = str(gz.parent(row))
+                for alt in gz.alt_labels[row]:
+                    self.municipalities_alts[alt.lower()] = iri
+
+        for row in gz.rows_of_type("Province"):
+            iri = gz.iris[row]
+            self.provinces[str(gz.labels[row]).lower()] = iri
+            for alt in gz.alt_labels[row]:
+                self.provinces[alt.lower()] = iri
+
+        # reverse lookup: primary labels first, then alt labels (primary wins on collision)
+        self.municipalities_rev = {
+            label.lower(): iri for iri, label in self.municipalities.items()
+        }
+        self.municipalities_rev.update(self.municipalities_alts)
+
+    def _build_hierarchy_indexes(self) -> None:
+        """
+        Precompute every lookup the hierarchical matcher used to scan for:
+        label → IRIs, (label, parent) → IRI, parent → children, and
+        region → municipalities (directly or via a province).
+        Lists keep load order so ties resolve as a linear scan would.
+        """
+        self.muni_order = {iri: pos for pos, iri in enumerate(self.municipalities)}
+        self.by_label: dict[str, list[str]] = defaultdict(list)
+        self.by_label_parent: dict[tuple[str, str], str] = {}
+        self.child_labels: dict[str, list[str]] = defaultdict(list)
+        region_members: dict[str, dict[str, str]] = defaultdict(dict)
+
+        row_of = {iri: row for row, iri in enumerate(self.gazetteer.iris)}
+        grandparents: dict[str, str] = {}
+        for iri, label in self.municipalities.items():
+            parent = self.municipalities_parent[iri]
+            self.by_label[label].append(iri)
+            self.by_label_parent.setdefault((label, parent), iri)
+            self.child_labels[parent].append(label)
+
+            if parent not in grandparents:
+                row = row_of.get(parent)
+                grandparents[parent] = str(self.gazetteer.parent(row) if row is not None else None)
+            region_members[parent][iri] = label
+            region_members[grandparents[parent]][iri] = label
+
+        # region → ({muni_iri: label}, label → first muni IRI)
+        self.region_index: dict[str, tuple[dict[str, str], dict[str, str]]] = {}
+        for region_iri, members in region_members.items():
+            first_by_label: dict[str, str] = {}
+            for iri, label in members.items():
+                first_by_label.setdefault(label, iri)
+            self.region_index[region_iri] = (members, first_by_label)
+
+        self.region_choices = list(REGION_ALIASES.keys())
+        self.province_choices = list(self.provinces.keys())
+        self.municipality_choices = list(self.municipalities_rev.keys())
+
+    # --------------------------------------------------
+    # Flat name list (location_matcher_single)
+    # --------------------------------------------------
+    def _load_flat(self) -> None:
+        gz = self.gazetteer
+
+        # Every labelled individual at a FLAT_LEVELS level, in graph order;
+        # a repeated label maps to its last IRI.
+        self.names: list[str] = []
+        self.name2iri: dict[str, str] = {}
+        for row in gz.individuals():
+            if gz.levels[row] not in FLAT_LEVELS or gz.labels[row] is None:
+                continue
+            self.names.append(gz.labels[row])
+            self.name2iri[gz.labels[row]] = gz.iris[row]
+
+        self.iri2name = {iri: name for name, iri in self.name2iri.items()}
+
+        # (child IRI, parent IRI) for every :isPartOf triple
+        self.part_of: set[tuple[str, str]] = {
+            (gz.iris[row], gz.iris[parent])
+            for row in range(len(gz))
+            for parent in gz.part_of[row]
+        }
+
+
+_indexes: dict[int, PsgcIndex] = {}
+
+
+def load_index(graph_path: str = PSGC_PATH) -> PsgcIndex:
+    """The shared index for ``graph_path``, rebuilt only when its gazetteer is."""
+    gazetteer = load_gazetteer(graph_path)
+    key = id(gazetteer)
+    if key not in _indexes or _indexes[key].gazetteer is not gazetteer:
+        _indexes[key] = PsgcIndex(gazetteer)
+    return _indexes[key]
+
+
+def best_matches(
+    queries:      Sequence[str],
+    choice_keys:  Sequence[str],
+    scorer:       Callable,
+    score_cutoff: Optional[float] = None,
+) -> list[tuple[int, float]]:
+    """
+    (index of the best choice, its raw score) per query, from one
+    rapidfuzz.process.cdist call per FUZZY_BATCH_ROWS queries on all cores.
+    Strings are compared as given; ties go to the first choice, as with
+    process.extractOne.
+    """
+    best: list[tuple[int, float]] = []
+    for start in range(0, len(queries), FUZZY_BATCH_ROWS):
+        scores = process.cdist(
+            queries[start:start + FUZZY_BATCH_ROWS],
+            choice_keys,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+            workers=-1,
+        )
+        cols = scores.argmax(axis=1)
+        best.extend((int(col), float(row[col])) for row, col in zip(scores, cols))
+    return best
@@ -9,12 +9,14 @@ import polars as pl
 from rapidfuzz import process, fuzz
 from dataclasses import dataclass
 
-from rdflib import Graph, Namespace, URIRef, Literal
-from rdflib.namespace import RDF, RDFS, OWL
+from rdflib import Namespace, URIRef
 
+from semantic_processing.location_index import (
+    BASE_IRI, PSGC_PATH, REGION_ALIASES, PsgcIndex, best_matches, load_index
+)
 
-BASE_IRI  = "https://sakuna.ph/"
-TTL_PATH  = "../data/rdf/psgc/psgc.ttl"
+
+TTL_PATH  = PSGC_PATH
 
 SAKUNA    = Namespace(BASE_IRI)
 IS_PART_OF = SAKUNA.isPartOf
@@ -36,168 +38,65 @@ class LocationMatch:
 
 _names:    list[str]      | None = None
 _name2iri: dict[str, URIRef] | None = None
-_graph:    Graph           | None = None   # full rdflib graph, for isPartOf queries
+_part_of:  set[tuple[str, str]] | None = None   # (child IRI, parent IRI) pairs
 
 
 def _ensure_loaded() -> tuple[list[str], dict[str, URIRef]]:
-    global _names, _name2iri, _graph
+    global _names, _name2iri, _part_of
     if _names is None:
-        _names, _name2iri, _graph = _load_locations(TTL_PATH)
+        _names, _name2iri, _part_of = _load_locations(TTL_PATH)
     return _names, _name2iri
 
 
-def _load_locations(ttl_path: str) -> tuple[list[str], dict[str, URIRef], Graph]:
-    """
-    Parse psgc.ttl with rdflib.
-    Extracts every NamedIndividual whose :geographicLevel is one of the
-    recognised levels, building the name→IRI lookup used for fuzzy matching.
-    The full Graph is also returned so _match_cell can query :isPartOf.
-    """
-    level_map = {"Reg", "Prov", "City", "Mun", "SubMun"}
+def use_graph(ttl_path: str) -> None:
+    """Match against another PSGC graph from now on. This rebinds the module
+    for every caller; to match one batch against another graph, pass its
+    PsgcIndex to match_cells instead."""
+    global TTL_PATH, _names, _name2iri, _part_of
+    TTL_PATH = ttl_path
+    _names = _name2iri = _part_of = None
+    _psgc2name.clear()
 
-    g = Graph()
-    g.parse(ttl_path, format="turtle")
-    g.bind("", SAKUNA)
 
-    names:    list[str]         = []
-    name2iri: dict[str, URIRef] = {}
+# id(index) → (index, name → IRI) for indexes passed in explicitly
+_index_iris: dict[int, tuple[PsgcIndex, dict[str, URIRef]]] = {}
 
-    geo_level_pred = SAKUNA.geographicLevel
 
-    for subj in g.subjects(RDF.type, OWL.NamedIndividual):
-        level_lit = g.value(subj, geo_level_pred)
-        if level_lit is None:
-            continue
-        level = str(level_lit)
-        if level not in level_map:
-            continue
-        label_lit = g.value(subj, RDFS.label)
-        if label_lit is None:
-            continue
-        label = str(label_lit)
-        names.append(label)
-        name2iri[label] = URIRef(subj)
+def _lookups(index: PsgcIndex | None = None) -> tuple[list[str], dict[str, URIRef], set[tuple[str, str]] | None]:
+    """Names, name→IRI and :isPartOf pairs of ``index``, or of TTL_PATH's graph."""
+    if index is None:
+        names, name2iri = _ensure_loaded()
+        return names, name2iri, _part_of
+    cached = _index_iris.get(id(index))
+    if cached is None or cached[0] is not index:
+        cached = (index, {name: URIRef(iri) for name, iri in index.name2iri.items()})
+        _index_iris[id(index)] = cached
+    return index.names, cached[1], index.part_of
 
-    return names, name2iri, g
+
+def _load_locations(ttl_path: str) -> tuple[list[str], dict[str, URIRef], set[tuple[str, str]]]:
+    """
+    Flat PSGC name list from the shared index (see location_index.py): every
+    NamedIndividual at a recognised :geographicLevel, with its name→IRI
+    lookup. The :isPartOf pairs are also returned so _match_cell can check parents.
+    """
+    index = load_index(ttl_path)
+    name2iri = {name: URIRef(iri) for name, iri in index.name2iri.items()}
+    return index.names, name2iri, index.part_of
 
 
 # ---------------------------------------------------------------------------
 # 3. Region alias map — exact (case-insensitive) lookup before fuzzy
 # ---------------------------------------------------------------------------
-# Maps lowercased aliases → PSGC code. The canonical name is resolved from
-# psgc.ttl at runtime so it stays in sync with the ontology.
-_REGION_ALIAS_MAP: dict[str, str] = {
-    "i":                        "0100000000",
-    "1":                        "0100000000",
-    "region i":                 "0100000000",
-    "region 1":                 "0100000000",
-    "ilocos":                   "0100000000",
-    "ilocos region":            "0100000000",
-    "north luzon":            "0100000000",
-    "northern luzon": "0100000000",
-
-    "ii":                       "0200000000",
-    "2":                        "0200000000",
-    "region ii":                "0200000000",
-    "region 2":                 "0200000000",
-    "cagayan valley":           "0200000000",
-
-    "iii":                      "0300000000",
-    "3":                        "0300000000",
-    "region iii":               "0300000000",
-    "region 3":                 "0300000000",
-    "central luzon":            "0300000000",
-
-    "iv-a":                     "0400000000",
-    "4a":                       "0400000000",
-    "iva":                      "0400000000",
-    "region iv-a":              "0400000000",
-    "calabarzon":               "0400000000",
-    "southern tagalog":               "0400000000",
-    "south luzon":               "0400000000",
-
-    "iv-b":                     "1700000000",
-    "4b":                       "1700000000",
-    "ivb":                      "1700000000",
-    "region iv-b":              "1700000000",
-    "mimaropa":                 "1700000000",
-
-    "v":                        "0500000000",
-    "5":                        "0500000000",
-    "region v":                 "0500000000",
-    "region 5":                 "0500000000",
-    "bicol":                    "0500000000",
-    "bicol region":             "0500000000",
-
-    "vi":                       "0600000000",
-    "6":                        "0600000000",
-    "region vi":                "0600000000",
-    "region 6":                 "0600000000",
-    "western visayas":          "0600000000",
-
-    "vii":                      "0700000000",
-    "7":                        "0700000000",
-    "region vii":               "0700000000",
-    "region 7":                 "0700000000",
-    "central visayas":          "0700000000",
-
-    "viii":                     "0800000000",
-    "8":                        "0800000000",
-    "region viii":              "0800000000",
-    "region 8":                 "0800000000",
-    "eastern visayas":          "0800000000",
-
-    "ix":                       "0900000000",
-    "9":                        "0900000000",
-    "region ix":                "0900000000",
-    "region 9":                 "0900000000",
-    "zamboanga peninsula":      "0900000000",
-
-    "x":                        "1000000000",
-    "10":                       "1000000000",
-    "region x":                 "1000000000",
-    "region 10":                "1000000000",
-    "northern mindanao":        "1000000000",
-
-    "xi":                       "1100000000",
-    "11":                       "1100000000",
-    "region xi":                "1100000000",
-    "region 11":                "1100000000",
-    "davao region":             "1100000000",
-
-    "xii":                      "1200000000",
-    "12":                       "1200000000",
-    "region xii":               "1200000000",
-    "region 12":                "1200000000",
-    "soccsksargen":             "1200000000",
-
-    "xiii":                     "1600000000",
-    "13":                       "1600000000",
-    "region xiii":              "1600000000",
-    "region 13":                "1600000000",
-    "caraga":                   "1600000000",
-    "rtr":                      "1600000000",
-
-    "ncr":                      "1300000000",
-    "metro manila":             "1300000000",
-    "national capital region":  "1300000000",
-    "metropolitan manila":  "1300000000",
-
-    "car":                      "1400000000",
-    "cordillera":               "1400000000",
-
-    "barmm":                    "1900000000",
-    "armm":                     "1900000000",
-    "bangsamoro":               "1900000000",
-
-    "nir":                      "1800000000",
-    "negros island region":     "1800000000",
-}
+# Maps lowercased aliases → PSGC code (location_index.REGION_ALIASES, shared
+# with location_matcher_v2). The canonical name is resolved from psgc.ttl at
+# runtime so it stays in sync with the ontology.
+_REGION_ALIAS_MAP = REGION_ALIASES
 
 # Build reverse map: psgc_code → canonical name (populated lazily from TTL)
 _psgc2name: dict[str, str] = {}
 
-def _resolve_region_alias(value: str) -> LocationMatch | None:
+def _resolve_region_alias(value: str, index: PsgcIndex | None = None) -> LocationMatch | None:
     """Exact alias lookup (case-insensitive). Resolves name from TTL."""
     psgc_code = _REGION_ALIAS_MAP.get(value.strip().lower())
     if not psgc_code:
@@ -205,6 +104,10 @@ def _resolve_region_alias(value: str) -> LocationMatch | None:
 
     iri = f"{BASE_IRI}{psgc_code}"
 
+    if index is not None:
+        name = index.iri2name.get(iri, psgc_code)
+        return LocationMatch(name=name, iri=URIRef(iri), score=100.0)
+
     # Resolve canonical name from TTL if not cached yet
     if psgc_code not in _psgc2name:
         _, name2iri = _ensure_loaded()
@@ -254,7 +157,7 @@ _BROAD_OVERRIDES: list[tuple[re.Pattern, str, str]] = [
 ]
 
 
-def _override_matches(value: str) -> list[LocationMatch]:
+def _override_matches(value: str, index: PsgcIndex | None = None) -> list[LocationMatch]:
     """
     Return a list of LocationMatches for broad/vague region keywords.
     Island groups (Luzon, Visayas, Mindanao) expand to all constituent regions.
@@ -264,7 +167,7 @@ def _override_matches(value: str) -> list[LocationMatch]:
     # Check island-group expansions first — only when value is EXACTLY the island name
     for pattern, psgc_codes in _ISLAND_GROUP_EXPANSIONS:
         if pattern.match(value.strip()):
-            _, name2iri = _ensure_loaded()
+            _, name2iri, _ = _lookups(index)
             iri2name = {str(v): k for k, v in name2iri.items()}
             results = []
             for code in psgc_codes:
@@ -351,40 +254,75 @@ def match_location(
 # 4. Polars integration
 # ---------------------------------------------------------------------------
 
-def _match_cell(value: str, threshold: int) -> tuple[str | None, str | None, float | None]:
+def _split_cell(value: str) -> list[str]:
+    return [t.strip() for t in value.split("|") if t.strip()]
+
+
+def _fuzzy_matches(
+    tokens:    list[str],
+    threshold: int,
+    index:     PsgcIndex | None = None,
+) -> dict[str, tuple[str, float] | None]:
+    """
+    Best WRatio match for every token, scored against the full PSGC list in
+    bulk (location_index.best_matches). Gives the same (name, score) as
+    process.extractOne per token, or None below threshold.
+    """
+    names, _, _ = _lookups(index)
+    if not names:
+        return dict.fromkeys(tokens)
+    best = best_matches(tokens, names, fuzz.WRatio, score_cutoff=threshold)
+    return {
+        token: (names[col], score) if score >= threshold else None
+        for token, (col, score) in zip(tokens, best)
+    }
+
+
+def _match_cell(
+    value:     str,
+    threshold: int,
+    fuzzy:     dict[str, tuple[str, float] | None] | None = None,
+    index:     PsgcIndex | None = None,
+) -> tuple[str | None, str | None, float | None]:
     """
     Handle a single cell value, which may contain multiple locations separated by |.
     Returns (names_str, iris_str, avg_score) where names/iris are | joined.
     Unmatched tokens are skipped; returns (None, None, None) if nothing matched.
+    `fuzzy` holds fuzzy results precomputed by _fuzzy_matches; tokens missing
+    from it are matched one at a time. `index` is the PSGC graph to match
+    against; None means TTL_PATH's.
 
     When exactly two distinct IRIs are matched, checks whether one is
-    :isPartOf the other via the loaded PSGC graph. If so, the parent is
+    :isPartOf the other in the PSGC gazetteer. If so, the parent is
     dropped and only the more granular (child) location is kept.
     """
     if not value:
         return None, None, None
 
-    tokens  = [t.strip() for t in value.split("|") if t.strip()]
+    tokens  = _split_cell(value)
+    names, name2iri, part_of = _lookups(index)
 
     matched: list[LocationMatch] = []
     for t in tokens:
         # 1. Island group expansion — must be checked first and only fires on exact names
-        expansions = _override_matches(t)
+        expansions = _override_matches(t, index)
         if expansions:
             matched.extend(expansions)
             continue
 
         # 2. Exact region alias (roman numerals, numbers, common names)
-        alias = _resolve_region_alias(t)
+        alias = _resolve_region_alias(t, index)
         if alias:
             matched.append(alias)
             continue
 
         # 3. Fuzzy match against full PSGC list
-        names, name2iri = _ensure_loaded()
-        result = process.extractOne(t, names, scorer=fuzz.WRatio, score_cutoff=threshold)
+        if fuzzy is not None and t in fuzzy:
+            result = fuzzy[t]
+        else:
+            result = process.extractOne(t, names, scorer=fuzz.WRatio, score_cutoff=threshold)
         if result:
-            matched_name, score, _ = result
+            matched_name, score = result[0], result[1]
             matched.append(LocationMatch(name=matched_name, iri=name2iri[matched_name], score=score))
 
     if not matched:
@@ -401,13 +339,13 @@ def _match_cell(value: str, threshold: int) -> tuple[str | None, str | None, flo
     # isPartOf deduplication — only when exactly 2 distinct IRIs remain.
     # If iri_a isPartOf iri_b (a is the child, b is the parent), drop b.
     # If iri_b isPartOf iri_a (b is the child, a is the parent), drop a.
-    if len(unique) == 2 and _graph is not None:
+    if len(unique) == 2 and part_of is not None:
         a, b = unique[0], unique[1]
-        a_iri, b_iri = URIRef(a.iri), URIRef(b.iri)
-        if (a_iri, IS_PART_OF, b_iri) in _graph:
+        a_iri, b_iri = str(a.iri), str(b.iri)
+        if (a_iri, b_iri) in part_of:
             # a is a child of b → b is the parent, drop it
             unique = [a]
-        elif (b_iri, IS_PART_OF, a_iri) in _graph:
+        elif (b_iri, a_iri) in part_of:
             # b is a child of a → a is the parent, drop it
             unique = [b]
 
@@ -418,6 +356,29 @@ def _match_cell(value: str, threshold: int) -> tuple[str | None, str | None, flo
     return names_str, iris_str, avg_score
 
 
+def match_cells(
+    values:    list[str | None],
+    threshold: int = 80,
+    index:     PsgcIndex | None = None,
+) -> list[tuple[str | None, str | None, float | None]]:
+    """
+    _match_cell for a whole column: (names_str, iris_str, avg_score) per value.
+    Matches against ``index`` when given, else against TTL_PATH's graph.
+    """
+    cells  = list(dict.fromkeys(v for v in values if v))
+
+    tokens = dict.fromkeys(t for v in cells for t in _split_cell(v))
+    fuzzy  = _fuzzy_matches(
+        [t for t in tokens
+         if not _override_matches(t, index) and not _resolve_region_alias(t, index)],
+        threshold,
+        index,
+    )
+
+    by_cell = {v: _match_cell(v, threshold, fuzzy, index) for v in cells}
+    return [by_cell.get(v, (None, None, None)) for v in values]
+
+
 def canonicalize_column(
     df:        pl.DataFrame,
     col:       str,
@@ -439,9 +400,12 @@ def canonicalize_column(
         df = canonicalize_column(df, "raw_location")
         # "Quezon Cty | mnla" → name: "Quezon City|City of Manila"
         #                      → iri:  "https://...| https://..."
+
+    Each distinct cell is matched once, and the tokens that need fuzzy
+    matching are scored against the PSGC list in one batch (match_cells).
     """
     base    = prefix or col
-    results = [_match_cell(v, threshold) for v in df[col].to_list()]
+    results = match_cells(df[col].to_list(), threshold)
 
     return df.with_columns([
         pl.Series(f"{base}_name",  [r[0] for r in results], dtype=pl.String),
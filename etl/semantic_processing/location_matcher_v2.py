@@ -1,12 +1,21 @@
-from rdflib import Graph, RDF, Namespace, URIRef, RDFS, SKOS
-from typing import List, Optional
-from thefuzz import fuzz, process
+from rdflib import Namespace
+from functools import lru_cache
+from typing import Hashable, Iterable, List, Optional
+from rapidfuzz import fuzz
+from thefuzz.utils import full_process
 import re
 
+from semantic_processing.lazy import LazySingleton
+from semantic_processing.location_index import PSGC_PATH, REGION_ALIASES, best_matches, load_index
+
 FUZZ_THRESHOLD_REGION = 85
 FUZZ_THRESHOLD_PROVINCE = 85
 FUZZ_THRESHOLD_MUNI = 60
 
+# Memo size for the per-location and per-level lookups; a transform run sees
+# a few thousand distinct location strings.
+MATCH_CACHE_SIZE = 65536
+
 _ABBREV_MAP = {
     r'\bsta\.?': 'santa',
     r'\bsto\.?': 'santo',
@@ -17,211 +26,137 @@ _ABBREV_MAP = {
     r'\bmt\.?': 'mount',
 }
 
-class LocationMatcher:
-    def __init__(self, graph_path: str):
+class _FuzzyPending(Exception):
+    """Raised while match() is collecting fuzzy lookups to run in bulk."""
 
-        # -------------------------
-        # Region normalization map
-        # -------------------------
-        self.region_map = {
-            "i": "0100000000",
-            "1": "0100000000",
-            "region i": "0100000000",
-            "region 1": "0100000000",
-            "ilocos": "0100000000",
-            "ilocos region": "0100000000",
-
-            "ii": "0200000000",
-            "2": "0200000000",
-            "region ii": "0200000000",
-            "region 2": "0200000000",
-            "cagayan valley": "0200000000",
-
-            "iii": "0300000000",
-            "3": "0300000000",
-            "region iii": "0300000000",
-            "region 3": "0300000000",
-            "central luzon": "0300000000",
-
-            "iv-a": "0400000000",
-            "4a": "0400000000",
-            "iva": "0400000000",
-            "region iv-a": "0400000000",
-            "calabarzon": "0400000000",
-            "region calabarzon": "0400000000",
-
-            "iv-b": "1700000000",
-            "4b": "1700000000",
-            "ivb": "1700000000",
-            "region iv-b": "1700000000",
-            "mimaropa": "1700000000",
-            "region mimaropa": "1700000000",
-
-            "v": "0500000000",
-            "5": "0500000000",
-            "region v": "0500000000",
-            "region 5": "0500000000",
-            "bicol": "0500000000",
-            "bicol region": "0500000000",
-
-            "vi": "0600000000",
-            "6": "0600000000",
-            "region vi": "0600000000",
-            "region 6": "0600000000",
-            "western visayas": "0600000000",
-
-            "vii": "0700000000",
-            "7": "0700000000",
-            "region vii": "0700000000",
-            "region 7": "0700000000",
-            "central visayas": "0700000000",
-
-            "viii": "0800000000",
-            "8": "0800000000",
-            "region viii": "0800000000",
-            "region 8": "0800000000",
-            "eastern visayas": "0800000000",
-
-            "ix": "0900000000",
-            "9": "0900000000",
-            "region ix": "0900000000",
-            "region 9": "0900000000",
-            "zamboanga peninsula": "0900000000",
-
-            "x": "1000000000",
-            "10": "1000000000",
-            "region x": "1000000000",
-            "region 10": "1000000000",
-            "northern mindanao": "1000000000",
-
-            "xi": "1100000000",
-            "11": "1100000000",
-            "region xi": "1100000000",
-            "davao": "1100000000",
-            "region 11": "1100000000",
-
-            "xii": "1200000000",
-            "12": "1200000000",
-            "region xii": "1200000000",
-            "region 12": "1200000000",
-            "soccsksargen": "1200000000",
-
-            "xiii": "1600000000",
-            "13": "1600000000",
-            "region xiii": "1600000000",
-            "region 13": "1600000000",
-            "caraga": "1600000000",
-            "rtr": "1600000000",
-
-            "ncr": "1300000000",
-            "metro manila": "1300000000",
-            "national capital region": "1300000000",
-
-            "car": "1400000000",
-            "cordillera": "1400000000",
-
-            "barmm": "1900000000",
-            "armm": "1900000000",
-            "bangsamoro": "1900000000",
-
-            "nir": "1800000000",
-            "negros island region": "1800000000"
-        }
 
-        self.SKG = Namespace("https://sakuna.ph/")
-        self.base = "https://sakuna.ph/"
-
-        # Load graph
-        self.g = Graph()
-        self.g.parse(graph_path)
+def _fuzz_choice(text: str) -> str:
+    # thefuzz.process.extractOne with token_sort_ratio applies
+    # full_process(force_ascii=True) to every choice ...
+    return full_process(text, force_ascii=True)
 
-        # IRI → label
-        self.municipalities: dict[str, str] = {}
 
-        # IRI -> IRI of the parent
-        self.municipalities_parent: dict[str, str] = {}
+def _fuzz_query(text: str) -> str:
+    # ... and full_process() once more to the query beforehand.
+    return _fuzz_choice(full_process(text))
 
-        # label → IRI
-        self.provinces: dict[str, str] = {}
 
-        # altLabel → IRI (populated by _load_locations, merged into municipalities_rev)
-        self.municipalities_alts: dict[str, str] = {}
-
-        self._load_locations()
+class LocationMatcher:
+    def __init__(self, graph_path: str):
 
-        # reverse lookup: primary labels first, then alt labels (primary wins on collision)
-        self.municipalities_rev = {
-            label.lower(): iri for iri, label in self.municipalities.items()
-        }
-        self.municipalities_rev.update(self.municipalities_alts)
+        # Region normalization map, shared with location_matcher_single
+        self.region_map = REGION_ALIASES
 
-    # --------------------------------------------------
-    # Load RDF locations
-    # --------------------------------------------------
-    def _load_locations(self) -> None:
-        for s, _, _ in self.g.triples((None, RDF.type, URIRef(self.SKG["Municipality"]))):
-            label = str(self.g.value(s, RDFS.label))
-            self.municipalities[str(s)] = label.lower()
-            self.municipalities_parent[str(s)] = str(
-                self.g.value(s, URIRef(self.SKG["isPartOf"]))
-            )
-            for alt in self.g.objects(s, SKOS.altLabel):
-                self.municipalities_alts[str(alt).lower()] = str(s)
-
-        for s, _, _ in self.g.triples((None, RDF.type, URIRef(self.SKG["City"]))):
-            label = str(self.g.value(s, RDFS.label))
-            self.municipalities[str(s)] = label.lower()
-            self.municipalities_parent[str(s)] = str(
-                self.g.value(s, URIRef(self.SKG["isPartOf"]))
-            )
-            for alt in self.g.objects(s, SKOS.altLabel):
-                self.municipalities_alts[str(alt).lower()] = str(s)
-
-        for s, _, _ in self.g.triples((None, RDF.type, URIRef(self.SKG["SubMunicipality"]))):
-            label = str(self.g.value(s, RDFS.label))
-            self.municipalities[str(s)] = label.lower()
-            self.municipalities_parent[str(s)] = str(
-                self.g.value(s, URIRef(self.SKG["isPartOf"]))
-            )
-            for alt in self.g.objects(s, SKOS.altLabel):
-                self.municipalities_alts[str(alt).lower()] = str(s)
+        self.SKG = Namespace("https://sakuna.ph/")
+        self.base = "https://sakuna.ph/"
 
-        for s, _, _ in self.g.triples((None, RDF.type, URIRef(self.SKG["Province"]))):
-            label = str(self.g.value(s, RDFS.label))
-            self.provinces[label.lower()] = str(s)
-            for alt in self.g.objects(s, SKOS.altLabel):
-                self.provinces[str(alt).lower()] = str(s)
+        # PSGC lookups, shared by every matcher on the same gazetteer
+        self.index = load_index(graph_path)
+        self.gazetteer = self.index.gazetteer
+
+        # IRI → label, IRI → parent IRI, label → IRI, altLabel → IRI
+        self.municipalities = self.index.municipalities
+        self.municipalities_parent = self.index.municipalities_parent
+        self.provinces = self.index.provinces
+        self.municipalities_alts = self.index.municipalities_alts
+        self.municipalities_rev = self.index.municipalities_rev
+
+        self._muni_order = self.index.muni_order
+        self._by_label = self.index.by_label
+        self._by_label_parent = self.index.by_label_parent
+        self._child_labels = self.index.child_labels
+        self._region_index = self.index.region_index
+        self._region_choices = self.index.region_choices
+        self._province_choices = self.index.province_choices
+        self._municipality_choices = self.index.municipality_choices
+
+        # (scope, query) → (best choice, rounded score); see _fuzzy_match.
+        self._fuzzy_memo: dict[tuple[Hashable, str], tuple[Optional[str], int]] = {}
+        self._fuzzy_deferred: Optional[dict[Hashable, dict[str, None]]] = None
+        self._scope_keys: dict[Hashable, tuple[list[str], list[str]]] = {}
+
+        # Memoise per instance; the same location strings repeat across rows.
+        self.match_region = lru_cache(maxsize=MATCH_CACHE_SIZE)(self.match_region)
+        self.match_province = lru_cache(maxsize=MATCH_CACHE_SIZE)(self.match_province)
+        self.match_municipality = lru_cache(maxsize=MATCH_CACHE_SIZE)(self.match_municipality)
+        self._match_location = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match_location)
+
+    def _first_loaded(self, iris: Iterable[Optional[str]]) -> Optional[str]:
+        """The IRI that comes first in load order, ignoring misses."""
+        found = [iri for iri in iris if iri]
+        return min(found, key=self._muni_order.__getitem__) if found else None
 
     # --------------------------------------------------
     # Fuzzy helper
     # --------------------------------------------------
-    def _fuzzy_match(self, query: str | list[str], choices: list[str], threshold: int):
+    def _scope_choices(self, scope: Hashable) -> list[str]:
+        """
+        Candidate labels for a fuzzy scope: "region", "province",
+        "municipality", ("parent", iri) for the children of a province or
+        region, and ("in_region", iri) for every municipality in a region.
+        """
+        if scope == "region":
+            return self._region_choices
+        if scope == "province":
+            return self._province_choices
+        if scope == "municipality":
+            return self._municipality_choices
+        kind, iri = scope
+        if kind == "parent":
+            return self._child_labels.get(iri, [])
+        return list(self._region_index.get(iri, ({}, {}))[0].values())
+
+    def _scope_keys_for(self, scope: Hashable) -> tuple[list[str], list[str]]:
+        """(choices, normalised choices) for a scope, normalised once."""
+        if scope not in self._scope_keys:
+            choices = self._scope_choices(scope)
+            self._scope_keys[scope] = (choices, [_fuzz_choice(c) for c in choices])
+        return self._scope_keys[scope]
+
+    def _resolve_fuzzy(self, wanted: dict[Hashable, Iterable[str]]) -> None:
+        """
+        Score every wanted query against its scope's labels in bulk
+        (location_index.best_matches), filling the memo _fuzzy_match reads.
+        Picks and rounds scores the way thefuzz's extractOne does: the first
+        highest raw score wins.
+        """
+        for scope, queries in wanted.items():
+            choices, choice_keys = self._scope_keys_for(scope)
+            queries = [q for q in queries if (scope, q) not in self._fuzzy_memo]
+            best = best_matches([_fuzz_query(q) for q in queries], choice_keys, fuzz.token_sort_ratio)
+            for query, (col, score) in zip(queries, best):
+                self._fuzzy_memo[(scope, query)] = (choices[col], int(round(score)))
+
+    def _fuzzy_match(self, query: str | list[str], scope: Hashable, threshold: int):
+        """
+        Best label in ``scope`` for ``query`` (or for the best of several
+        query variants) if it scores at least ``threshold``.
+
+        Scores come from the memo. Inside match() a miss is recorded and
+        _FuzzyPending raised, so the location is retried once the whole
+        batch has been scored; elsewhere the miss is scored on the spot.
+        """
+        choices, _ = self._scope_keys_for(scope)
         if not query or not choices:
             return None
 
-        if type(query) == str:
-            match, score = process.extractOne(
-                query,
-                choices,
-                scorer=fuzz.token_sort_ratio
-            )
-            return match if score >= threshold else None
-        
-        else:
-            highest_score: int = 0
-            closest_match = query[0]
+        queries = [query] if isinstance(query, str) else query
+        missing = [q for q in queries if (scope, q) not in self._fuzzy_memo]
+        if missing:
+            if self._fuzzy_deferred is not None:
+                self._fuzzy_deferred.setdefault(scope, {}).update(dict.fromkeys(missing))
+                raise _FuzzyPending
+            self._resolve_fuzzy({scope: missing})
 
-            for q in query:
-                match, score = process.extractOne(
-                    q,
-                    choices,
-                    scorer=fuzz.token_sort_ratio
-                )
-                if score > highest_score: 
-                    highest_score = score
-                    closest_match = match
+        highest_score: int = 0
+        closest_match = None
+        for q in queries:
+            match, score = self._fuzzy_memo[(scope, q)]
+            if score > highest_score:
+                highest_score = score
+                closest_match = match
 
-            return closest_match if highest_score >= threshold else None
+        return closest_match if highest_score >= threshold else None
 
     def _normalize(self, label: str) -> str:
         label = label.lower().strip()
@@ -236,17 +171,7 @@ class LocationMatcher:
         Return {muni_iri: label} for all municipalities whose province
         belongs to the given region, plus HUCs directly under the region.
         """
-        result = {}
-        for muni_iri, prov_iri in self.municipalities_parent.items():
-            # HUCs / municipalities directly parented to the region
-            if prov_iri == region_iri:
-                result[muni_iri] = self.municipalities[muni_iri]
-                continue
-            # Normal cities/munis whose province is in the region
-            grandparent = str(self.g.value(URIRef(prov_iri), URIRef(self.SKG["isPartOf"])))
-            if grandparent == region_iri:
-                result[muni_iri] = self.municipalities[muni_iri]
-        return result
+        return self._region_index.get(region_iri, ({}, {}))[0]
 
     def _fuzzy_match_municipality_in_region(self, label: str, region_iri: str) -> Optional[str]:
         """
@@ -259,24 +184,23 @@ class LocationMatcher:
         city_of   = "city of " + candidate
 
 
-        candidates = self._municipalities_in_region(region_iri)
-        # print(candidates)
+        candidates, first_by_label = self._region_index.get(region_iri, ({}, {}))
         if not candidates:
             return None
 
         # Exact label check first
-        for iri, lbl in candidates.items():
-            if lbl in (candidate, city, city_of):
-                return iri
+        iri = self._first_loaded(first_by_label.get(lbl) for lbl in (candidate, city, city_of))
+        if iri:
+            return iri
 
         # Fuzzy fallback
         fuzzy = self._fuzzy_match(
             [candidate, city, city_of],
-            list(candidates.values()),
+            ("in_region", region_iri),
             FUZZ_THRESHOLD_MUNI
         )
         if fuzzy:
-            return next((iri for iri, lbl in candidates.items() if lbl == fuzzy), None)
+            return first_by_label.get(fuzzy)
 
         return None
 
@@ -292,7 +216,7 @@ class LocationMatcher:
 
         fuzzy = self._fuzzy_match(
             label,
-            list(self.region_map.keys()),
+            "region",
             FUZZ_THRESHOLD_REGION
         )
         if fuzzy:
@@ -312,7 +236,7 @@ class LocationMatcher:
 
         fuzzy = self._fuzzy_match(
             label,
-            list(self.provinces.keys()),
+            "province",
             FUZZ_THRESHOLD_PROVINCE
         )
         return self.provinces[fuzzy] if fuzzy else None
@@ -329,27 +253,30 @@ class LocationMatcher:
         city = candidate + " city"
         city_of = "city of " + city.replace(" city", "")
         
-        mun_cities_prov = []
+        scope = "municipality"
         if parent_iri:
             # exact label + correct parent
-            for iri, lbl in self.municipalities.items():
-
-                if (lbl == candidate or lbl == city or lbl == city_of) and self.municipalities_parent[iri] == parent_iri:
-                    return iri
+            iri = self._first_loaded(
+                self._by_label_parent.get((lbl, parent_iri)) for lbl in (candidate, city, city_of)
+            )
+            if iri:
+                return iri
 
             # another pass for HUCs
-            for iri, lbl in self.municipalities.items():
-                if (lbl == city or lbl == city_of):
-                    return iri
-                
-            mun_cities_pro_iri = [k for k, v in self.municipalities_parent.items() if v == parent_iri]
-            mun_cities_prov = [self.municipalities[i] for i in mun_cities_pro_iri]
-                
+            iri = self._first_loaded(
+                self._by_label[lbl][0] for lbl in (city, city_of) if lbl in self._by_label
+            )
+            if iri:
+                return iri
+
+            if self._child_labels.get(parent_iri):
+                scope = ("parent", parent_iri)
+
         # fuzzy fallback
 
         fuzzy = self._fuzzy_match(
             [candidate, city, city_of],
-            mun_cities_prov if mun_cities_prov else list(self.municipalities_rev.keys()),
+            scope,
             FUZZ_THRESHOLD_MUNI
         )
 
@@ -358,115 +285,147 @@ class LocationMatcher:
     # Main matcher
     # --------------------------------------------------
     def match(self, locations: List[str]) -> List[str]:
-        matched: List[str] = []
+        return [iri for matched in self.match_each(locations) for iri in matched]
 
-        for loc in locations:
-            levels = [lvl.strip() for lvl in loc.split(",")]
-            highest = levels.pop()
+    def match_each(self, locations: List[str]) -> List[tuple[str, ...]]:
+        """The IRIs matched for each location; most give one, Region IV gives two."""
+        # Key the memo on the stripped levels, the only form the matcher reads.
+        keys = [",".join(lvl.strip() for lvl in loc.split(",")) for loc in locations]
+        self._prefetch(dict.fromkeys(keys))
+        return [self._match_location(key) for key in keys]
 
-            # Nation-wide / island-group passthrough
-            if highest in {"Philippines", "Luzon", "Visayas", "Mindanao"}:
-                matched.append(self.base + highest)
-                continue
+    def _prefetch(self, keys: Iterable[str]) -> None:
+        """
+        Match the distinct locations in rounds. Each round runs every
+        unresolved location until it needs a fuzzy score that is not yet
+        memoised, then scores all of those in bulk (_resolve_fuzzy); a
+        location needs at most a handful of rounds.
+        """
+        pending = list(keys)
+        while pending:
+            wanted: dict[Hashable, dict[str, None]] = {}
+            retry: List[str] = []
+            self._fuzzy_deferred = wanted
+            try:
+                for key in pending:
+                    try:
+                        self._match_location(key)
+                    except _FuzzyPending:
+                        retry.append(key)
+            finally:
+                self._fuzzy_deferred = None
+            self._resolve_fuzzy(wanted)
+            pending = retry
+
+    def _match_location(self, loc: str) -> tuple[str, ...]:
+        matched: List[str] = []
 
-            # Ambiguous Region IV → both IV-A and IV-B
-            if highest in {"4", "Region 4", "IV"}:
-                matched.extend([self.base + "0400000000", self.base + "1700000000"])
-                continue
+        levels = loc.split(",")
+        highest = levels.pop()
 
-            # Single-tier: try region → province → municipality in order
-            if not levels:
-                region_iri = self.match_region(highest)
-                if region_iri:
-                    matched.append(region_iri)
-                    continue
+        # Nation-wide / island-group passthrough
+        if highest in {"Philippines", "Luzon", "Visayas", "Mindanao"}:
+            matched.append(self.base + highest)
+            return tuple(matched)
 
-                prov_iri = self.match_province(highest)
-                if prov_iri:
-                    matched.append(prov_iri)
-                    continue
+        # Ambiguous Region IV → both IV-A and IV-B
+        if highest in {"4", "Region 4", "IV"}:
+            matched.extend([self.base + "0400000000", self.base + "1700000000"])
+            return tuple(matched)
 
-                muni_iri = self.match_municipality(highest, None)
-                matched.append(muni_iri if muni_iri else "")
-                continue
-
-            # Multi-tier: try highest as region
+        # Single-tier: try region → province → municipality in order
+        if not levels:
             region_iri = self.match_region(highest)
+            if region_iri:
+                matched.append(region_iri)
+                return tuple(matched)
 
-            # highest is not a region — treat as province or municipality
-            if not region_iri:
-                prov_iri = self.match_province(highest)
-
-                if prov_iri and levels:
-                    # Province + municipality
-                    muni_label = levels.pop()
-                    muni_iri = self.match_municipality(muni_label, prov_iri)
-
-                    # Fallback: try highest as the municipality (city in province slot)
-                    if not muni_iri or self.municipalities_parent.get(muni_iri) != prov_iri:
-                        muni_iri = self.match_municipality(highest, prov_iri)
-
-                    matched.append(muni_iri if muni_iri else prov_iri)
-
-                elif prov_iri:
-                    # Province only — try highest as municipality label
-                    muni_iri = self.match_municipality(highest.lower(), prov_iri)
-                    matched.append(muni_iri if muni_iri else prov_iri)
-
-                elif levels:
-                    # No province match — try next level as municipality
-                    muni_label = levels.pop()
-                    muni_iri = self.match_municipality(muni_label, None)
-                    matched.append(muni_iri if muni_iri else "")
+            prov_iri = self.match_province(highest)
+            if prov_iri:
+                matched.append(prov_iri)
+                return tuple(matched)
 
-                else:
-                    # Last resort: try highest as municipality
-                    muni_iri = self.match_municipality(highest, None)
-                    matched.append(muni_iri if muni_iri else "")
+            muni_iri = self.match_municipality(highest, None)
+            matched.append(muni_iri if muni_iri else "")
+            return tuple(matched)
 
-                continue
+        # Multi-tier: try highest as region
+        region_iri = self.match_region(highest)
 
-            # highest is a region — pop next level as province
-            prov_label = levels.pop()
-            prov_iri = self.match_province(prov_label)
+        # highest is not a region — treat as province or municipality
+        if not region_iri:
+            prov_iri = self.match_province(highest)
 
             if prov_iri and levels:
-                # Region + province + municipality
+                # Province + municipality
                 muni_label = levels.pop()
                 muni_iri = self.match_municipality(muni_label, prov_iri)
+
+                # Fallback: try highest as the municipality (city in province slot)
+                if not muni_iri or self.municipalities_parent.get(muni_iri) != prov_iri:
+                    muni_iri = self.match_municipality(highest, prov_iri)
+
                 matched.append(muni_iri if muni_iri else prov_iri)
 
             elif prov_iri:
-                # Region + province only
-                matched.append(prov_iri)
+                # Province only — try highest as municipality label
+                muni_iri = self.match_municipality(highest.lower(), prov_iri)
+                matched.append(muni_iri if muni_iri else prov_iri)
+
+            elif levels:
+                # No province match — try next level as municipality
+                muni_label = levels.pop()
+                muni_iri = self.match_municipality(muni_label, None)
+                matched.append(muni_iri if muni_iri else "")
 
             else:
-                # prov_label didn't match — could be a city in the province slot,
-                # an outdated province name, or a repeated region alias (e.g. NCR)
-
-                # Special case: Maguindanao split-province legacy
-                if levels and prov_label.lower() == "maguindanao":
-                    muni_label = levels.pop()
-                    muni_iri = self.match_municipality(muni_label, None)
-                    if muni_iri:
-                        matched.append(muni_iri)
-                        continue
-
-                # Try prov_label as a city/municipality scoped to region
-                muni_iri = self._fuzzy_match_municipality_in_region(prov_label, region_iri)
+                # Last resort: try highest as municipality
+                muni_iri = self.match_municipality(highest, None)
+                matched.append(muni_iri if muni_iri else "")
+
+            return tuple(matched)
+
+        # highest is a region — pop next level as province
+        prov_label = levels.pop()
+        prov_iri = self.match_province(prov_label)
+
+        if prov_iri and levels:
+            # Region + province + municipality
+            muni_label = levels.pop()
+            muni_iri = self.match_municipality(muni_label, prov_iri)
+            matched.append(muni_iri if muni_iri else prov_iri)
+
+        elif prov_iri:
+            # Region + province only
+            matched.append(prov_iri)
+
+        else:
+            # prov_label didn't match — could be a city in the province slot,
+            # an outdated province name, or a repeated region alias (e.g. NCR)
+
+            # Special case: Maguindanao split-province legacy
+            if levels and prov_label.lower() == "maguindanao":
+                muni_label = levels.pop()
+                muni_iri = self.match_municipality(muni_label, None)
                 if muni_iri:
                     matched.append(muni_iri)
-                    continue
+                    return tuple(matched)
 
-                # Try next level scoped to region, fall back to region itself
-                if levels:
-                    muni_label = levels.pop()
-                    muni_iri = self._fuzzy_match_municipality_in_region(muni_label, region_iri)
-                    matched.append(muni_iri if muni_iri else region_iri)
-                else:
-                    matched.append(region_iri)
+            # Try prov_label as a city/municipality scoped to region
+            muni_iri = self._fuzzy_match_municipality_in_region(prov_label, region_iri)
+            if muni_iri:
+                matched.append(muni_iri)
+                return tuple(matched)
 
-        return matched
+            # Try next level scoped to region, fall back to region itself
+            if levels:
+                muni_label = levels.pop()
+                muni_iri = self._fuzzy_match_municipality_in_region(muni_label, region_iri)
+                matched.append(muni_iri if muni_iri else region_iri)
+            else:
+                matched.append(region_iri)
+
+        return tuple(matched)
     
     def match_cell(self, cell: str) -> list[str]:
         """
@@ -476,14 +435,27 @@ class LocationMatcher:
             "Davao City, Davao del Sur, XI | Cebu City, VII"
             → [<iri for Davao City>, <iri for Cebu City>]
         """
-        locations = [loc.strip() for loc in cell.split("|") if loc.strip()]
-        return self.match(locations)
-
-LOCATION_MATCHER = LocationMatcher(
+        return self.match_cells([cell])[0]
+
+    def match_cells(self, cells: List[str]) -> List[List[str]]:
+        """match_cell for a whole column, matching all of its locations as one batch."""
+        split = [[loc.strip() for loc in cell.split("|") if loc.strip()] for cell in cells]
+        matched = iter(self.match_each([loc for locations in split for loc in locations]))
+
+        results: List[List[str]] = []
+        for locations in split:
+            iris: List[str] = []
+            for _ in locations:
+                iris.extend(next(matched))
+            results.append(iris)
+        return results
+
+# Built on first use, so importing a transform module does not load PSGC.
+LOCATION_MATCHER: LocationMatcher = LazySingleton(lambda: LocationMatcher(
     # graph_path="../data/rdf/psgc_rdf.ttl"
-    graph_path="../data/rdf/psgc/psgc.ttl"
+    graph_path=PSGC_PATH
 
-)
+))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
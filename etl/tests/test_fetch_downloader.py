@@ -0,0 +1,167 @@
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from fetch.downloader import DownloadJob, Downloader
+
+_BODY = bytes(range(256)) * 400  # 100 KiB
+
+
+class _Files:
+    """State shared by the stand-in server and the tests."""
+
+    def __init__(self) -> None:
+        self.body = _BODY
+        self.etag = '"v1"'
+        self.drop_after: int | None = None
+        self.requests: list[dict[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    files: _Files
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        files = self.files
+        with files.lock:
+            files.requests.append({"path": self.path, **dict(self.headers)})
+            files.active += 1
+            files.max_active = max(files.max_active, files.active)
+        try:
+            self._respond(files)
+        finally:
+            with files.lock:
+                files.active -= 1
+
+    def _respond(self, files: _Files) -> None:
+        if self.path == "/missing.pdf":
+            self.send_error(404)
+            return
+        if self.path == "/busy.pdf":
+            self.send_error(503)
+            return
+        if self.path.startswith("/slow.pdf"):
+            time.sleep(0.1)
+
+        if self.headers.get("If-None-Match") == files.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == files.etag:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+
+        body = files.body[start:]
+        self.send_response(206 if start else 200)
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(files.body) - 1}/{len(files.body)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Disposition", 'attachment; filename="SitRep: 1.pdf"')
+        self.send_header("ETag", files.etag)
+        self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.end_headers()
+
+        if files.drop_after is not None:
+            # Simulate a dropped transfer once, then serve normally.
+            self.wfile.write(body[: files.drop_after])
+            files.drop_after = None
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class DownloaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.files = _Files()
+        handler = type("Handler", (_Handler,), {"files": self.files})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.downloader = Downloader(self.dir, workers=2, retries=2, backoff=0)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_streams_to_the_header_filename(self) -> None:
+        result = self.downloader.fetch(DownloadJob(f"{self.base}/download?id=1"))
+
+        self.assertEqual(result.status, "downloaded")
+        self.assertEqual(result.filename, "SitRep 1.pdf")
+        self.assertEqual((self.dir / "SitRep 1.pdf").read_bytes(), _BODY)
+        self.assertEqual((result.etag, result.size), ('"v1"', len(_BODY)))
+        self.assertEqual(list((self.dir / ".partial").iterdir()), [])
+
+    def test_unchanged_file_is_a_conditional_304(self) -> None:
+        first = self.downloader.fetch(DownloadJob(f"{self.base}/a.pdf"))
+        again = self.downloader.fetch(
+            DownloadJob(f"{self.base}/a.pdf", filename=first.filename, etag=first.etag)
+        )
+
+        self.assertEqual(again.status, "not_modified")
+        self.assertEqual(again.size, len(_BODY))
+        self.assertEqual(self.files.requests[-1]["If-None-Match"], '"v1"')
+
+    def test_dropped_transfer_resumes_with_range(self) -> None:
+        self.files.drop_after = 80_000
+        self.downloader.chunk_size = 1024
+
+        result = self.downloader.fetch(DownloadJob(f"{self.base}/a.pdf"))
+
+        self.assertEqual(result.status, "downloaded")
+        self.assertEqual((self.dir / result.filename).read_bytes(), _BODY)
+        self.assertEqual(len(self.files.requests), 2)
+        self.assertEqual(self.files.requests[-1]["Range"], "bytes=79872-")
+        self.assertEqual(self.files.requests[-1]["If-Range"], '"v1"')
+
+    def test_changed_file_restarts_instead_of_resuming(self) -> None:
+        self.files.drop_after = 30_000
+        self.downloader.retries, self.downloader.chunk_size = 0, 1024
+        self.assertEqual(self.downloader.fetch(DownloadJob(f"{self.base}/a.pdf")).status, "failed")
+
+        self.files.body, self.files.etag = b"new version", '"v2"'
+        result = self.downloader.fetch(DownloadJob(f"{self.base}/a.pdf"))
+
+        self.assertEqual(self.files.requests[-1]["If-Range"], '"v1"')
+        self.assertEqual((self.dir / result.filename).read_bytes(), b"new version")
+        self.assertEqual(result.etag, '"v2"')
+
+    def test_http_error_fails_without_retrying(self) -> None:
+        result = self.downloader.fetch(DownloadJob(f"{self.base}/missing.pdf"))
+
+        self.assertEqual((result.status, result.error), ("failed", "HTTP 404"))
+        self.assertEqual(len(self.files.requests), 1)
+
+    def test_server_errors_are_retried_by_one_layer_only(self) -> None:
+        result = self.downloader.fetch(DownloadJob(f"{self.base}/busy.pdf"))
+
+        self.assertEqual(result.status, "failed")
+        # The first request and the adapter's two retries; no outer loop on top.
+        self.assertEqual(len(self.files.requests), 3)
+
+    def test_download_all_bounds_concurrency(self) -> None:
+        jobs = [DownloadJob(f"{self.base}/slow.pdf?n={n}", filename_hint=str(n)) for n in range(6)]
+
+        results = list(self.downloader.download_all(jobs))
+
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertLessEqual(self.files.max_active, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+from fetch.downloader import DownloadJob
+from fetch.dromic_http import CrawlError, HttpCrawler, listing_page_url, parse_listing, parse_post
+
+FIXTURES = Path(__file__).parent / "fixtures" / "dromic"
+SITE = "https://dromic.dswd.gov.ph/"
+
+POST_PDF = SITE + "dswd-dromic-report-3-on-typhoon-aghon-26-may-2024/"
+POST_GDOC = SITE + "dswd-dromic-report-1-on-the-flooding-in-davao-25-may-2024/"
+POST_SCRAPED = SITE + "dswd-dromic-report-2-on-typhoon-aghon-24-may-2024/"
+POST_NO_ATTACHMENT = SITE + "dswd-dromic-report-1-on-the-fire-incident-in-cebu-city-20-may-2024/"
+POST_OLD = SITE + "dswd-dromic-terminal-report-on-the-el-nino-phenomenon-2-may-2024/"
+
+SAVED_PAGES = {
+    listing_page_url(2024, 1): "listing_page1.html",
+    listing_page_url(2024, 2): "listing_page2.html",
+    POST_PDF: "post_pdf.html",
+    POST_GDOC: "post_gdoc.html",
+    POST_SCRAPED: "post_scraped.html",
+    POST_NO_ATTACHMENT: "post_no_attachment.html",
+    POST_OLD: "post_old.html",
+}
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+class _SavedSite:
+    """Serves the saved HTML pages in place of the live archive."""
+
+    def __init__(self, pages: dict[str, str]) -> None:
+        self.pages = pages
+        self.requested: list[str] = []
+
+    def get(self, url: str, **_kwargs) -> requests.Response:
+        self.requested.append(url)
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+        name = self.pages.get(url)
+        response.status_code = 200 if name else 404
+        response._content = _fixture(name).encode("utf-8") if name else b"Not Found"
+        return response
+
+
+class ParseTests(unittest.TestCase):
+    def test_listing_links_in_page_order(self) -> None:
+        urls = parse_listing(_fixture("listing_page1.html"), listing_page_url(2024))
+
+        self.assertEqual(urls, [POST_PDF, POST_GDOC, POST_SCRAPED])
+
+    def test_post_date_title_and_pdf_link(self) -> None:
+        post = parse_post(_fixture("post_pdf.html"), POST_PDF)
+
+        self.assertEqual(post.date, datetime(2024, 5, 26))
+        self.assertTrue(post.title.startswith("DSWD DROMIC Report #3 on Typhoon “Aghon”"))
+        self.assertEqual(
+            post.file_url,
+            SITE + "wp-content/uploads/2024/05/"
+            "DSWD-DROMIC-Report-3-on-Typhoon-Aghon-as-of-26-May-2024-6AM.pdf",
+        )
+        self.assertEqual(post.file_name, "DSWD DROMIC Report #3 on Typhoon Aghon as of 26 May 2024, 6AM")
+
+    def test_viewer_link_is_rewritten_to_the_file(self) -> None:
+        post = parse_post(_fixture("post_gdoc.html"), POST_GDOC)
+
+        self.assertEqual(
+            post.file_url,
+            SITE + "wp-content/uploads/2024/05/DROMIC-Report-1-Flooding-Davao.docx",
+        )
+
+    def test_links_outside_the_post_are_ignored(self) -> None:
+        post = parse_post(_fixture("post_no_attachment.html"), POST_NO_ATTACHMENT)
+
+        self.assertEqual(post.date, datetime(2024, 5, 20))
+        self.assertIsNone(post.file_url)
+
+    def test_file_block_link(self) -> None:
+        post = parse_post(_fixture("post_old.html"), POST_OLD)
+
+        self.assertTrue(post.file_url.endswith("/Terminal-Report-El-Nino.pdf"))
+
+
+class CrawlerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.site = _SavedSite(SAVED_PAGES)
+        self.crawler = HttpCrawler(2024, session=self.site, workers=2)
+
+    def test_collects_new_posts_and_stops_at_the_cutoff(self) -> None:
+        jobs: list[DownloadJob] = []
+        scraped = {POST_SCRAPED}
+
+        self.crawler.crawl(jobs, scraped, last_scrape_date=datetime(2024, 5, 10))
+
+        self.assertEqual([job.post_url for job in jobs], [POST_PDF, POST_GDOC])
+        self.assertEqual([job.page for job in jobs], [1, 1])
+        self.assertTrue(jobs[1].url.endswith(".docx"))
+        self.assertIn(POST_GDOC, scraped)
+        self.assertEqual(self.crawler.page, 2)
+
+    def test_walks_every_page_without_a_cutoff(self) -> None:
+        jobs: list[DownloadJob] = []
+
+        self.crawler.crawl(jobs, set(), last_scrape_date=datetime.min)
+
+        self.assertEqual(
+            [job.post_url for job in jobs], [POST_PDF, POST_GDOC, POST_SCRAPED, POST_OLD]
+        )
+        self.assertEqual(self.site.requested[-1], listing_page_url(2024, 3))
+
+    def test_start_page(self) -> None:
+        jobs: list[DownloadJob] = []
+
+        self.crawler.crawl(jobs, set(), datetime.min, start_page=2)
+
+        self.assertEqual([(job.post_url, job.page) for job in jobs], [(POST_OLD, 2)])
+
+    def test_page_without_posts_requests_the_fallback(self) -> None:
+        site = _SavedSite({listing_page_url(2024, 1): "blocked.html"})
+        crawler = HttpCrawler(2024, session=site)
+
+        with self.assertRaises(CrawlError):
+            crawler.crawl([], set(), datetime.min)
+        self.assertEqual(crawler.page, 1)
+
+    def test_missing_first_page_requests_the_fallback(self) -> None:
+        with self.assertRaises(CrawlError):
+            HttpCrawler(2024, session=_SavedSite({})).crawl([], set(), datetime.min)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ETL_DIR = Path(__file__).resolve().parents[1]
+
+# Cumulative seconds `import transform.ndrrmc, transform.dromic` may take.
+IMPORT_BUDGET_S = float(os.getenv("SAKUNA_IMPORT_BUDGET_S", "5"))
+
+_PROBE = """
+import sys
+import transform.ndrrmc, transform.dromic
+from semantic_processing.disaster_classifier import DISASTER_CLASSIFIER
+from semantic_processing.climate_parameter_extractor import PARAMS_EXTRACTOR
+from semantic_processing.location_matcher_v2 import LOCATION_MATCHER
+print(DISASTER_CLASSIFIER.loaded, PARAMS_EXTRACTOR.loaded, LOCATION_MATCHER.loaded)
+print(*sorted(m for m in ("sentence_transformers", "torch", "gliner2") if m in sys.modules))
+"""
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    """Cumulative microseconds per module from ``python -X importtime``."""
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TransformImportCostTests(unittest.TestCase):
+    """Importing a transform must not load any model, graph or matcher."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _PROBE],
+            cwd=ETL_DIR, capture_output=True, text=True, timeout=300,
+        )
+
+    def test_singletons_are_not_built(self) -> None:
+        self.assertEqual(self.result.returncode, 0, self.result.stderr[-2000:])
+        loaded, heavy = (self.result.stdout.splitlines() + ["", ""])[:2]
+        self.assertEqual(loaded, "False False False")
+        self.assertEqual(heavy, "")
+
+    def test_import_time_within_budget(self) -> None:
+        self.assertEqual(self.result.returncode, 0, self.result.stderr[-2000:])
+        times = _import_times(self.result.stderr)
+        seconds = (times["transform.ndrrmc"] + times["transform.dromic"]) / 1e6
+        self.assertLess(
+            seconds, IMPORT_BUDGET_S,
+            f"transform import took {seconds:.2f}s (budget {IMPORT_BUDGET_S:.1f}s)",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from typing import Iterable, List, Optional, Tuple
 
 from rdflib import URIRef
 from transform.helpers import df_to_entities, to_int, load_csv_df, to_million_php
+from parse.table_store import is_table_file
 from semantic_processing.location_matcher_v2 import LOCATION_MATCHER
 from mappings.iris import DROMIC_EVENT_NS
 from mappings.dromic import AFF_POP_TOKENS, ASSISTANCE_TOKENS, HOUSING_TOKENS, ORG_MAPPING, AffectedPopulation, Assistance, Event, Housing, PEvac, Provenance
@@ -192,16 +193,16 @@ def load_aff_pop(folder_path: str) -> Tuple[List[AffectedPopulation] | None, Lis
 
     # Check if a total displaced/served file exists anywhere
     has_total_displaced = any(
-        "total" in f and any(k in f for k in ("displaced", "served")) and f.endswith(".csv")
+        "total" in f and any(k in f for k in ("displaced", "served")) and is_table_file(f)
         for f in files
     )
 
     for file in files:
-        if "affected" in file and "number" in file and file.endswith(".csv"):
+        if "affected" in file and "number" in file and is_table_file(file):
             src_paths.append(os.path.join(folder_path, file))
             continue
 
-        if "total" in file and any(k in file for k in ("displaced", "served")) and file.endswith(".csv"):
+        if "total" in file and any(k in file for k in ("displaced", "served")) and is_table_file(file):
             src_paths.append(os.path.join(folder_path, file))
         elif "displaced" in file and not has_total_displaced:
             src_paths.append(os.path.join(folder_path, file))
@@ -270,7 +271,7 @@ def load_housing(folder_path: str) -> List[Housing] | None:
         (
             os.path.join(folder_path, f)
             for f in os.listdir(folder_path)
-            if "house" in f.lower() and f.endswith(".csv")
+            if "house" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -303,7 +304,7 @@ def load_assistance(folder_path: str) -> List[Assistance] | None:
         (
             os.path.join(folder_path, f)
             for f in os.listdir(folder_path)
-            if "assistance" in f.lower() and f.endswith(".csv")
+            if "assistance" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -526,9 +526,10 @@ def transform_gda(path: str) -> dict[type, list[Any]]:
         lambda t: "|".join(to_type_iri(t))
     )
     # match locations
-    df["hasLocation"] = df["hasLocation"].astype(str).apply(
-        lambda cell: "|".join(LOCATION_MATCHER.match_cell(cell))
-    )
+    df["hasLocation"] = [
+        "|".join(iris)
+        for iris in LOCATION_MATCHER.match_cells(df["hasLocation"].astype(str).tolist())
+    ]
 
     df["totallyDamagedHouses"] = df["totallyDamagedHouses"].astype(float).astype("Int64")
 
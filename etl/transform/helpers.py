@@ -5,6 +5,7 @@ from polars import DataFrame
 import re
 from typing import Sequence, Mapping, Type, TypeVar, Protocol, ClassVar, Any
 from semantic_processing.location_matcher_v2 import LOCATION_MATCHER
+from parse.table_store import read_table
 from dataclasses import fields
 
 @dataclass
@@ -35,10 +36,7 @@ def load_csv_df(
     split_assistance: bool = False, 
 ) -> pl.DataFrame:
     
-    df = pl.read_csv(
-        path, 
-        schema_overrides=schema_overrides,
-        infer_schema_length=10000)
+    df = read_table(path, schema_overrides)
     
     df = df.filter()
     
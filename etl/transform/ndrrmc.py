@@ -9,7 +9,9 @@ import polars as pl
 from mappings.iris import NDRRMC_EVENT_NS
 from semantic_processing.location_matcher_v2 import LOCATION_MATCHER
 from semantic_processing.disaster_classifier import DISASTER_CLASSIFIER
-from semantic_processing.climate_parameter_extractor import PARAMS_EXTRACTOR
+from semantic_processing.climate_parameter_extractor import (
+    PARAMS_EXTRACTOR, ExtractedClimateParameter, ExtractedWarning
+)
 
 from mappings.ndrrmc import (
     AFF_POP_COL_MAP, AGRI_MAPPING, AIRPORT_MAPPING, ASSISTANCE_PROVIDED_MAPPING, CASUALTY_MAPPING, CLASS_MAPPING, COMMS_MAPPING, DOC, DOC_MAPPING,
@@ -22,8 +24,10 @@ from mappings.ndrrmc import (
 from transform.helpers import (
     MoveArg, concat_loc_levels, event_name_expander,
     normalize_datetime, remove_summary_rows,
-    df_to_entities, load_csv_df, to_float, to_int, to_million_php, to_str
+    df_to_entities, load_csv_df,
+    to_float, to_int, to_million_php, to_str
 )
+from parse.table_store import is_table_file, table_file
 
 
 def _event_id(event_name: str, start_date: str | None) -> str:
@@ -32,8 +36,7 @@ def _event_id(event_name: str, start_date: str | None) -> str:
     return uuid.uuid5(NDRRMC_EVENT_NS, key).hex
 
 
-def _load_climate_parameters(remarks_text: str) -> list[ClimateParameterMeasurement]:
-    extracted = PARAMS_EXTRACTOR.extract(remarks_text)
+def _climate_parameter_measurements(extracted: list[ExtractedClimateParameter]) -> list[ClimateParameterMeasurement]:
     measurements: list[ClimateParameterMeasurement] = []
 
     for idx, item in enumerate(extracted, 1):
@@ -60,8 +63,7 @@ def _load_climate_parameters(remarks_text: str) -> list[ClimateParameterMeasurem
     return measurements
 
 
-def _load_warnings(remarks_text: str) -> list[Warning]:
-    extracted = PARAMS_EXTRACTOR.extract_warnings(remarks_text)
+def _warning_entities(extracted: list[ExtractedWarning]) -> list[Warning]:
     return [
         Warning(
             id=str(idx),
@@ -72,7 +74,8 @@ def _load_warnings(remarks_text: str) -> list[Warning]:
     ]
 
 
-def load_event(folder_path: str, folder: str) -> Event | None:
+def _read_event(folder_path: str, folder: str) -> tuple[dict[str, str], dict[str, str]] | None:
+    """(metadata.json, source.json) of an event folder, or None without metadata."""
     meta_path = os.path.join(folder_path, folder, "metadata.json")
     src_path = os.path.join(folder_path, folder, "source.json")
 
@@ -85,37 +88,55 @@ def load_event(folder_path: str, folder: str) -> Event | None:
     with open(src_path, "r", encoding="utf-8") as f:
         src: dict[str, str] = json.load(f)
 
-    event_name = event_name_expander(meta.get("eventName", folder))
-    # text = (meta.get("remarks") or "").split(". ")[0]
-    pred, _ = DISASTER_CLASSIFIER.classify(
-        [event_name + src.get("reportName", "")]
-    )[0]
+    return meta, src
 
-    # Extract disaster-specific params from narrative text
-    remarks_text = meta.get("remarks") or ""
-    params = _load_climate_parameters(remarks_text)
-    warnings = _load_warnings(remarks_text)
-
-    return Event(
-        id=_event_id(meta.get("eventName", folder), meta.get("startDate")),
-        eventName=meta.get("eventName", folder),
-        startDate=datetime.fromisoformat(meta["startDate"]) if meta.get("startDate") else None,
-        endDate=datetime.fromisoformat(meta["endDate"]) if meta.get("endDate") else None,
-        remarks=remarks_text or None,
-        hasDisasterType=pred,
-        climateParameters=params,
-        warnings=warnings,
-    )
+
+def load_event(folder_path: str, folder: str) -> Event | None:
+    events = load_events(folder_path, [folder])
+    return events[0] if events else None
 
 
 def load_events(folder_path: str, folders: Iterable[str] | None = None) -> list[Event]:
-    events: list[Event] = []
+    """
+    Events of every folder that has metadata. Disaster types, climate
+    parameters and warnings are computed for the whole batch at once so the
+    classifier and GLiNER2 see every event's text in one batched pass.
+    """
     folder_names = list(folders) if folders is not None else next(os.walk(folder_path))[1]
 
+    read: list[tuple[str, dict[str, str], dict[str, str]]] = []
     for folder in folder_names:
-        event = load_event(folder_path, folder)
-        if event is not None:
-            events.append(event)
+        files = _read_event(folder_path, folder)
+        if files is not None:
+            read.append((folder, *files))
+
+    # text = (meta.get("remarks") or "").split(". ")[0]
+    type_texts = [
+        event_name_expander(meta.get("eventName", folder)) + src.get("reportName", "")
+        for folder, meta, src in read
+    ]
+    remarks_texts = [meta.get("remarks") or "" for _, meta, _ in read]
+
+    predictions = DISASTER_CLASSIFIER.classify(type_texts) if read else []
+    # Extract disaster-specific params from narrative text
+    extracted = PARAMS_EXTRACTOR.extract_all_many(remarks_texts) if read else []
+
+    events: list[Event] = []
+    for (folder, meta, _), (pred, _), remarks_text, (params, warnings) in zip(
+        read, predictions, remarks_texts, extracted
+    ):
+        events.append(
+            Event(
+                id=_event_id(meta.get("eventName", folder), meta.get("startDate")),
+                eventName=meta.get("eventName", folder),
+                startDate=datetime.fromisoformat(meta["startDate"]) if meta.get("startDate") else None,
+                endDate=datetime.fromisoformat(meta["endDate"]) if meta.get("endDate") else None,
+                remarks=remarks_text or None,
+                hasDisasterType=pred,
+                climateParameters=_climate_parameter_measurements(params),
+                warnings=_warning_entities(warnings),
+            )
+        )
 
     return events
 
@@ -134,7 +155,7 @@ def load_provenance(event_folder_path: str) -> Provenance | None:
     )
 
 def load_aff_pop(event_folder_path: str) -> list[AffectedPopulation] | None:
-    path = os.path.join(event_folder_path, "affected_population.csv")
+    path = table_file(event_folder_path, "affected_population")
     if not os.path.exists(path):
         return None
 
@@ -158,7 +179,7 @@ def load_aff_pop(event_folder_path: str) -> list[AffectedPopulation] | None:
     return df_to_entities(df, AffectedPopulation)
 
 def load_infra(event_folder_path: str) -> list[Infrastructure] | None:
-    path = os.path.join(event_folder_path, "damage_to_infrastructure.csv")
+    path = table_file(event_folder_path, "damage_to_infrastructure")
     if not os.path.exists(path):
         return None
 
@@ -181,7 +202,7 @@ def load_relief(event_folder_path: str) -> list[Assistance] | None:
 
     src_paths: list[str] = []
     for file in os.listdir(event_folder_path):
-        if "assistance_provided" in file and file.endswith(".csv"):
+        if "assistance_provided" in file and is_table_file(file):
             src_paths.append(os.path.join(event_folder_path, file))
     
     if len(src_paths) == 0: return None
@@ -239,7 +260,7 @@ def load_casualties(event_folder_path: str) -> list[Casualties] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "casualties" in f.lower() and f.endswith(".csv")
+            if "casualties" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -284,7 +305,7 @@ def load_casualties(event_folder_path: str) -> list[Casualties] | None:
 
 
 def load_incidents(event_folder_path: str) -> List[Incident] | None:
-    src_path = os.path.join(event_folder_path, "related_incidents.csv")
+    src_path = table_file(event_folder_path, "related_incidents")
     if not os.path.exists(src_path):
         return None
 
@@ -359,7 +380,7 @@ def load_incidents(event_folder_path: str) -> List[Incident] | None:
 
 
 def load_housing(event_folder_path: str) -> List[Housing] | None:
-    src_path = os.path.join(event_folder_path, "damaged_houses.csv")
+    src_path = table_file(event_folder_path, "damaged_houses")
     if not os.path.exists(src_path):
         return None
 
@@ -425,7 +446,7 @@ def load_agri(event_folder_path: str) -> List[Agriculture] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "agriculture" in f.lower() and f.endswith(".csv")
+            if "agriculture" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -474,7 +495,7 @@ def load_agri(event_folder_path: str) -> List[Agriculture] | None:
     return df_to_entities(df, Agriculture)
 
 def load_pevac(event_folder_path: str) -> List[PEvacuation] | None:
-    evac_path = os.path.join(event_folder_path, "pre-emptive_evacuation.csv")
+    evac_path = table_file(event_folder_path, "pre-emptive_evacuation")
     ap_path = os.path.join(event_folder_path, "cleaned_affected_population.csv")
 
     evac_exists = os.path.exists(evac_path)
@@ -578,7 +599,7 @@ def load_rnb(event_folder_path: str) -> List[RNB] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "road" in f.lower() and f.endswith(".csv")
+            if "road" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -622,7 +643,7 @@ def load_power(event_folder_path: str) -> List[Power] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "power" in f.lower() and f.endswith(".csv")
+            if "power" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -666,7 +687,7 @@ def load_comms(event_folder_path: str) -> List[CommunicationLines] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "communication" in f.lower() and f.endswith(".csv")
+            if "communication" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -710,7 +731,7 @@ def load_docalamity(event_folder_path: str) -> List[DOC] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "calamity" in f.lower() and f.endswith(".csv")
+            if "calamity" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -748,7 +769,7 @@ def load_class_suspension(event_folder_path: str) -> List[ClassDisruption] | Non
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "class" in f.lower() and f.endswith(".csv")
+            if "class" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -796,7 +817,7 @@ def load_work_suspension(event_folder_path: str) -> List[WorkDisruption] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "work" in f.lower() and f.endswith(".csv")
+            if "work" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -843,7 +864,7 @@ def load_stranded_events(event_folder_path: str) -> List[Stranded] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "stranded" in f.lower() and f.endswith(".csv")
+            if "stranded" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -878,7 +899,7 @@ def load_water(event_folder_path: str) -> List[WaterDisruption] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "water" in f.lower() and f.endswith(".csv")
+            if "water" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -923,7 +944,7 @@ def load_seaport(event_folder_path: str) -> List[Seaport] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "seaport" in f.lower() and f.endswith(".csv")
+            if "seaport" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -971,7 +992,7 @@ def load_airport(event_folder_path: str) -> List[Airport] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "airport" in f.lower() and f.endswith(".csv")
+            if "airport" in f.lower() and is_table_file(f)
         ),
         None,
     )
@@ -1019,7 +1040,7 @@ def load_flight(event_folder_path: str) -> List[Flight] | None:
         (
             os.path.join(event_folder_path, f)
             for f in os.listdir(event_folder_path)
-            if "flight" in f.lower() and f.endswith(".csv")
+            if "flight" in f.lower() and is_table_file(f)
         ),
         None,
     )